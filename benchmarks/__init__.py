@@ -0,0 +1,6 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT benchmarks, run with: `python -m benchmarks --help`
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT benchmarks runner.
+# @module benchmarks.__main__
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+"""
+Run the benchmarks, eg:
+
+    python -m benchmarks --output before.json
+    ...
+    python -m benchmarks --output after.json --compare before.json
+"""
+
+from __future__ import print_function
+
+import argparse
+import sys
+
+from benchmarks import binding, harness, overhead
+
+SUITES = {
+    'binding': binding.benchmarks,
+    'overhead': overhead.benchmarks,
+}
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('suites', nargs='*', metavar='suite',
+                        help='The suites to run: {s} (default: all of them).'.format(
+                            s=', '.join(sorted(SUITES))))
+    parser.add_argument('-k', '--filter', help='Only run benchmarks matching this regex.')
+    parser.add_argument('-o', '--output', help='Write the results (as JSON) to this file.')
+    parser.add_argument('-c', '--compare', help='Compare the results with this JSON file.')
+    parser.add_argument('-t', '--threshold', type=float, default=0.1,
+                        help='The fraction slower than --compare that is a regression.')
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    parser.add_argument('-n', '--number', type=int,
+                        help='Calls per repeat (default: calibrated to --target seconds).')
+    parser.add_argument('--target', type=float, default=0.1)
+
+    options = parser.parse_args(argv)
+    unknown = sorted(set(options.suites) - set(SUITES))
+
+    if unknown:
+        parser.error('unknown suites: {s}'.format(s=', '.join(unknown)))
+
+    return options
+
+
+def main(argv=None):
+    options = _parse_args(sys.argv[1:] if argv is None else argv)
+    benchmarks = []
+
+    for suite in options.suites or sorted(SUITES):
+        benchmarks.extend(SUITES[suite]())
+
+    results = harness.run(
+        benchmarks,
+        pattern=options.filter,
+        number=options.number,
+        repeat=options.repeat,
+        target=options.target,
+    )
+
+    if options.output:
+        with open(options.output, 'w') as f:
+            harness.save(results, f)
+
+    if options.compare:
+        with open(options.compare) as f:
+            baseline = harness.load(f)
+
+        if harness.compare(baseline, results, threshold=options.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,323 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT per-call allocation profile (Python 3.4+, uses tracemalloc).
+# @module benchmarks.allocations
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+"""
+Profile the heap allocations made by hoft per decorated call, eg:
+
+    python -m benchmarks.allocations --output allocations.json
+    python -m benchmarks.allocations -k passing --max-blocks 0 --max-peak-bytes 0
+
+For each case (see `benchmarks.overhead`):
+
+- live: the bytes and blocks allocated by hoft that are alive when the decorated function is
+  called (eg: the `errors` list and `callargs` dict), by allocation site. Not known (null) when
+  the call fails before the decorated function is called.
+- peak: the most bytes allocated (by anything) at once during the call, above those beforehand,
+  less the same for the undecorated function (ie: the frames and arguments of the call itself).
+- retained: the bytes still allocated after the call (averaged over many calls, ie: leaks).
+
+Exits with 1 when a case exceeds a budget.
+
+The live budget of a passing call is:
+
+- `analyse_sig[compile]`: nothing.
+- `analyse_sig` (and `[fail_fast]`): nothing but what the interpreter allocates to call the
+  decorated function with the wrapper's `*args` and `**kwargs` (eg: the keyword names, on
+  CPython 3.10), ie: what any such wrapper would.
+- `analyse_sig[default]` and `[strict]`: as `analyse_sig`, plus the `callargs` dict the
+  `_default_` handler (or `_strict_`) needs.
+
+Each case is measured after a full collection (which also empties the interpreter's free lists),
+so every object the call makes is counted, rather than some reused from the previous case's.
+"""
+
+from __future__ import print_function
+
+import argparse
+import gc
+import json
+import os
+import re
+import sys
+from collections import namedtuple
+
+import hoft
+from benchmarks.harness import environment
+from benchmarks.overhead import SHAPES, iter_cases, make_function
+
+try:
+    import tracemalloc
+except ImportError:  # Python < 3.4
+    tracemalloc = None
+
+__all__ = [
+    'AllocationResult',
+    'check_budget',
+    'measure',
+    'run',
+]
+
+AllocationResult = namedtuple('AllocationResult', (
+    'name', 'live_bytes', 'live_blocks', 'peak_bytes', 'retained_bytes', 'sites')
+)
+"""
+The allocations of a case's call (see the module docstring).
+
+:param list sites: `(filename:lineno, bytes, blocks)` of the live allocations, largest first.
+"""
+
+_HOFT_FILES = os.path.join(os.path.dirname(os.path.abspath(hoft.__file__)), '*')
+
+
+class _Probe(object):
+    """
+    The body of the profiled function: snapshots the heap when armed.
+    """
+
+    def __init__(self):
+        self.armed = False
+        self.snapshot = None
+
+    def __call__(self):
+        if self.armed:
+            self.armed = False
+            self.snapshot = tracemalloc.take_snapshot()
+
+
+def _reset_peak():
+    if hasattr(tracemalloc, 'reset_peak'):
+        tracemalloc.reset_peak()
+    else:
+        # Python < 3.9: Clearing the traces resets the peak (to what is allocated from now on):
+        tracemalloc.clear_traces()
+
+
+def _live(func, probe, args, kwargs, files):
+    live_only = [tracemalloc.Filter(True, files)]
+
+    before = tracemalloc.take_snapshot().filter_traces(live_only)
+    probe.armed = True
+    func(*args, **kwargs)
+    probe.armed = False
+
+    if probe.snapshot is None:
+        # The call failed before the decorated function was called:
+        return None
+
+    during = probe.snapshot.filter_traces(live_only)
+    probe.snapshot = None
+
+    sites = [
+        ('{f}:{n}'.format(f=stat.traceback[0].filename, n=stat.traceback[0].lineno),
+         stat.size_diff, stat.count_diff)
+        for stat in during.compare_to(before, 'lineno')
+        if stat.size_diff > 0
+    ]
+
+    return sites
+
+
+def _peak(func, args, kwargs):
+    gc.collect()
+    _reset_peak()
+    current, _ = tracemalloc.get_traced_memory()
+    func(*args, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+
+    return max(peak - current, 0)
+
+
+def _retained(func, args, kwargs, number):
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+
+    for _ in range(number):
+        func(*args, **kwargs)
+
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+
+    return max(after - current, 0) / float(number)
+
+
+def _caller(func, failing):
+    if not failing:
+        return func
+
+    def call(*args, **kwargs):
+        try:
+            func(*args, **kwargs)
+        except Exception:  # NOQA
+            pass
+
+    return call
+
+
+def measure(case, number=1000, files=_HOFT_FILES):
+    """
+    Measure the allocations of a case's call.
+
+    :param benchmarks.overhead.Case case:
+        The case.
+    :param int number:
+        The number of calls to average the retained bytes over.
+    :param str files:
+        The filename pattern (see `tracemalloc.Filter`) of the live allocations, hoft's by
+        default.
+    :rtype:
+        AllocationResult
+    """
+    if tracemalloc is None:
+        raise RuntimeError('allocation profiling requires tracemalloc (Python 3.4+)')
+
+    probe = _Probe()
+    undecorated = make_function(case.shape, body='_probe()', namespace={'_probe': probe})
+    func = _caller(case.decorate(undecorated), case.outcome == 'failing')
+
+    # Warm up (eg: caches, and those CPython 3.10 makes for a function after 1024 calls), so only
+    # the steady state is measured:
+    for _ in range(2048):
+        func(*case.args, **case.kwargs)
+        undecorated(*case.args, **case.kwargs)
+
+    # Nor (objects reused from) what the previous case left to be collected:
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        sites = _live(func, probe, case.args, case.kwargs, files)
+        peak_bytes = _peak(func, case.args, case.kwargs)
+        baseline_peak_bytes = _peak(undecorated, case.args, case.kwargs)
+        retained_bytes = _retained(func, case.args, case.kwargs, number)
+    finally:
+        tracemalloc.stop()
+
+    if sites is None:
+        live_bytes = live_blocks = None
+        sites = []
+    else:
+        sites.sort(key=lambda site: -site[1])
+        live_bytes = sum(site[1] for site in sites)
+        live_blocks = sum(site[2] for site in sites)
+
+    return AllocationResult(
+        case.name,
+        live_bytes,
+        live_blocks,
+        max(peak_bytes - baseline_peak_bytes, 0),
+        retained_bytes,
+        sites,
+    )
+
+
+def _optional(value):
+    return '-' if value is None else value
+
+
+def run(shapes=SHAPES, pattern=None, number=1000, output=sys.stderr):
+    """
+    Measure the allocations of every case matching the regular expression `pattern`.
+
+    :rtype:
+        List[AllocationResult]
+    """
+    results = []
+
+    for case in iter_cases(shapes):
+        if pattern and not re.search(pattern, case.name):
+            continue
+
+        result = measure(case, number=number)
+        results.append(result)
+
+        if output is not None:
+            output.write('{n:<50} live {b:>7} B {k:>4} blocks  peak {p:>7} B  retained {r:.1f} B\n'
+                         .format(n=result.name, b=_optional(result.live_bytes),
+                                 k=_optional(result.live_blocks), p=result.peak_bytes,
+                                 r=result.retained_bytes))
+
+    return results
+
+
+def check_budget(results, max_bytes=None, max_blocks=None, max_peak_bytes=None):
+    """
+    Check the results against a budget (limits that are None are not checked).
+
+    :return:
+        A description of each case over budget.
+    :rtype:
+        List[str]
+    """
+    violations = []
+
+    for result in results:
+        for field, limit in (
+            ('live_bytes', max_bytes),
+            ('live_blocks', max_blocks),
+            ('peak_bytes', max_peak_bytes),
+        ):
+            value = getattr(result, field)
+
+            if limit is not None and value is not None and value > limit:
+                violations.append('{n}: {f} {v} > {l} ({s})'.format(
+                    n=result.name, f=field, v=value, l=limit,
+                    s=', '.join('{0} {1} B'.format(*site) for site in result.sites[:3]) or '-'))
+
+    return violations
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.allocations', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-k', '--filter', help='Only profile cases matching this regex.')
+    parser.add_argument('-o', '--output', help='Write the results (as JSON) to this file.')
+    parser.add_argument('-n', '--number', type=int, default=1000,
+                        help='Calls to average the retained bytes over.')
+    parser.add_argument('--max-bytes', type=int, help='Budget of live bytes per call.')
+    parser.add_argument('--max-blocks', type=int, help='Budget of live blocks per call.')
+    parser.add_argument('--max-peak-bytes', type=int, help='Budget of peak bytes per call.')
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = _parse_args(sys.argv[1:] if argv is None else argv)
+
+    if tracemalloc is None:
+        print('allocation profiling requires tracemalloc (Python 3.4+)', file=sys.stderr)
+        return 2
+
+    results = run(pattern=options.filter, number=options.number)
+
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump(
+                {
+                    'environment': environment(),
+                    'results': [result._asdict() for result in results],
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+            f.write('\n')
+
+    violations = check_budget(
+        results,
+        max_bytes=options.max_bytes,
+        max_blocks=options.max_blocks,
+        max_peak_bytes=options.max_peak_bytes,
+    )
+
+    for violation in violations:
+        print('OVER BUDGET: ' + violation, file=sys.stderr)
+
+    return 1 if violations else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT argument binding benchmarks.
+# @module benchmarks.binding
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+"""
+Compare binding a call's arguments with `inspect.getcallargs` and with hoft's `Binder` (building
+the `callargs` mapping, or only checking the arguments bind), for each shape of function.
+"""
+
+from inspect import getcallargs
+
+from benchmarks.harness import Benchmark
+from benchmarks.overhead import SHAPES, iter_cases, make_function
+from hoft.core.binder import make_binder
+from hoft.core.sigs import get_argspec, get_signature_index
+
+
+def _binders(func):
+    """
+    Yield `(binder, bind)` for each way of binding a call, where `bind(args, kwargs)`.
+    """
+    argspec = get_argspec(func)
+    binder = make_binder(func, argspec, get_signature_index(argspec))
+
+    yield 'getcallargs', lambda args, kwargs: getcallargs(func, *args, **kwargs)
+    yield 'binder.callargs', binder.callargs
+    yield 'binder.check', binder.check
+
+
+def benchmarks(shapes=SHAPES):
+    """
+    Build the argument binding benchmarks.
+
+    :rtype:
+        List[Benchmark]
+    """
+    result = []
+
+    for case in iter_cases(shapes):
+        if case.variant != 'undecorated' or case.outcome != 'passing':
+            continue
+
+        func = make_function(case.shape)
+
+        for binder, bind in _binders(func):
+            result.append(Benchmark(
+                'binding/{s}/{b}'.format(s=case.shape.name, b=binder),
+                (lambda bind, args, kwargs: lambda: bind(args, kwargs))(
+                    bind, case.args, case.kwargs),
+                {
+                    'shape': case.shape._asdict(),
+                    'binder': binder,
+                },
+            ))
+
+    return result
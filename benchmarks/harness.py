@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT benchmark harness (timeit based, so it runs offline with no extra dependencies).
+# @module benchmarks.harness
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import json
+import platform
+import re
+import subprocess
+import sys
+import time
+import timeit
+from collections import namedtuple
+
+import hoft
+from hoft.__version__ import __version__
+
+__all__ = [
+    'Benchmark',
+    'Result',
+    'compare',
+    'environment',
+    'load',
+    'run',
+    'save',
+]
+
+Benchmark = namedtuple('Benchmark', ('name', 'func', 'params'))
+"""
+A benchmark.
+
+:param str name: The unique name of the benchmark (results are compared by name).
+:param callable func: The (no argument) callable to time.
+:param dict params: Describes the benchmark (eg: {'decorator': 'analyse_sig', 'params': 5}).
+"""
+
+Result = namedtuple('Result', ('name', 'params', 'number', 'repeat', 'best', 'median', 'mean'))
+"""
+A benchmark's timings (per call, in seconds).
+"""
+
+
+def _median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+
+    if len(values) % 2:
+        return values[middle]
+
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def _calibrate(func, target):
+    # Find the number of calls which take at least `target` seconds:
+    timer = timeit.Timer(func)
+    number = 1
+
+    while True:
+        if timer.timeit(number) >= target:
+            return number
+        number *= 10
+
+
+def measure(benchmark, number=None, repeat=5, target=0.1):
+    """
+    Time a benchmark, `repeat` times of `number` calls (calibrated to take at least `target`
+    seconds, when not supplied).
+
+    :rtype:
+        Result
+    """
+    if number is None:
+        number = _calibrate(benchmark.func, target)
+
+    timings = [
+        timing / number for timing in timeit.Timer(benchmark.func).repeat(repeat, number)
+    ]
+
+    return Result(
+        benchmark.name,
+        benchmark.params,
+        number,
+        repeat,
+        min(timings),
+        _median(timings),
+        sum(timings) / len(timings),
+    )
+
+
+def run(benchmarks, pattern=None, output=sys.stderr, **kwargs):
+    """
+    Measure the benchmarks whose names match the regular expression `pattern`.
+
+    :rtype:
+        List[Result]
+    """
+    results = []
+
+    for benchmark in benchmarks:
+        if pattern and not re.search(pattern, benchmark.name):
+            continue
+
+        result = measure(benchmark, **kwargs)
+        results.append(result)
+
+        if output is not None:
+            output.write('{n:<60} {t:>12.3f} us\n'.format(n=result.name, t=result.best * 1e6))
+
+    return results
+
+
+def _git_revision():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], stderr=subprocess.STDOUT).decode('ascii').strip()
+    except Exception:  # NOQA
+        return None
+
+
+def environment():
+    """
+    Describe where the benchmarks were run (so results are only compared like with like).
+    """
+    return {
+        'hoft': __version__,
+        'hoft_path': hoft.__file__,
+        'revision': _git_revision(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+    }
+
+
+def save(results, f):
+    json.dump(
+        {
+            'environment': environment(),
+            'results': [result._asdict() for result in results],
+        },
+        f,
+        indent=2,
+        sort_keys=True,
+    )
+    f.write('\n')
+
+
+def load(f):
+    """
+    Load results saved with `save`.
+
+    :return:
+        The results by name.
+    :rtype:
+        dict
+    """
+    return {
+        result['name']: Result(**result) for result in json.load(f)['results']
+    }
+
+
+def compare(baseline, results, threshold=0.1, output=sys.stderr):
+    """
+    Compare results with those of a baseline (as returned by `load`), by best time.
+
+    :param float threshold:
+        The fraction a benchmark may be slower by before it is a regression.
+    :return:
+        The names of the regressed benchmarks.
+    :rtype:
+        list
+    """
+    regressions = []
+
+    for result in results:
+        previous = baseline.get(result.name)
+
+        if previous is None:
+            continue
+
+        ratio = result.best / previous.best if previous.best else float('inf')
+        regressed = ratio > 1 + threshold
+
+        if regressed:
+            regressions.append(result.name)
+
+        if output is not None:
+            output.write('{n:<60} {r:>8.2f}x{m}\n'.format(
+                n=result.name, r=ratio, m='  REGRESSION' if regressed else ''))
+
+    return regressions
@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT decorator overhead benchmarks, across signature shapes and options.
+# @module benchmarks.overhead
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+from collections import namedtuple
+
+import six
+
+from benchmarks.harness import Benchmark
+from hoft import IGNORE, NOVALUE, analyse_in, analyse_sig
+
+__all__ = [
+    'Case',
+    'SHAPES',
+    'benchmarks',
+    'iter_cases',
+    'make_function',
+]
+
+Shape = namedtuple('Shape', ('name', 'num_args', 'num_defaults', 'varargs', 'varkw'))
+"""
+The signature of a benchmarked function: `num_args` named arguments (the last `num_defaults` of
+which have defaults) and optionally `*args` and `**kwargs`.
+"""
+
+Case = namedtuple('Case', ('name', 'shape', 'variant', 'outcome', 'decorate', 'args', 'kwargs'))
+"""
+A way of decorating (`decorate(func)`) and calling (`func(*args, **kwargs)`) a function of a shape.
+"""
+
+SHAPES = (
+    Shape('params-0', 0, 0, False, False),
+    Shape('params-5', 5, 2, False, False),
+    Shape('params-50', 50, 25, False, False),
+    Shape('varargs-varkw', 3, 1, True, True),
+)
+
+
+class _Invalid(Exception):
+    pass
+
+
+def _check(name, index, value, default_value=NOVALUE):
+    if value is None:
+        raise _Invalid(name)
+
+
+def _check_default(name, value, argspec):
+    if value is None:
+        raise _Invalid(name)
+
+
+def _check_in_positional(value, index):
+    if value is None:
+        raise _Invalid(index)
+
+
+def _check_in_keyword(value, name, present):
+    if present and value is None:
+        raise _Invalid(name)
+
+
+def make_function(shape, body='return None', namespace=None):
+    """
+    Make an (undecorated) function of the shape, with the given body and globals.
+    """
+    names = ['a{i}'.format(i=i) for i in range(shape.num_args)]
+    first_default = shape.num_args - shape.num_defaults
+    params = names[:first_default] + ['{n}=0'.format(n=n) for n in names[first_default:]]
+
+    if shape.varargs:
+        params.append('*args')
+    if shape.varkw:
+        params.append('**kwargs')
+
+    namespace = dict(namespace or {})
+    six.exec_('def target({p}):\n    {b}\n'.format(p=', '.join(params), b=body), namespace)
+
+    return namespace['target']
+
+
+def _make_call(shape, failing):
+    """
+    The arguments to call a function of the shape with: the required arguments positionally and
+    every other defaulted argument by keyword, or every argument positionally (so some reach
+    `*args`) when there are varargs. When failing, the first argument is invalid.
+    """
+    first_default = shape.num_args if shape.varargs else shape.num_args - shape.num_defaults
+    args = [1] * first_default
+    kwargs = {
+        'a{i}'.format(i=i): 1 for i in range(first_default, shape.num_args, 2)
+    }
+
+    if failing:
+        if args:
+            args[0] = None
+        elif kwargs:
+            kwargs[sorted(kwargs)[0]] = None
+
+    if shape.varargs:
+        args.extend([1, 2])
+    if shape.varkw:
+        kwargs['extra'] = 1
+
+    return tuple(args), kwargs
+
+
+def _sig_parsers(shape, coverage):
+    """
+    Parsers for every named argument (`coverage == 1`), or every other one (`coverage == 2`).
+    """
+    first_default = shape.num_args - shape.num_defaults
+    parse_args = [
+        _check if index % coverage == 0 else IGNORE for index in range(first_default)
+    ]
+    parse_kwargs = {
+        'a{i}'.format(i=index): _check
+        for index in range(first_default, shape.num_args)
+        if index % coverage == 0
+    }
+
+    return parse_args, parse_kwargs
+
+
+def _in_parsers(shape):
+    first_default = shape.num_args - shape.num_defaults
+    parse_args = [_check_in_positional] * first_default
+    parse_kwargs = {
+        'a{i}'.format(i=index): _check_in_keyword
+        for index in range(first_default, shape.num_args)
+    }
+
+    return parse_args, parse_kwargs
+
+
+def _variants(shape):
+    """
+    Yield `(variant, decorate, can_fail)` for each way of decorating a function of the shape.
+    """
+    yield 'undecorated', lambda func: func, False
+
+    parse_args, parse_kwargs = _in_parsers(shape)
+    yield 'analyse_in', analyse_in(*parse_args, **parse_kwargs), True
+
+    parse_args, parse_kwargs = _sig_parsers(shape, 1)
+    yield 'analyse_sig', analyse_sig(*parse_args, **parse_kwargs), True
+    yield 'analyse_sig[fail_fast]', analyse_sig(
+        *parse_args, _fail_fast_=True, _on_error_=lambda exc, errors: None, **parse_kwargs), True
+    yield 'analyse_sig[compile]', analyse_sig(*parse_args, _compile_=True, **parse_kwargs), True
+
+    if not (shape.varargs or shape.varkw):
+        # `*args` and `**kwargs` can only be analysed by a `_default_` handler:
+        yield 'analyse_sig[strict]', analyse_sig(*parse_args, _strict_=True, **parse_kwargs), True
+
+    parse_args, parse_kwargs = _sig_parsers(shape, 2)
+    yield 'analyse_sig[default]', analyse_sig(
+        *parse_args, _default_=_check_default, **parse_kwargs), True
+
+
+def _make_runner(func, args, kwargs, failing):
+    if not failing:
+        return lambda: func(*args, **kwargs)
+
+    def run():
+        try:
+            func(*args, **kwargs)
+        except _Invalid:
+            pass
+
+    return run
+
+
+def iter_cases(shapes=SHAPES):
+    """
+    Yield every `Case` of the shapes: each variant, passing and (where possible) failing.
+    """
+    for shape in shapes:
+        for variant, decorate, can_fail in _variants(shape):
+            for failing in (False, True):
+                args, kwargs = _make_call(shape, failing)
+
+                if failing and not (can_fail and (args or kwargs) and shape.num_args):
+                    continue
+
+                outcome = 'failing' if failing else 'passing'
+
+                yield Case(
+                    '{s}/{v}/{o}'.format(s=shape.name, v=variant, o=outcome),
+                    shape,
+                    variant,
+                    outcome,
+                    decorate,
+                    args,
+                    kwargs,
+                )
+
+
+def benchmarks(shapes=SHAPES):
+    """
+    Build the decorator overhead benchmarks.
+
+    :rtype:
+        List[Benchmark]
+    """
+    functions = {}
+    result = []
+
+    for case in iter_cases(shapes):
+        key = (case.shape, case.variant)
+
+        if key not in functions:
+            functions[key] = case.decorate(make_function(case.shape))
+
+        result.append(Benchmark(
+            'overhead/' + case.name,
+            _make_runner(functions[key], case.args, case.kwargs, case.outcome == 'failing'),
+            {
+                'shape': case.shape._asdict(),
+                'variant': case.variant,
+                'outcome': case.outcome,
+            },
+        ))
+
+    return result
@@ -13,27 +13,81 @@
 # @version 0.1
 # @copyright (c) 2017-present Francis Horsman.
 
+from hoft import spec
+from hoft.core.batch import ErrorBatch, NO_ERRORS, validate_batch, validate_columns
+from hoft.core.binder import get_binding
+from hoft.core.config import Config, configure, get_config
 from hoft.core.decorators import analyse_in, analyse_sig
+from hoft.core.exporters import StatsdExporter, render_prometheus, write_prometheus
+from hoft.core.metrics import (
+    DEFAULT_BUCKETS, HistogramSnapshot, StatsSnapshot, ValidatorSnapshot, get_all_stats,
+    reset_all_stats,
+)
+from hoft.core.observers import Observer, add_observer, remove_observer
+from hoft.core.parallel import ErrorRecord, RemoteError, validate_batch_parallel
+from hoft.core.pure import PureParser, pure
+from hoft.core.sampling import SampleStats, get_sample_stats
 from hoft.core.sigs import (
-    Signature, get_default_value, get_keywords, get_positionals, get_signature,
+    CacheInfo, clear_signature_cache, get_argspec, get_default_value, get_keywords,
+    get_params, get_positionals, get_signature, get_signature_cache_info, get_signature_index,
+    set_signature_cache_size, signature,
 )
 from hoft.core.utils import (
-    ArgsNotAnalysedError, IGNORE, KeywordError, NOVALUE, NoDefaultError, NotAnalysedError,
-    PositionalError,
+    ArgsNotAnalysedError, BindError, IGNORE, KeywordError, NOVALUE, NoDefaultError,
+    NotAnalysedError, ParamTable, PositionalError, Signature, SignatureIndex,
 )
 
 __all__ = [
     'analyse_in',
     'analyse_sig',
+    'configure',
+    'get_config',
+    'Config',
     'IGNORE',
     'NOVALUE',
     'PositionalError',
     'KeywordError',
+    'BindError',
+    'validate_batch',
+    'ErrorBatch',
+    'validate_columns',
+    'validate_batch_parallel',
+    'ErrorRecord',
+    'RemoteError',
+    'pure',
+    'PureParser',
+    'spec',
+    'NO_ERRORS',
+    'get_sample_stats',
+    'get_binding',
+    'SampleStats',
+    'get_all_stats',
+    'reset_all_stats',
+    'StatsSnapshot',
+    'HistogramSnapshot',
+    'ValidatorSnapshot',
+    'DEFAULT_BUCKETS',
+    'Observer',
+    'add_observer',
+    'remove_observer',
+    'render_prometheus',
+    'write_prometheus',
+    'StatsdExporter',
     'get_default_value',
     'get_keywords',
     'get_positionals',
     'get_signature',
+    'get_argspec',
+    'get_params',
+    'ParamTable',
+    'signature',
     'Signature',
+    'get_signature_index',
+    'SignatureIndex',
+    'CacheInfo',
+    'get_signature_cache_info',
+    'clear_signature_cache',
+    'set_signature_cache_size',
     'ArgsNotAnalysedError',
     'NotAnalysedError',
     'NoDefaultError',
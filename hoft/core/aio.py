@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT asyncio support (Python 3.5+ only, imported on demand).
+# @module hoft.core.aio
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import asyncio
+import inspect
+
+from hoft.core.binder import make_bind
+from hoft.core.config import state
+from hoft.core.parsers_sig import iter_sig_checks, order_errors, parse_sig_unanalysed_inputs
+from hoft.core.utils import conditionally_raise_exc, raise_exc
+
+__all__ = [
+    'make_async_wrapper',
+    'resume_parsers',
+]
+
+
+def _close(awaitables):
+    # Avoid 'coroutine was never awaited' warnings for checks that will not be run:
+    for awaitable in awaitables:
+        close = getattr(awaitable, 'close', None)
+
+        if close is not None:
+            close()
+
+
+async def resume_parsers(awaitable, parsers, args, kwargs):
+    """
+    Await a (fused) parser's awaitable, then apply the rest of its parsers in turn, awaiting any
+    awaitable they return (see `hoft.core.fusion.fuse`).
+    """
+    await awaitable
+
+    for parser in parsers:
+        result = parser(*args, **kwargs)
+
+        if inspect.isawaitable(result):
+            await result
+
+
+async def _cancel(tasks):
+    pending = [task for task in tasks if not task.done()]
+
+    for task in pending:
+        task.cancel()
+
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _start_checks(plan, args, kwargs, callargs, errors):
+    """
+    Apply every parser, returning the awaitables returned by (asynchronous) parsers.
+    """
+    pending = []
+
+    try:
+        for order, (invoke, make_error) in enumerate(iter_sig_checks(plan, args, kwargs, callargs)):
+            try:
+                result = invoke()
+            except Exception as exc:
+                errors.append((order, make_error(exc)))
+                conditionally_raise_exc(
+                    exc=exc,
+                    on_error=plan.on_error,
+                    errors=order_errors(errors),
+                    fail_fast=plan.fail_fast,
+                )
+            else:
+                if inspect.isawaitable(result):
+                    pending.append((order, result, make_error))
+    except BaseException:
+        _close(awaitable for _, awaitable, _ in pending)
+        raise
+
+    return pending
+
+
+async def _await_checks(plan, pending, errors):
+    checks = {
+        asyncio.ensure_future(awaitable): (order, make_error)
+        for order, awaitable, make_error in pending
+    }
+    # When fail-fast, each failure is handled as soon as it is known:
+    return_when = asyncio.FIRST_EXCEPTION if plan.fail_fast else asyncio.ALL_COMPLETED
+
+    try:
+        while checks:
+            done, _ = await asyncio.wait(checks, return_when=return_when)
+            # Each exception is retrieved (before any is raised):
+            results = sorted(
+                (checks.pop(task) + (None if task.cancelled() else task.exception(),)
+                 for task in done),
+                key=lambda result: result[0],
+            )
+
+            for order, make_error, exc in results:
+                if exc is None:
+                    continue
+                if not isinstance(exc, Exception):
+                    raise exc
+
+                errors.append((order, make_error(exc)))
+
+                if plan.fail_fast:
+                    # The remaining checks are cancelled when this raises:
+                    conditionally_raise_exc(
+                        exc=exc,
+                        on_error=plan.on_error,
+                        errors=order_errors(errors),
+                        fail_fast=plan.fail_fast,
+                    )
+    finally:
+        await _cancel(checks)
+
+
+async def parse_all_sig_args_async(plan, args, kwargs, callargs):
+    """
+    Analyse a call, as `hoft.core.parsers_sig.parse_all_sig_args`, awaiting (concurrently) any
+    parser that returns an awaitable.
+    """
+    errors = []
+    pending = _start_checks(plan, args, kwargs, callargs, errors)
+
+    if pending:
+        await _await_checks(plan, pending, errors)
+
+    # Merge the errors back into validation order:
+    errors = order_errors(errors)
+
+    if plan.strict:
+        parse_sig_unanalysed_inputs(plan, args, callargs, errors)
+
+    return errors
+
+
+def make_async_wrapper(plan):
+    """
+    Make the (undecorated) wrapper for a coroutine function.
+
+    The call is analysed when the wrapper is awaited. Parsers may be coroutine functions (or return
+    any awaitable), such parsers are awaited concurrently: all of them when fail-slow, until the
+    first failure (when the rest are cancelled) when fail-fast.
+
+    :param CallPlan plan:
+        The decorated coroutine function's call plan.
+    :return:
+        The wrapper.
+    :rtype:
+        Coroutine function
+    """
+    func = plan.func
+    sampler = plan.sampler
+    bind = make_bind(plan)
+
+    async def wrapper(*args, **kwargs):
+        if not state.checks or (sampler is not None and not sampler()):
+            return await func(*args, **kwargs)
+
+        callargs = bind(args, kwargs)
+
+        errors = await parse_all_sig_args_async(plan, args, kwargs, callargs)
+
+        if errors and not plan.fail_fast:
+            # We have errors to raise which have not already been raised.
+            raise_exc(
+                exc=errors[0].error,
+                on_error=plan.on_error,
+                errors=errors,
+                fail_fast=plan.fail_fast,
+                force=True,
+            )
+
+        # Call the wrapped function:
+        return await func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,461 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT batch validation.
+# @module hoft.core.batch
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+from array import array
+
+from hoft.core.binder import BIND_CALLARGS, make_bind
+from hoft.core.errors import make_error
+from hoft.core.parsers_sig import (
+    parse_all_sig_args, parse_sig_remaining_inputs, parse_sig_unanalysed_inputs,
+)
+from hoft.core.utils import (
+    BindError, KeywordError, NO_ERRORS, NOVALUE, NoDefaultError, NotAnalysedError,
+    PositionalError,
+)
+
+__all__ = [
+    'ErrorBatch',
+    'NO_ERRORS',
+    'get_call_plan',
+    'validate_batch',
+    'validate_columns',
+    'validate_rows',
+]
+
+
+_numpy = None
+
+
+def _asarray(values):
+    # numpy is only imported (if installed) once a column is needed as an array:
+    global _numpy
+
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover
+            numpy = False
+
+        _numpy = numpy
+
+    return _numpy.asarray(values) if _numpy is not False else values
+
+
+def get_call_plan(func):
+    """
+    Get the call plan of a function decorated with `analyse_sig`.
+
+    :param callable func:
+        The decorated function.
+    :return:
+        The call plan.
+    :rtype:
+        hoft.core.plan.CallPlan
+    :raises:
+        TypeError When the function is not decorated with `analyse_sig`.
+    """
+    try:
+        return func.__hoft__
+    except AttributeError:
+        raise TypeError('{f!r} is not decorated with analyse_sig'.format(f=func))
+
+
+class ErrorBatch(object):
+    """
+    The errors of many calls, stored column-wise: each column is a list (or an array) with an
+    item per error, rather than a record (and its exception, parser...) per error.
+
+    Records (eg: `PositionalError`) are only made when an error is accessed (eg: `batch[0]`), and
+    are not kept.
+    """
+
+    _TYPES = (PositionalError, KeywordError, NotAnalysedError, BindError)
+
+    def __init__(self):
+        self.rows = array('l')
+        self.types = array('B')
+        self.errors = []
+        self.names = []
+        self.indexes = []
+        self.values = []
+        self._extras = []
+        self._funcs = []
+
+    @classmethod
+    def from_results(cls, results):
+        """
+        Make a batch from the errors for each row, as returned by `validate_batch`.
+        """
+        batch = cls()
+
+        for row, errors in enumerate(results):
+            batch.extend(row, errors)
+
+        return batch
+
+    def append(self, row, error):
+        """
+        Add an error (record) of a row.
+        """
+        if isinstance(error, PositionalError):
+            type_, index, value, extra, func = 0, error.index, error.value, None, error.func
+        elif isinstance(error, KeywordError):
+            type_, index, value, extra, func = 1, None, error.value, error.default_value, \
+                error.func
+        elif isinstance(error, NotAnalysedError):
+            # `_argspec` is only kept when given (rather than looked up from `func`):
+            type_, index, value, extra, func = 2, None, error.callargs, error._argspec, error.func
+        else:
+            type_, index, value, extra, func = 3, None, error.args, error.kwargs, None
+
+        self.rows.append(row)
+        self.types.append(type_)
+        self.errors.append(error.error)
+        self.names.append(getattr(error, 'name', None))
+        self.indexes.append(index)
+        self.values.append(value)
+        self._extras.append(extra)
+        self._funcs.append(func)
+
+    def extend(self, row, errors):
+        """
+        Add the errors (records) of a row.
+        """
+        for error in errors:
+            self.append(row, error)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, position):
+        """
+        Make the error record at a position.
+
+        :rtype:
+            Union[PositionalError|KeywordError|NotAnalysedError|BindError]
+        """
+        type_ = self.types[position]
+        error = self.errors[position]
+        value = self.values[position]
+        extra = self._extras[position]
+
+        if type_ == 0:
+            return PositionalError(
+                error, self.names[position], self.indexes[position], value, None,
+                self._funcs[position])
+        if type_ == 1:
+            return KeywordError(error, self.names[position], value, extra, None,
+                                self._funcs[position])
+        if type_ == 2:
+            return NotAnalysedError(error, self.names[position], extra, value,
+                                    self._funcs[position])
+
+        return BindError(error, value, extra)
+
+    def __iter__(self):
+        return (self[position] for position in range(len(self)))
+
+    def failing_rows(self):
+        """
+        :return:
+            The rows with errors, in row order.
+        :rtype:
+            List[int]
+        """
+        return sorted(set(self.rows))
+
+    def for_row(self, row):
+        """
+        :return:
+            The error records of a row (as `validate_batch` would return for the row).
+        :rtype:
+            List
+        """
+        return [self[position] for position, value in enumerate(self.rows) if value == row]
+
+    def count_by_type(self):
+        """
+        :return:
+            The error record type names (eg: 'PositionalError') and the number of them.
+        :rtype:
+            dict
+        """
+        counts = [0] * len(self._TYPES)
+
+        for type_ in self.types:
+            counts[type_] += 1
+
+        return {
+            record_type.__name__: count
+            for record_type, count in zip(self._TYPES, counts)
+            if count
+        }
+
+    def to_results(self, num_rows):
+        """
+        :return:
+            The errors for each of `num_rows` rows, as returned by `validate_batch`.
+        :rtype:
+            List[Union[List|tuple]]
+        """
+        results = [NO_ERRORS] * num_rows
+
+        for position, row in enumerate(self.rows):
+            if results[row] is NO_ERRORS:
+                results[row] = []
+            results[row].append(self[position])
+
+        return results
+
+
+def validate_rows(plan, rows, batch=None):
+    """
+    Validate many calls against a call plan (see `validate_batch`).
+
+    :param CallPlan plan:
+        The call plan.
+    :param rows:
+        An iterable of `(args, kwargs)`.
+    :param ErrorBatch batch:
+        When given, the errors are added to it (rather than returned for each row).
+    :return:
+        The errors for each row (in row order), or the batch.
+    :rtype:
+        Union[List[Union[List|tuple]]|ErrorBatch]
+    """
+    # Every error is collected, nothing is raised and no handler is called:
+    plan = plan._replace(on_error=None, fail_fast=False, lazy_errors=False)
+    bind = make_bind(plan, check=True)
+    results = []
+
+    for row, (args, kwargs) in enumerate(rows):
+        kwargs = kwargs or {}
+
+        try:
+            callargs = bind(args, kwargs)
+        except TypeError as exc:
+            errors = [BindError(exc, args, kwargs)]
+        else:
+            errors = parse_all_sig_args(plan, args, kwargs, callargs)
+
+        if batch is None:
+            results.append(errors)
+        elif errors:
+            batch.extend(row, errors)
+
+    return results if batch is None else batch
+
+
+def validate_batch(func, rows, columnar=False):
+    """
+    Validate many calls to a function decorated with `analyse_sig`, without calling it.
+
+    Each row is validated fail-slow (regardless of `_fail_fast_`) and `_on_error_` is not called,
+    the errors are returned instead.
+
+    :param callable func:
+        The decorated function.
+    :param rows:
+        An iterable of `(args, kwargs)`, as would be passed to `func(*args, **kwargs)`.
+    :param bool columnar:
+        True: Return the errors of every row as one `ErrorBatch`, which is far smaller than a
+        record per error when there are many.
+    :return:
+        The errors for each row (in row order): `PositionalError`s, `KeywordError`s and
+        `NotAnalysedError`s as would be found in `exc._errors_`, or a `BindError` when the row's
+        arguments do not match the function's signature. Rows that pass are given `NO_ERRORS`
+        (an empty tuple).
+    :rtype:
+        Union[List[Union[List|tuple]]|ErrorBatch]
+    :raises:
+        TypeError When the function is not decorated with `analyse_sig`.
+
+    Example:
+
+    >>> errors = hoft.validate_batch(my_decorated_func, [((1, 2), {'c': 3}), ((4, 5), {})])
+    """
+    return validate_rows(get_call_plan(func), rows, batch=ErrorBatch() if columnar else None)
+
+
+class _Columns(object):
+    """
+    The columns of a columnar batch, and how each row is bound to the decorated function.
+    """
+
+    def __init__(self, plan, columns):
+        self.values = dict(columns)
+        self.num_rows = _num_rows(self.values)
+        self._arrays = {}
+
+        # The leading run of arguments without defaults are passed positionally, the rest by
+        # keyword (ie: `func(a, b, c=1)`):
+        names = plan.sig_index.args
+        num_args = 0
+
+        while num_args < len(names) and names[num_args] in self.values and \
+                not plan.sig_index.has_defaults & (1 << num_args):
+            num_args += 1
+
+        self.positional_names = names[:num_args]
+        self.keyword_names = [name for name in self.values if name not in self.positional_names]
+
+    def array(self, name):
+        # Columns handed to `validate_column` are ndarrays (when numpy is available):
+        try:
+            return self._arrays[name]
+        except KeyError:
+            values = self.values[name]
+            array = self._arrays[name] = _asarray(values)
+            return array
+
+    def row(self, row):
+        args = tuple(self.values[name][row] for name in self.positional_names)
+        kwargs = {name: self.values[name][row] for name in self.keyword_names}
+        return args, kwargs
+
+
+def _num_rows(columns):
+    lengths = set(len(values) for values in columns.values())
+
+    if len(lengths) > 1:
+        raise ValueError('columns must all be of the same length: {n}'.format(n=sorted(lengths)))
+
+    return lengths.pop() if lengths else 0
+
+
+def _failing_rows(custom_parser_func, name, index, column):
+    failing = custom_parser_func.validate_column(name, index, column)
+
+    # Either a boolean mask (an array, or a sequence of bools) or the row indexes:
+    if getattr(getattr(failing, 'dtype', None), 'kind', None) == 'b':
+        failing = failing.nonzero()[0]
+    else:
+        failing = list(failing)
+
+        if failing and all(isinstance(row, bool) for row in failing):
+            failing = [row for row, bad in enumerate(failing) if bad]
+
+    return sorted(int(row) for row in failing)
+
+
+def _validate_column(custom_parser_func, name, index, column, rows, call):
+    """
+    Call `call(row)` for the rows that (may) fail, returning the rows and exceptions that did.
+    """
+    if hasattr(custom_parser_func, 'validate_column'):
+        rows = _failing_rows(custom_parser_func, name, index, column)
+
+    for row in rows:
+        try:
+            call(row)
+        except Exception as exc:
+            yield row, exc
+
+
+def _validate_positional_columns(plan, columns, results):
+    rows = range(columns.num_rows)
+
+    for slot in plan.positionals:
+        if slot.index >= len(columns.positional_names):
+            break
+
+        values = columns.values[slot.name]
+
+        def call(row, slot=slot, values=values):
+            slot.func(slot.name, slot.index, values[row])
+
+        for row, exc in _validate_column(
+                slot.func, slot.name, slot.index, columns.array(slot.name), rows, call):
+            results[row].append(make_error(plan, slot, values[row], exc))
+
+
+def _validate_keyword_columns(plan, columns, results):
+    num_args = len(columns.positional_names)
+    rows = range(columns.num_rows)
+
+    for slot in plan.keywords:
+        if slot.shadow is not None and slot.shadow < num_args:
+            continue
+
+        if slot.index is None:
+            raise NoDefaultError(slot.name, plan.argspec)
+
+        if slot.name in columns.keyword_names:
+            values = columns.values[slot.name]
+            column = columns.array(slot.name)
+            custom_parser_func = slot.func
+        else:
+            # Not passed, so there is no column to validate (at once):
+            values = [NOVALUE] * columns.num_rows
+            column = custom_parser_func = None
+
+        def call(row, slot=slot, values=values):
+            slot.func(slot.name, slot.index, values[row], default_value=slot.default_value)
+
+        failures = _validate_column(custom_parser_func, slot.name, slot.index, column, rows, call)
+
+        for row, exc in failures:
+            results[row].append(make_error(plan, slot, values[row], exc))
+
+
+def validate_columns(func, columns):
+    """
+    Validate many calls to a function decorated with `analyse_sig`, given column-wise (without
+    calling it).
+
+    Row `n` is the call made with the `n`th value of each column: columns for the function's
+    leading arguments without default values are passed positionally, any others by keyword.
+
+    A parser may implement `validate_column(name, index, column)` to validate a whole column at
+    once: `column` is a `numpy.ndarray` (when numpy is installed, otherwise the column as given)
+    and it returns the failing row indexes (or a boolean mask of them, as an array or a sequence of
+    bools). The parser is then called as usual for just those rows to obtain each error. Parsers
+    without `validate_column` are called for every row.
+
+    :param callable func:
+        The decorated function.
+    :param dict columns:
+        The argument names and their associated column of values (all of the same length).
+    :return:
+        The errors for each row (in row order), as returned by `validate_batch`.
+    :rtype:
+        List[Union[List|tuple]]
+    :raises:
+        TypeError When the function is not decorated with `analyse_sig`.
+        ValueError When the columns are not all of the same length.
+    """
+    plan = get_call_plan(func)._replace(on_error=None, fail_fast=False, lazy_errors=False)
+    columns = _Columns(plan, columns)
+
+    if not columns.num_rows:
+        return []
+
+    # Binding depends only on which columns are supplied, so check it once:
+    args, kwargs = columns.row(0)
+
+    try:
+        plan.binder.check(args, kwargs)
+    except TypeError as exc:
+        return [[BindError(exc, *columns.row(row))] for row in range(columns.num_rows)]
+
+    results = [[] for _ in range(columns.num_rows)]
+
+    _validate_positional_columns(plan, columns, results)
+    _validate_keyword_columns(plan, columns, results)
+
+    if plan.binding == BIND_CALLARGS:
+        for row, errors in enumerate(results):
+            args, kwargs = columns.row(row)
+            callargs = plan.binder.callargs(args, kwargs)
+
+            if plan.remaining:
+                parse_sig_remaining_inputs(plan, args, callargs, errors)
+            if plan.strict:
+                parse_sig_unanalysed_inputs(plan, args, callargs, errors)
+
+    return [errors or NO_ERRORS for errors in results]
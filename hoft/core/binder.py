@@ -0,0 +1,320 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT argument binding.
+# @module hoft.core.binder
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+from inspect import getcallargs
+
+import six
+
+__all__ = [
+    'BIND_ARGS',
+    'BIND_CALLARGS',
+    'BIND_KWARGS',
+    'BINDINGS',
+    'Binder',
+    'choose_binding',
+    'get_binding',
+    'make_bind',
+    'make_binder',
+]
+
+BIND_ARGS = 'args'
+"""
+Only the positional arguments are analysed: calls are not bound.
+"""
+
+BIND_KWARGS = 'kwargs'
+"""
+Only the positional arguments and the keyword arguments passed are analysed: calls are not bound.
+"""
+
+BIND_CALLARGS = 'callargs'
+"""
+Every argument is analysed (by `_default_`, or reported by `_strict_`): calls are bound to the
+mapping of every argument (see `Binder.callargs`). The slow path.
+"""
+
+BINDINGS = (BIND_ARGS, BIND_KWARGS, BIND_CALLARGS)
+
+_UNBOUND = object()
+
+
+def _plural(count, noun):
+    return '{c} {n}{s}'.format(c=count, n=noun, s='' if count == 1 else 's')
+
+
+def _quoted_list(names):
+    quoted = ["'{n}'".format(n=name) for name in names]
+
+    if len(quoted) == 1:
+        return quoted[0]
+
+    return '{a} and {b}'.format(a=', '.join(quoted[:-1]), b=quoted[-1])
+
+
+class Binder(object):
+    """
+    Binds a call's arguments to a function's parameters (as `inspect.getcallargs`), from tables
+    worked out once (when decorating).
+
+    Bad calls raise a `TypeError`, as calling the function would. Its message reads as CPython's,
+    but is not guaranteed to match it (nor to report the same problem first when a call has
+    several, eg: too many positional arguments and an unexpected keyword): only the exception
+    type is.
+    """
+
+    __slots__ = (
+        'func_name', 'names', 'num_args', 'num_posonly', 'positions', 'defaults', 'varargs',
+        'keywords',
+    )
+
+    def __init__(self, func_name, argspec, sig_index):
+        self.func_name = func_name
+        # The positional arguments, then the keyword-only arguments:
+        self.names = tuple(sig_index.args) + tuple(getattr(argspec, 'kwonlyargs', None) or ())
+        self.num_args = len(sig_index.args)
+        self.num_posonly = len(getattr(argspec, 'posonlyargs', None) or ())
+        self.positions = sig_index.positions
+        self.defaults = tuple(sig_index.defaults.get(name, _UNBOUND) for name in self.names)
+        self.varargs = argspec.varargs
+        self.keywords = argspec.keywords
+
+    def _too_many(self, num_given):
+        num_args = self.num_args
+        num_required = self.defaults[:num_args].count(_UNBOUND)
+
+        if num_required == num_args:
+            takes = num_args
+        else:
+            takes = 'from {r} to {n}'.format(r=num_required, n=num_args)
+
+        return TypeError('{f}() takes {t} positional argument{s} but {g} {w} given'.format(
+            f=self.func_name, t=takes, s='' if takes == 1 else 's', g=num_given,
+            w='was' if num_given == 1 else 'were'))
+
+    def _bind_keywords(self, values, num_given, kwargs):
+        extra_kwargs = {} if self.keywords else None
+        positions = self.positions
+
+        for name, value in six.iteritems(kwargs):
+            position = positions.get(name)
+
+            if position is None or position < self.num_posonly:
+                if extra_kwargs is None:
+                    if position is not None:
+                        raise TypeError(
+                            '{f}() got some positional-only arguments passed as keyword '
+                            "arguments: '{n}'".format(f=self.func_name, n=name))
+                    raise TypeError("{f}() got an unexpected keyword argument '{n}'".format(
+                        f=self.func_name, n=name))
+                extra_kwargs[name] = value
+            elif position < num_given:
+                raise TypeError("{f}() got multiple values for argument '{n}'".format(
+                    f=self.func_name, n=name))
+            else:
+                values[position] = value
+
+        return extra_kwargs
+
+    def _bind_defaults(self, values, num_given):
+        missing = None
+
+        for position in range(num_given, len(values)):
+            if values[position] is _UNBOUND:
+                default_value = self.defaults[position]
+
+                if default_value is _UNBOUND:
+                    if missing is None:
+                        missing = []
+                    missing.append(position)
+                else:
+                    values[position] = default_value
+
+        if missing:
+            num_args = self.num_args
+
+            # As Python, missing positional arguments are reported first:
+            for kind, names in (
+                ('positional', [self.names[p] for p in missing if p < num_args]),
+                ('keyword-only', [self.names[p] for p in missing if p >= num_args]),
+            ):
+                if names:
+                    raise TypeError('{f}() missing {m}: {n}'.format(
+                        f=self.func_name, m=_plural(len(names), 'required ' + kind + ' argument'),
+                        n=_quoted_list(names)))
+
+    def values(self, args, kwargs):
+        """
+        Bind a call's arguments.
+
+        :return:
+            The value of each named parameter (the positional parameters, then the keyword-only
+            parameters, each in declaration order), the extra positional
+            arguments (for `*args`) and the extra keyword arguments (for `**kwargs`, None when
+            the function has no `**kwargs`).
+        :rtype:
+            tuple
+        :raises:
+            TypeError When the arguments do not match the function's signature.
+        """
+        num_args = self.num_args
+        num_names = len(self.names)
+        num_given = len(args)
+
+        if num_given > num_args:
+            if self.varargs is None:
+                raise self._too_many(num_given)
+
+            values = list(args[:num_args])
+            extra_args = tuple(args[num_args:])
+            num_given = num_args
+        else:
+            values = list(args)
+            extra_args = ()
+
+        values.extend([_UNBOUND] * (num_names - num_given))
+        extra_kwargs = self._bind_keywords(values, num_given, kwargs) if kwargs else None
+
+        if extra_kwargs is None and self.keywords:
+            extra_kwargs = {}
+
+        if num_given < num_names:
+            self._bind_defaults(values, num_given)
+
+        return values, extra_args, extra_kwargs
+
+    def check(self, args, kwargs):
+        """
+        Check a call's arguments bind (without building the mapping of `callargs`).
+
+        :raises:
+            TypeError When the arguments do not match the function's signature.
+        """
+        self.values(args, kwargs)
+
+    def callargs(self, args, kwargs):
+        """
+        Bind a call's arguments, as `inspect.getcallargs(func, *args, **kwargs)`.
+
+        :rtype:
+            dict
+        :raises:
+            TypeError When the arguments do not match the function's signature.
+        """
+        values, extra_args, extra_kwargs = self.values(args, kwargs)
+        callargs = dict(zip(self.names, values))
+
+        if self.varargs:
+            callargs[self.varargs] = extra_args
+        if self.keywords:
+            callargs[self.keywords] = extra_kwargs
+
+        return callargs
+
+
+class _InspectBinder(object):
+    """
+    Binds with `inspect.getcallargs`, for signatures `Binder` does not handle (eg: nested
+    arguments).
+    """
+
+    __slots__ = ('func',)
+
+    def __init__(self, func):
+        self.func = func
+
+    def check(self, args, kwargs):
+        getcallargs(self.func, *args, **kwargs)
+
+    def callargs(self, args, kwargs):
+        return getcallargs(self.func, *args, **kwargs)
+
+
+def make_binder(func, argspec, sig_index):
+    """
+    Make the binder of a function's calls.
+
+    :rtype:
+        Binder
+    """
+    if not all(isinstance(name, six.string_types) for name in sig_index.args):
+        # Nested (unpacked) arguments:
+        return _InspectBinder(func)
+
+    return Binder(getattr(func, '__name__', 'function'), argspec, sig_index)
+
+
+def choose_binding(keywords, remaining, unanalysed, strict):
+    """
+    Choose the cheapest way to bind calls, from what the plan's parsers and options need.
+
+    :param tuple keywords:
+        The plan's `KeywordSlot`s.
+    :param tuple remaining:
+        The plan's `RemainingSlot`s (for the `_default_` handler).
+    :param tuple unanalysed:
+        The plan's `RemainingSlot`s (reported when `_strict_`).
+    :param bool strict:
+        The `_strict_` option.
+    :return:
+        `BIND_CALLARGS`, `BIND_KWARGS` or `BIND_ARGS`.
+    :rtype:
+        str
+    """
+    if remaining or (strict and unanalysed):
+        return BIND_CALLARGS
+    if keywords:
+        return BIND_KWARGS
+
+    return BIND_ARGS
+
+
+def _unbound(args, kwargs):
+    return None
+
+
+def make_bind(plan, check=False):
+    """
+    Get the cheapest way to bind calls for a plan: `bind(args, kwargs)` returns the `callargs`,
+    which are only built for `BIND_CALLARGS` (and are None otherwise).
+
+    Otherwise, calls are not bound at all: a bad call raises its `TypeError` when the decorated
+    function is called (ie: once analysed).
+
+    :param CallPlan plan:
+        The decorated function's call plan.
+    :param bool check:
+        True: Always check the arguments bind (raising a `TypeError` before analysis).
+    :rtype:
+        callable
+    """
+    if plan.binding == BIND_CALLARGS:
+        return plan.binder.callargs
+    if check:
+        return plan.binder.check
+
+    return _unbound
+
+
+def get_binding(func):
+    """
+    Get how calls to a function decorated with `analyse_sig` are bound, eg: to find the
+    functions on the slow path (`BIND_CALLARGS`). A compiled wrapper (see the `_compile_` option)
+    has Python bind its calls, whichever the binding.
+
+    :param callable func:
+        The decorated function.
+    :return:
+        One of `BINDINGS`.
+    :rtype:
+        str
+    :raises:
+        TypeError When the function is not decorated with `analyse_sig`.
+    """
+    from hoft.core.batch import get_call_plan
+
+    return get_call_plan(func).binding
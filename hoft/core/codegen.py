@@ -0,0 +1,456 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT compiled wrappers.
+# @module hoft.core.codegen
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import keyword
+import linecache
+import re
+from timeit import default_timer
+
+import six
+
+from hoft.core.config import state
+from hoft.core.errors import LazyErrors
+from hoft.core.observers import get_observers, notify_call_end, notify_call_start
+from hoft.core.parsers_sig import _report
+from hoft.core.utils import (
+    ArgsNotAnalysedError, NOVALUE, NoDefaultError, NotAnalysedError, conditionally_raise_exc,
+    raise_exc,
+)
+
+__all__ = [
+    'compile_wrapper',
+]
+
+_PREFIX = '_hoft_'
+_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+def _report_unanalysed(plan, errors, names, callargs):
+    if errors is None:
+        errors = LazyErrors(plan) if plan.lazy_errors else []
+
+    try:
+        raise ArgsNotAnalysedError(names)
+    except ArgsNotAnalysedError as exc:
+        errors.append(NotAnalysedError(exc, names, None, callargs, plan.func))
+        conditionally_raise_exc(
+            exc=exc,
+            on_error=plan.on_error,
+            errors=errors,
+        )
+
+    return errors
+
+
+def _raise_errors(plan, errors):
+    # We have errors to raise which have not already been raised.
+    raise_exc(
+        exc=errors[0].error,
+        on_error=plan.on_error,
+        errors=errors,
+        fail_fast=plan.fail_fast,
+        force=True,
+    )
+
+
+def _call_arguments(num_args, names, values, varargs, varkw):
+    """
+    The arguments of a call, for the observers, as far as they can be told from the wrapper's
+    (natively bound) parameters: the first arguments given are positionals, the others keywords.
+    """
+    args = []
+    kwargs = {}
+
+    for index, (name, value) in enumerate(zip(names, values)):
+        if value is NOVALUE:
+            continue
+        if index == len(args) and index < num_args:
+            args.append(value)
+        else:
+            kwargs[name] = value
+
+    args.extend(varargs)
+    kwargs.update(varkw)
+
+    return tuple(args), kwargs
+
+
+class _Source(object):
+    """
+    Accumulates the lines of the generated source.
+    """
+
+    def __init__(self):
+        self.lines = []
+        self.depth = 0
+
+    def line(self, text, *args, **kwargs):
+        self.lines.append('    ' * self.depth + text.format(*args, **kwargs))
+
+    def indent(self):
+        self.depth += 1
+
+    def dedent(self):
+        self.depth -= 1
+
+    def __str__(self):
+        return '\n'.join(self.lines) + '\n'
+
+
+def _check_names(argspec):
+    names = list(argspec.args)
+    names.extend(getattr(argspec, 'kwonlyargs', None) or ())
+    names.extend(name for name in (argspec.varargs, argspec.keywords) if name)
+
+    for name in names:
+        if not isinstance(name, six.string_types):
+            raise ValueError('unable to compile a wrapper for unpacked argument: {n}'.format(
+                n=name))
+        if name.startswith(_PREFIX):
+            raise ValueError('unable to compile a wrapper for reserved argument: {n}'.format(
+                n=name))
+
+    return names
+
+
+def _given(index):
+    return '{p}given_{i}'.format(p=_PREFIX, i=index)
+
+
+def _emit_try(src, call, slot, value):
+    # The error record is made (from the plan's slot) by `_report`:
+    src.line('try:')
+    src.indent()
+    src.line(call)
+    src.dedent()
+    src.line('except Exception as {p}exc:', p=_PREFIX)
+    src.indent()
+    src.line('{p}errors = {p}report({p}plan, {p}errors, {p}exc, {s}, {v})', p=_PREFIX, s=slot,
+             v=value)
+    src.dedent()
+
+
+def _emit_positionals(src, plan, namespace, optional):
+    for slot in plan.positionals:
+        func = '{p}pf_{i}'.format(p=_PREFIX, i=slot.index)
+        slot_name = '{p}ps_{i}'.format(p=_PREFIX, i=slot.index)
+        namespace[func] = slot.func
+        namespace[slot_name] = slot
+
+        if slot.index in optional:
+            src.line('if {g}:', g=_given(slot.index))
+            src.indent()
+
+        _emit_try(
+            src,
+            '{f}({n!r}, {i}, {v})'.format(f=func, n=slot.name, i=slot.index, v=slot.name),
+            slot_name,
+            slot.name,
+        )
+
+        if slot.index in optional:
+            src.dedent()
+
+
+def _emit_keywords(src, plan, namespace, optional):
+    for index, slot in enumerate(plan.keywords):
+        if slot.shadow is not None:
+            if slot.shadow not in optional:
+                # The positional parser is always applied:
+                continue
+            src.line('if not {g}:', g=_given(slot.shadow))
+            src.indent()
+
+        if slot.index is None:
+            src.line('raise {p}NoDefaultError({n!r}, {p}plan.argspec)', p=_PREFIX, n=slot.name)
+        else:
+            func = '{p}kf_{i}'.format(p=_PREFIX, i=index)
+            slot_name = '{p}ks_{i}'.format(p=_PREFIX, i=index)
+            default_value = '{p}kd_{i}'.format(p=_PREFIX, i=index)
+            namespace[func] = slot.func
+            namespace[slot_name] = slot
+            namespace[default_value] = slot.default_value
+            _emit_try(
+                src,
+                '{f}({n!r}, {i}, {v}, default_value={d})'.format(
+                    f=func, n=slot.name, i=slot.index, v=slot.name, d=default_value),
+                slot_name,
+                slot.name,
+            )
+
+        if slot.shadow is not None:
+            src.dedent()
+
+
+def _emit_remaining(src, plan, namespace, optional):
+    func = '{p}default'.format(p=_PREFIX)
+    namespace[func] = plan.default
+
+    for index, slot in enumerate(plan.remaining):
+        if slot.shadow is not None:
+            if slot.shadow not in optional:
+                continue
+            src.line('if not {g}:', g=_given(slot.shadow))
+            src.indent()
+
+        slot_name = '{p}rs_{i}'.format(p=_PREFIX, i=index)
+        namespace[slot_name] = slot
+
+        _emit_try(
+            src,
+            '{f}({n!r}, {v}, {p}plan.argspec)'.format(f=func, n=slot.name, v=slot.name, p=_PREFIX),
+            slot_name,
+            slot.name,
+        )
+
+        if slot.shadow is not None:
+            src.dedent()
+
+
+def _emit_unanalysed(src, plan, optional, names):
+    candidates = []
+
+    for slot in plan.unanalysed:
+        if slot.shadow is None:
+            candidates.append((slot.name, 'False'))
+        elif slot.shadow in optional:
+            candidates.append((slot.name, _given(slot.shadow)))
+
+    if not candidates:
+        return
+
+    # Nothing is allocated unless an argument was not analysed:
+    src.line('if not ({h}):', h=' and '.join(handled for _, handled in candidates))
+    src.indent()
+    src.line(
+        '{p}names = [{p}n for {p}n, {p}h in ({c},) if not {p}h]',
+        p=_PREFIX,
+        c=', '.join('({n!r}, {h})'.format(n=name, h=handled) for name, handled in candidates),
+    )
+    src.line(
+        '{p}errors = {p}report_unanalysed({p}plan, {p}errors, {p}names, {{{c}}})',
+        p=_PREFIX,
+        c=', '.join('{n!r}: {n}'.format(n=name) for name in names),
+    )
+    src.dedent()
+
+
+def _emit_defaults(src, named, defaults, namespace, optional):
+    # Resolve omitted arguments to their real default values:
+    for index in sorted(optional):
+        default_value = '{p}d_{i}'.format(p=_PREFIX, i=index)
+        namespace[default_value] = defaults[named[index]]
+        src.line('if not {g}:', g=_given(index))
+        src.indent()
+        src.line('{n} = {d}', n=named[index], d=default_value)
+        src.dedent()
+
+
+def _make_params(argspec, defaults):
+    """
+    The generated wrapper's parameters (every default is `NOVALUE`, so omitted arguments are
+    known) and the arguments it calls the decorated function with.
+    """
+    kwonlyargs = getattr(argspec, 'kwonlyargs', None) or ()
+    num_posonly = len(getattr(argspec, 'posonlyargs', None) or ())
+
+    def param(name):
+        if name in defaults:
+            return '{n}={p}NOVALUE'.format(n=name, p=_PREFIX)
+        return name
+
+    params = [param(name) for name in argspec.args]
+    call = list(argspec.args)
+
+    if num_posonly:
+        params.insert(num_posonly, '/')
+    if argspec.varargs:
+        params.append('*' + argspec.varargs)
+        call.append('*' + argspec.varargs)
+    elif kwonlyargs:
+        params.append('*')
+
+    params.extend(param(name) for name in kwonlyargs)
+    call.extend('{n}={n}'.format(n=name) for name in kwonlyargs)
+
+    if argspec.keywords:
+        params.append('**' + argspec.keywords)
+        call.append('**' + argspec.keywords)
+
+    return params, call
+
+
+def _emit_checks(src, plan, namespace, named, defaults, optional, names):
+    _emit_positionals(src, plan, namespace, optional)
+    _emit_keywords(src, plan, namespace, optional)
+    _emit_defaults(src, named, defaults, namespace, optional)
+
+    if plan.remaining:
+        _emit_remaining(src, plan, namespace, optional)
+
+    if plan.strict:
+        _emit_unanalysed(src, plan, optional, names)
+
+
+def _emit_observed_checks(src, plan, namespace, named, defaults, optional, names):
+    # As `_emit_checks`, notifying the observers of the call:
+    argspec = plan.argspec
+    func = plan.func
+    namespace[_PREFIX + 'name'] = '{m}.{n}'.format(m=func.__module__, n=func.__name__)
+
+    src.line('{p}observers = {p}get_observers()', p=_PREFIX)
+    src.line(
+        '{p}args, {p}kwargs = {p}call_arguments({n}, {a!r}, {v}, {va}, {vk})',
+        p=_PREFIX,
+        n=len(argspec.args),
+        a=tuple(named),
+        v='({v},)'.format(v=', '.join(named)) if named else '()',
+        va=argspec.varargs or '()',
+        vk=argspec.keywords or '{}',
+    )
+    src.line('{p}notify_call_start({p}observers, {p}name, {p}args, {p}kwargs)', p=_PREFIX)
+    src.line('{p}start = {p}timer()', p=_PREFIX)
+    # Only created when there is an error:
+    src.line('{p}errors = None', p=_PREFIX)
+    src.line('try:')
+    src.indent()
+    num_lines = len(src.lines)
+    _emit_checks(src, plan, namespace, named, defaults, optional, names)
+    if len(src.lines) == num_lines:
+        src.line('pass')
+    src.dedent()
+    src.line('except Exception as {p}failed:', p=_PREFIX)
+    src.indent()
+    # Fail-fast, the errors (if known) are attached to the exception:
+    src.line("{p}errors = getattr({p}failed, '_errors_', None) or {p}errors", p=_PREFIX)
+    src.line('raise')
+    src.dedent()
+    src.line('finally:')
+    src.indent()
+    src.line(
+        '{p}notify_call_end({p}observers, {p}name, {p}timer() - {p}start, {p}errors or ())',
+        p=_PREFIX)
+    src.dedent()
+
+
+def _emit_function(src, plan, name, namespace, observed):
+    argspec = plan.argspec
+    names = _check_names(argspec)
+    defaults = plan.sig_index.defaults
+    # The positional arguments then the keyword-only arguments, as their positions:
+    named = list(argspec.args) + list(getattr(argspec, 'kwonlyargs', None) or ())
+    optional = set(index for index, name in enumerate(named) if name in defaults)
+    params, call = _make_params(argspec, defaults)
+
+    src.line('def {name}({params}):', name=name, params=', '.join(params))
+    src.indent()
+
+    for index in sorted(optional):
+        src.line('{g} = {n} is not {p}NOVALUE', g=_given(index), n=named[index], p=_PREFIX)
+
+    if observed:
+        _emit_observed_checks(src, plan, namespace, named, defaults, optional, names)
+    else:
+        # Checks disabled at runtime (see `hoft.configure`), or the call is not sampled:
+        if plan.sampler is not None:
+            namespace[_PREFIX + 'sampler'] = plan.sampler
+            src.line('if not {p}state.checks or not {p}sampler():', p=_PREFIX)
+        else:
+            src.line('if not {p}state.checks:', p=_PREFIX)
+        src.indent()
+        _emit_defaults(src, named, defaults, namespace, optional)
+        src.line('return {p}func({c})', p=_PREFIX, c=', '.join(call))
+        src.dedent()
+
+        # The call is passed on as is (omitted arguments are still `NOVALUE`):
+        src.line('if {p}get_observers():', p=_PREFIX)
+        src.indent()
+        src.line('return {p}observed({c})', p=_PREFIX, c=', '.join(call))
+        src.dedent()
+
+        # Only created when there is an error:
+        src.line('{p}errors = None', p=_PREFIX)
+        _emit_checks(src, plan, namespace, named, defaults, optional, names)
+
+    if not plan.fail_fast:
+        src.line('if {p}errors:', p=_PREFIX)
+        src.indent()
+        src.line('{p}raise_errors({p}plan, {p}errors)', p=_PREFIX)
+        src.dedent()
+
+    src.line('return {p}func({c})', p=_PREFIX, c=', '.join(call))
+    src.dedent()
+
+
+def _generate(plan, name, namespace):
+    src = _Source()
+    _emit_function(src, plan, name, namespace, observed=False)
+    src.line('')
+    # The wrapper, when there are observers (see `hoft.add_observer`):
+    _emit_function(src, plan, _PREFIX + 'observed', namespace, observed=True)
+
+    return str(src)
+
+
+def compile_wrapper(plan):
+    """
+    Generate (and compile) a wrapper specialised for the plan's decorated function.
+
+    The wrapper's parameters mirror the decorated function's own, so arguments are bound natively
+    rather than via `inspect.getcallargs`, and every parser is called with its name and index
+    baked into the source. As arguments are bound natively, a positional parser is applied to its
+    argument however it was passed, and a keyword parser's `called_with_value` is `NOVALUE` only
+    when the argument was omitted.
+
+    Calls made while there are observers (see `hoft.add_observer`) are passed on to a second
+    generated wrapper, which notifies them.
+
+    :param CallPlan plan:
+        The plan to compile.
+    :return:
+        The (undecorated) wrapper. The generated source is available as `__hoft_source__`.
+    :rtype:
+        callable
+    :raises:
+        ValueError When the decorated function's arguments cannot be represented.
+    """
+    name = plan.func.__name__
+
+    if not _IDENTIFIER.match(name) or keyword.iskeyword(name):
+        # eg: A lambda.
+        name = _PREFIX + 'wrapper'
+
+    namespace = {
+        _PREFIX + 'plan': plan,
+        _PREFIX + 'func': plan.func,
+        _PREFIX + 'NOVALUE': NOVALUE,
+        _PREFIX + 'state': state,
+        _PREFIX + 'NoDefaultError': NoDefaultError,
+        _PREFIX + 'report': _report,
+        _PREFIX + 'report_unanalysed': _report_unanalysed,
+        _PREFIX + 'raise_errors': _raise_errors,
+        _PREFIX + 'get_observers': get_observers,
+        _PREFIX + 'call_arguments': _call_arguments,
+        _PREFIX + 'notify_call_start': notify_call_start,
+        _PREFIX + 'notify_call_end': notify_call_end,
+        _PREFIX + 'timer': default_timer,
+    }
+
+    source = _generate(plan, name, namespace)
+    filename = '<hoft compiled {m}.{n} at {i:#x}>'.format(
+        m=plan.func.__module__, n=name, i=id(plan))
+
+    six.exec_(compile(source, filename, 'exec'), namespace)
+
+    # Allow tracebacks (and debuggers) to show the generated source:
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+
+    wrapper = namespace[name]
+    wrapper.__hoft_source__ = source
+
+    return wrapper
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT (process-wide) configuration.
+# @module hoft.core.config
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import os
+from collections import namedtuple
+
+__all__ = [
+    'Config',
+    'ENV_DISABLE',
+    'configure',
+    'get_config',
+    'state',
+]
+
+ENV_DISABLE = 'HOFT_DISABLE'
+"""
+The environment variable which (when set to anything but '', '0', 'false', 'no' or 'off')
+disables decoration.
+"""
+
+Config = namedtuple('Config', ('enabled', 'checks'))
+"""
+The process-wide configuration.
+
+:param bool enabled:
+    False: `analyse_sig` and `analyse_in` return the function undecorated (so there is no
+    overhead at all), this only affects functions decorated afterwards.
+:param bool checks:
+    False: Decorated functions call straight through to the decorated function without analysing
+    their arguments, this affects every decorated function immediately.
+"""
+
+
+class _State(object):
+    """
+    The mutable configuration, read by every wrapper (as a single attribute lookup) per call.
+    """
+
+    __slots__ = ('enabled', 'checks')
+
+    def __init__(self, enabled, checks):
+        self.enabled = enabled
+        self.checks = checks
+
+
+def _disabled_by_env(environ):
+    value = environ.get(ENV_DISABLE, '').strip().lower()
+
+    return value not in ('', '0', 'false', 'no', 'off')
+
+
+state = _State(enabled=not _disabled_by_env(os.environ), checks=True)
+
+
+def get_config():
+    """
+    Get the process-wide configuration.
+
+    :rtype:
+        Config
+    """
+    return Config(state.enabled, state.checks)
+
+
+def configure(enabled=None, checks=None):
+    """
+    Change the process-wide configuration, leaving the settings that are None unchanged.
+
+    :param bool enabled:
+        False: Decorate functions (decorated from now on) with nothing at all. Defaults to False
+        when the `HOFT_DISABLE` environment variable is set, True otherwise.
+    :param bool checks:
+        False: Stop (every) decorated function from analysing its arguments, until re-enabled.
+    :return:
+        The previous configuration (eg: to later restore with `configure(**previous._asdict())`).
+    :rtype:
+        Config
+
+    Example:
+
+    >>> hoft.configure(checks=False)
+    """
+    previous = get_config()
+
+    if enabled is not None:
+        state.enabled = bool(enabled)
+    if checks is not None:
+        state.checks = bool(checks)
+
+    return previous
@@ -6,13 +6,32 @@
 # @version 0.1
 # @copyright (c) 2017-present Francis Horsman.
 
-from inspect import getargspec, getcallargs
+import functools
+from collections import namedtuple
+from timeit import default_timer
 
 import six
 
+from hoft.core.binder import make_bind
+from hoft.core.codegen import compile_wrapper
+from hoft.core.config import state
+from hoft.core.executors import parse_all_sig_args_concurrently
+from hoft.core.fusion import fuse_parsers, merge_parsers
+from hoft.core.metrics import CallStats, make_measured_wrapper
+from hoft.core.observers import get_observers, notify_call_end, notify_call_start
 from hoft.core.parsers_in import parse_all_in_args
 from hoft.core.parsers_sig import parse_all_sig_args
-from hoft.core.utils import raise_exc
+from hoft.core.plan import ORDER_ALPHABETICAL, build_call_plan
+from hoft.core.pure import DEFAULT_RESULT_CACHE_SIZE, make_pure_parsers
+from hoft.core.sampling import make_sampler
+from hoft.core.sigs import get_argspec, get_signature_index
+from hoft.core.utils import IGNORE, raise_exc
+
+try:
+    from inspect import iscoroutinefunction
+except ImportError:  # Python < 3.5
+    def iscoroutinefunction(func):
+        return False
 
 
 def analyse_in(*parse_args, **parse_kwargs):
@@ -51,6 +70,8 @@ def analyse_in(*parse_args, **parse_kwargs):
         Any exception raised by a supplied callable will have an additional field: `_errors_`.
         This is always a list of one or all of the errors encountered during the supplied
         callables (depending on the value of the `_fail_fast_` kwargs).
+    :note:
+        See `hoft.configure` to disable decoration (or analysis) altogether.
 
     Example:
 
@@ -63,22 +84,38 @@ def analyse_in(*parse_args, **parse_kwargs):
     """
 
     def decorator(func):
+        if not state.enabled:
+            return func
+
+        argspec = get_argspec(func)
+        sig_index = get_signature_index(argspec)
+        name = '{m}.{n}'.format(m=func.__module__, n=func.__name__)
+
         @six.wraps(func)
         def wrapper(*args, **kwargs):
+            if not state.checks:
+                return func(*args, **kwargs)
+
             fail_fast = parse_kwargs.pop('_fail_fast_', False)
             on_error = parse_kwargs.pop('_on_error_', None)
+            observers = get_observers()
 
-            argspec = getargspec(func)
-
-            errors = parse_all_in_args(
-                parse_args,
-                parse_kwargs,
-                args,
-                kwargs,
-                argspec,
-                on_error,
-                fail_fast,
-            )
+            if observers:
+                errors = _observed_parse(
+                    observers, name, args, kwargs, parse_all_in_args, parse_args, parse_kwargs,
+                    args, kwargs, argspec, on_error, fail_fast, sig_index,
+                )
+            else:
+                errors = parse_all_in_args(
+                    parse_args,
+                    parse_kwargs,
+                    args,
+                    kwargs,
+                    argspec,
+                    on_error,
+                    fail_fast,
+                    sig_index,
+                )
 
             if errors and not fail_fast:
                 # We have errors to raise which have not already been raised.
@@ -99,6 +136,24 @@ def analyse_in(*parse_args, **parse_kwargs):
     return decorator
 
 
+def _observed_parse(observers, name, args, kwargs, parse, *parse_args):
+    # Analyse the call (`parse(*parse_args)`), notifying the observers:
+    notify_call_start(observers, name, args, kwargs)
+    errors = ()
+    start = default_timer()
+
+    try:
+        errors = parse(*parse_args)
+    except Exception as exc:
+        # Fail-fast, the errors (if known) are attached to the exception:
+        errors = getattr(exc, '_errors_', None) or ()
+        raise
+    finally:
+        notify_call_end(observers, name, default_timer() - start, errors)
+
+    return errors
+
+
 def analyse_sig(*parse_args, **parse_kwargs):
     """
     Decorator for methods (to analyse) the args and kwargs of the decorated callable.
@@ -135,12 +190,77 @@ def analyse_sig(*parse_args, **parse_kwargs):
     :param callable parse_kwargs['_default_']:
         Default handler for all not previously analysed arguments.
 
+    :param bool parse_kwargs['_compile_']:
+        True: Generate a wrapper specialised for the decorated function's signature (see
+        `hoft.core.codegen.compile_wrapper`), its source is available as `__hoft_source__`.
+        Ignored for coroutine functions or when `_executor_` or `_metrics_` is supplied.
+
+    :param concurrent.futures.Executor parse_kwargs['_executor_']:
+        Executor to run the positional, keyword and `_default_` parsers of each call concurrently
+        on (see `hoft.core.executors.parse_all_sig_args_concurrently`). Ignored for coroutine
+        functions or when `_metrics_` is supplied.
+
+    :param float parse_kwargs['_sample_rate_']:
+        Analyse only this (random) fraction of calls, in (0, 1]. Failures of analysed calls are
+        reported as usual. See `hoft.get_sample_stats` for the counters.
+
+    :param int parse_kwargs['_sample_every_']:
+        Analyse only every Nth call (starting with the first), instead of `_sample_rate_`.
+
+    :param bool parse_kwargs['_metrics_']:
+        True: Record the number of calls, the time spent binding, analysing and in each parser,
+        and the number of errors found, as `__hoft__.stats` (see `hoft.core.metrics.CallStats`
+        and `hoft.get_all_stats`), and notify the observers of each parser applied. Ignored for
+        coroutine functions. The observers (see `hoft.add_observer`) are otherwise notified of
+        each analysed call (but those of coroutine functions) and its errors.
+
+    :param str parse_kwargs['_order_']:
+        The order to apply keyword parsers (and the `_default_` handler) in, worked out once when
+        decorating: 'alphabetical' (the default) by argument name, or 'declaration' as the
+        decorated function declares its arguments. Positional parsers are always applied first,
+        in order.
+
+    :param bool parse_kwargs['_lazy_errors_']:
+        True: Keep just the exception (and what it was raised for) of each failing parser, making
+        the error records (from the call plan) only when `_errors_` is accessed, as a
+        `hoft.core.errors.LazyErrors` sequence. Cheaper when the errors are seldom all inspected.
+        Ignored for coroutine functions or when `_executor_` or `_metrics_` is supplied.
+
+    :param Union[bool|int] parse_kwargs['_cache_']:
+        True (or the maximum number of results to remember for each parser): Treat every
+        positional and keyword parser as pure (see `hoft.pure`), remembering whether it passed
+        (or the exception it raised) for the values it is most often called with.
+
+    :note:
+        Coroutine functions (Python 3.5+) are wrapped by a coroutine function which analyses the
+        call when awaited. Parsers may then be coroutine functions too, these are awaited
+        concurrently (see `hoft.core.aio.make_async_wrapper`). A `TypeError` is raised for parsers
+        which are coroutine functions of other functions.
+
+    :note:
+        Calls are only bound (to the mapping of every argument) when `_default_` or `_strict_`
+        needs them to be. Otherwise the positional parsers use the positional arguments and the
+        keyword parsers the keyword arguments passed, and a bad call raises its `TypeError` when
+        the decorated function is called. See `hoft.get_binding`.
+
     :returns:
         Decorated function.
+        The call plan (built once, when decorating) is available as `__hoft__`.
     :note:
         Any exception raised by a supplied callable will have an additional field: `_errors_`.
         This is always a list of one or all of the errors encountered during the supplied
         callables (depending on the value of the `_fail_fast_` kwargs).
+    :note:
+        See `hoft.configure` to disable decoration (or analysis) altogether.
+    :note:
+        A list (or tuple) of parsers may be supplied for an argument, these are fused into one
+        parser which applies each in turn until one fails (see `hoft.core.fusion.fuse`).
+    :note:
+        Directly stacked `analyse_sig` decorators (with the default options, for functions which
+        are not coroutine functions) are merged into one wrapper, which binds and analyses each
+        call once. The outer decorator's parser for an argument is applied before the inner
+        decorator's. These are not merged when one has a positional parser for an argument the
+        other has a keyword parser for.
 
     Example:
 
@@ -153,44 +273,217 @@ def analyse_sig(*parse_args, **parse_kwargs):
 
     """
 
+    options = {option: parse_kwargs.pop(option, value) for option, value in _SIG_OPTIONS}
+    cache = parse_kwargs.pop('_cache_', False)
+
+    # Lists of parsers for an argument are applied by one (fused) parser:
+    parse_args, parse_kwargs = fuse_parsers(parse_args, parse_kwargs)
+
+    if cache:
+        parse_args, parse_kwargs = make_pure_parsers(
+            parse_args,
+            parse_kwargs,
+            maxsize=DEFAULT_RESULT_CACHE_SIZE if cache is True else cache,
+        )
+
     def decorator(func):
-        @six.wraps(func)
-        def wrapper(*args, **kwargs):
-            argspec = getargspec(func)
-            callargs = getcallargs(func, *args, **kwargs)
+        if not state.enabled:
+            return func
 
-            strict = parse_kwargs.pop('_strict_', None)
-            default = parse_kwargs.pop('_default_', None)
-            fail_fast = parse_kwargs.pop('_fail_fast_', False)
-            on_error = parse_kwargs.pop('_on_error_', None)
+        return _decorate_sig(func, parse_args, parse_kwargs, options)
 
-            errors = parse_all_sig_args(
-                parse_args,
-                parse_kwargs,
-                args,
-                kwargs,
-                argspec,
-                callargs,
-                strict,
-                default,
-                on_error,
-                fail_fast,
-            )
+    return decorator
 
-            if errors and not fail_fast:
-                # We have errors to raise which have not already been raised.
-                exc = errors[0]
-                raise_exc(
-                    exc=exc.error,
-                    on_error=on_error,
-                    errors=errors,
-                    fail_fast=fail_fast,
-                    force=True,
-                )
 
-            # Call the wrapped function:
+_SIG_OPTIONS = (
+    ('_strict_', None),
+    ('_default_', None),
+    ('_fail_fast_', False),
+    ('_on_error_', None),
+    ('_compile_', False),
+    ('_executor_', None),
+    ('_sample_rate_', None),
+    ('_sample_every_', None),
+    ('_metrics_', False),
+    ('_order_', ORDER_ALPHABETICAL),
+    ('_lazy_errors_', False),
+)
+
+_Decoration = namedtuple(
+    '_Decoration', ('func', 'parse_args', 'parse_kwargs', 'options', 'wrapper'))
+"""
+How a function was decorated by `analyse_sig` (so a stacked `analyse_sig` can be merged with it).
+"""
+
+_DEFAULT_SIG_OPTIONS = dict(_SIG_OPTIONS)
+
+
+def _can_merge(func, decoration, options, parse_args, parse_kwargs):
+    """
+    Whether a stacked `analyse_sig` can be merged with the one it decorates (`func`): only when
+    it decorates that wrapper directly (rather than another decorator's wrapper, which copied
+    `__hoft_decoration__` with the wrapper's `__dict__`), and when each decorator's options would
+    behave the same for the other's parsers, ie: both decorators' options are the defaults.
+
+    Nor when one decorator has a positional parser for an argument the other has a keyword parser
+    for: a keyword parser is not applied when the positional parser for its argument is (see
+    `hoft.core.plan.KeywordSlot`), so once merged the other decorator's would not be.
+    """
+    if decoration.wrapper is not func or iscoroutinefunction(decoration.func):
+        return False
+
+    if options != _DEFAULT_SIG_OPTIONS or decoration.options != _DEFAULT_SIG_OPTIONS:
+        return False
+
+    args = get_argspec(decoration.func).args
+
+    def positional_names(parsers):
+        return {
+            args[index] for index, custom_parser_func in enumerate(parsers[:len(args)])
+            if custom_parser_func is not IGNORE
+        }
+
+    def keyword_names(parsers):
+        return {
+            name for name, custom_parser_func in parsers.items() if custom_parser_func is not IGNORE
+        }
+
+    if positional_names(parse_args) & keyword_names(decoration.parse_kwargs):
+        return False
+
+    return not positional_names(decoration.parse_args) & keyword_names(parse_kwargs)
+
+
+def _decorate_sig(func, parse_args, parse_kwargs, options):
+    decoration = getattr(func, '__hoft_decoration__', None)
+    argspec = None
+
+    if decoration is not None and _can_merge(func, decoration, options, parse_args, parse_kwargs):
+        # Replace the inner wrapper, so the call is bound and analysed once:
+        parse_args, parse_kwargs = merge_parsers(
+            (parse_args, parse_kwargs),
+            (decoration.parse_args, decoration.parse_kwargs),
+        )
+        func = decoration.func
+    elif decoration is not None and decoration.wrapper is func:
+        # The inner wrapper takes `*args, **kwargs`, calls are analysed by what it wraps:
+        argspec = get_argspec(decoration.func)
+
+    executor = options['_executor_']
+    compiled = options['_compile_']
+
+    if executor is not None:
+        parse = functools.partial(parse_all_sig_args_concurrently, executor=executor)
+        compiled = False
+    else:
+        parse = parse_all_sig_args
+
+    coroutine = iscoroutinefunction(func)
+
+    if options['_metrics_'] and not coroutine:
+        stats = CallStats('{m}.{n}'.format(m=func.__module__, n=func.__name__))
+    else:
+        stats = None
+
+    # Everything that can be known about the call is worked out once, here:
+    plan = build_call_plan(
+        func,
+        parse_args,
+        parse_kwargs,
+        strict=options['_strict_'],
+        default=options['_default_'],
+        on_error=options['_on_error_'],
+        fail_fast=options['_fail_fast_'],
+        # Each decorated function counts its own calls:
+        sampler=make_sampler(rate=options['_sample_rate_'], every=options['_sample_every_']),
+        stats=stats,
+        order=options['_order_'],
+        lazy_errors=options['_lazy_errors_'],
+        argspec=argspec,
+    )
+
+    wrapper = six.wraps(func)(_make_sig_wrapper(plan, coroutine, compiled, parse))
+    wrapper.__hoft__ = plan
+    wrapper.__hoft_decoration__ = _Decoration(func, parse_args, parse_kwargs, options, wrapper)
+
+    return wrapper
+
+
+def _async_parser(plan):
+    """
+    The first of the plan's parsers (or their fused parts) which is a coroutine function, if any.
+    """
+    parsers = [slot.func for slot in plan.positionals]
+    parsers.extend(slot.func for slot in plan.keywords)
+    parsers.append(plan.default)
+
+    for custom_parser_func in parsers:
+        for part in getattr(custom_parser_func, '__hoft_fused__', (custom_parser_func,)):
+            if iscoroutinefunction(part):
+                return part
+
+    return None
+
+
+def _make_sig_wrapper(plan, coroutine, compiled, parse):
+    """
+    Make the (undecorated) wrapper best suited to the plan and options.
+
+    :raises:
+        TypeError When a parser is a coroutine function but the decorated function is not (its
+        coroutines would never be awaited).
+    """
+    if coroutine:
+        from hoft.core.aio import make_async_wrapper
+
+        return make_async_wrapper(plan)
+
+    async_parser = _async_parser(plan)
+
+    if async_parser is not None:
+        raise TypeError('an async parser can only analyse a coroutine function: {f!r}'.format(
+            f=async_parser))
+
+    if plan.stats is not None:
+        return make_measured_wrapper(plan)
+
+    if compiled:
+        return compile_wrapper(plan)
+
+    func = plan.func
+    name = '{m}.{n}'.format(m=func.__module__, n=func.__name__)
+    sampler = plan.sampler
+    on_error = plan.on_error
+    fail_fast = plan.fail_fast
+    bind = make_bind(plan)
+
+    def analyse(args, kwargs):
+        return parse(plan, args, kwargs, bind(args, kwargs))
+
+    def wrapper(*args, **kwargs):
+        if not state.checks or (sampler is not None and not sampler()):
             return func(*args, **kwargs)
 
-        return wrapper
+        observers = get_observers()
+
+        if observers:
+            errors = _observed_parse(observers, name, args, kwargs, analyse, args, kwargs)
+        else:
+            callargs = bind(args, kwargs)
+            errors = parse(plan, args, kwargs, callargs)
+
+        if errors and not fail_fast:
+            # We have errors to raise which have not already been raised.
+            exc = errors[0]
+            raise_exc(
+                exc=exc.error,
+                on_error=on_error,
+                errors=errors,
+                fail_fast=fail_fast,
+                force=True,
+            )
 
-    return decorator
+        # Call the wrapped function:
+        return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT error records of analysed calls.
+# @module hoft.core.errors
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+from hoft.core.plan import KeywordSlot, PositionalSlot
+from hoft.core.utils import KeywordError, PositionalError, get_func_name
+
+__all__ = [
+    'LazyErrors',
+    'failed_parser',
+    'make_error',
+]
+
+
+def failed_parser(custom_parser_func, exc):
+    """
+    The parser which raised an exception: the part of a parser merged from stacked decorators
+    (see `hoft.core.fusion.merge_parsers`) which failed, or else the parser.
+
+    :param callable custom_parser_func:
+        The parser applied.
+    :param Exception exc:
+        Its exception.
+    :rtype:
+        callable
+    """
+    # Recorded by the merged parser (see `hoft.core.fusion.fuse`):
+    failed = getattr(exc, '_hoft_failed_', None)
+
+    if failed is not None and failed[0] is custom_parser_func:
+        return failed[1]
+    return custom_parser_func
+
+
+def make_error(plan, slot, value, exc):
+    """
+    Make the error record for a parser's exception.
+
+    :param CallPlan plan:
+        The decorated function's call plan.
+    :param slot:
+        The plan's slot (`PositionalSlot`, `KeywordSlot` or `RemainingSlot`) the parser was
+        applied for.
+    :param value:
+        The value the parser was applied to.
+    :param Exception exc:
+        The parser's exception.
+    :rtype:
+        Union[PositionalError|KeywordError]
+    """
+    slot_type = type(slot)
+
+    if slot_type is PositionalSlot or slot_type is KeywordSlot:
+        func = failed_parser(slot.func, exc)
+        func_name = slot.func_name if func is slot.func else get_func_name(func)
+
+        if slot_type is PositionalSlot:
+            return PositionalError(exc, slot.name, slot.index, value, func_name, func)
+        return KeywordError(exc, slot.name, value, slot.default_value, func_name, func)
+
+    # A `RemainingSlot`, handled by `_default_` (its name is worked out when used):
+    if slot.index is None:
+        return KeywordError(exc, slot.name, value, value, None, plan.default)
+    return PositionalError(exc, slot.name, slot.index, value, None, plan.default)
+
+
+class LazyErrors(object):
+    """
+    The errors of a call (see `analyse_sig`'s `_lazy_errors_` option), as a read-only sequence.
+
+    Only the plan's slot, the value and the exception are kept for each failure. The error
+    records are made from these (and the plan) when accessed, eg: `exc._errors_[0]`.
+    """
+
+    __slots__ = ('_plan', '_entries')
+
+    def __init__(self, plan):
+        self._plan = plan
+        # `(slot, value, exc)`, or `(None, None, record)` once the record is made:
+        self._entries = []
+
+    def add(self, slot, value, exc):
+        """
+        Add a parser's failure (its record is made when accessed).
+        """
+        self._entries.append((slot, value, exc))
+
+    def append(self, error):
+        """
+        Add an error record.
+        """
+        self._entries.append((None, None, error))
+
+    def _record(self, position):
+        slot, value, exc = self._entries[position]
+
+        if slot is None:
+            return exc
+
+        error = make_error(self._plan, slot, value, exc)
+        self._entries[position] = (None, None, error)
+
+        return error
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __bool__(self):
+        return bool(self._entries)
+
+    __nonzero__ = __bool__
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self._record(index) for index in range(*position.indices(len(self)))]
+
+        return self._record(position)
+
+    def __iter__(self):
+        return (self._record(index) for index in range(len(self)))
+
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple, LazyErrors)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'LazyErrors({e!r})'.format(e=list(self))
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT concurrent (executor based) argument parsing.
+# @module hoft.core.executors
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+from hoft.core.parsers_sig import iter_sig_checks, order_errors, parse_sig_unanalysed_inputs
+from hoft.core.utils import conditionally_raise_exc
+
+__all__ = [
+    'parse_all_sig_args_concurrently',
+]
+
+
+def _cancel(futures):
+    for future in futures:
+        future.cancel()
+
+
+def _submit_checks(plan, executor, args, kwargs, callargs):
+    submitted = []
+
+    try:
+        for order, (invoke, make_error) in enumerate(iter_sig_checks(plan, args, kwargs, callargs)):
+            submitted.append((order, executor.submit(invoke), make_error))
+    except BaseException:
+        _cancel(future for _, future, _ in submitted)
+        raise
+
+    return submitted
+
+
+def _completed(submitted, fail_fast):
+    if not fail_fast:
+        # Waiting for each in turn:
+        return submitted
+
+    # Imported here as `concurrent.futures` is only a dependency when an executor is supplied:
+    from concurrent.futures import as_completed
+
+    # Each failure is handled as soon as it is known:
+    checks = {future: (order, future, make_error) for order, future, make_error in submitted}
+    return (checks[future] for future in as_completed(checks))
+
+
+def parse_all_sig_args_concurrently(plan, args, kwargs, callargs, executor):
+    """
+    Analyse a call, as `hoft.core.parsers_sig.parse_all_sig_args`, with every parser submitted to
+    an executor (so they run concurrently).
+
+    The errors are returned in the usual validation order. When fail-fast, each failure is handled
+    as soon as it is known, and the error handler raising cancels the outstanding parsers.
+
+    :param concurrent.futures.Executor executor:
+        The executor to submit parsers to.
+    """
+    submitted = _submit_checks(plan, executor, args, kwargs, callargs)
+    errors = []
+
+    try:
+        for order, future, make_error in _completed(submitted, plan.fail_fast):
+            exc = future.exception()
+
+            if exc is None:
+                continue
+            if not isinstance(exc, Exception):
+                raise exc
+
+            errors.append((order, make_error(exc)))
+
+            if plan.fail_fast:
+                conditionally_raise_exc(
+                    exc=exc,
+                    on_error=plan.on_error,
+                    errors=order_errors(errors),
+                    fail_fast=plan.fail_fast,
+                )
+    except BaseException:
+        _cancel(future for _, future, _ in submitted)
+        raise
+
+    errors = order_errors(errors)
+
+    if plan.strict:
+        parse_sig_unanalysed_inputs(plan, args, callargs, errors)
+
+    return errors
@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT metrics exporters (Prometheus text exposition format, StatsD).
+# @module hoft.core.exporters
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import os
+import re
+import socket
+import threading
+
+from hoft.core.metrics import get_all_stats
+from hoft.core.observers import Observer
+
+__all__ = [
+    'StatsdExporter',
+    'format_statsd_line',
+    'render_prometheus',
+    'write_prometheus',
+]
+
+_STATSD_UNSAFE = re.compile(r'[^A-Za-z0-9_.\-]')
+
+
+def _escape_label(value):
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _labels(**labels):
+    return '{' + ','.join(
+        '{k}="{v}"'.format(k=key, v=_escape_label(value)) for key, value in sorted(labels.items())
+    ) + '}'
+
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _render_histogram(lines, metric, histogram, **labels):
+    cumulative = 0
+
+    for bound, count in zip(histogram.buckets + (float('inf'),), histogram.counts):
+        cumulative += count
+        le = '+Inf' if bound == float('inf') else repr(float(bound))
+        lines.append('{m}_bucket{l} {v}'.format(m=metric, l=_labels(le=le, **labels), v=cumulative))
+
+    lines.append('{m}_sum{l} {v}'.format(m=metric, l=_labels(**labels), v=_format_value(
+        histogram.sum)))
+    lines.append('{m}_count{l} {v}'.format(m=metric, l=_labels(**labels), v=histogram.count))
+
+
+def _header(lines, metric, kind, text):
+    lines.append('# HELP {m} {t}'.format(m=metric, t=text))
+    lines.append('# TYPE {m} {k}'.format(m=metric, k=kind))
+
+
+def render_prometheus(snapshots=None, prefix='hoft'):
+    """
+    Render metrics in the Prometheus text exposition format.
+
+    :param list snapshots:
+        The `StatsSnapshot`s to render, defaults to those of every decorated function (see
+        `hoft.get_all_stats`).
+    :param str prefix:
+        The prefix of every metric name.
+    :rtype:
+        str
+    """
+    if snapshots is None:
+        snapshots = get_all_stats()
+
+    lines = []
+
+    metric = prefix + '_calls_total'
+    _header(lines, metric, 'counter', 'Calls to the decorated function.')
+    for snapshot in snapshots:
+        lines.append('{m}{l} {v}'.format(
+            m=metric, l=_labels(function=snapshot.name), v=snapshot.calls))
+
+    for field, text in (
+        ('bind', 'Time spent binding the arguments of analysed calls.'),
+        ('analysis', 'Time spent analysing calls.'),
+    ):
+        metric = '{p}_{f}_seconds'.format(p=prefix, f=field)
+        _header(lines, metric, 'histogram', text)
+        for snapshot in snapshots:
+            _render_histogram(lines, metric, getattr(snapshot, field), function=snapshot.name)
+
+    metric = prefix + '_validator_seconds'
+    _header(lines, metric, 'histogram', 'Time spent in each parser.')
+    for snapshot in snapshots:
+        for slot, validator in sorted(snapshot.validators.items()):
+            _render_histogram(
+                lines, metric, validator.histogram, function=snapshot.name, slot=slot,
+                argument=validator.name, parser=validator.func_name or '')
+
+    metric = prefix + '_errors_total'
+    _header(lines, metric, 'counter', 'Errors found analysing calls.')
+    for snapshot in snapshots:
+        for error_type, count in sorted(snapshot.errors.items()):
+            lines.append('{m}{l} {v}'.format(
+                m=metric, l=_labels(function=snapshot.name, type=error_type), v=count))
+
+    return '\n'.join(lines) + '\n'
+
+
+def write_prometheus(target, snapshots=None, prefix='hoft'):
+    """
+    Write metrics in the Prometheus text exposition format (see `render_prometheus`).
+
+    :param target:
+        A file-like object, or the path of the file to (atomically) replace, eg: for the node
+        exporter's textfile collector.
+    """
+    text = render_prometheus(snapshots=snapshots, prefix=prefix)
+
+    if hasattr(target, 'write'):
+        target.write(text)
+        return
+
+    temp = '{t}.{p}.tmp'.format(t=target, p=os.getpid())
+
+    with open(temp, 'w') as f:
+        f.write(text)
+
+    os.rename(temp, target)
+
+
+def format_statsd_line(name, value, kind):
+    """
+    Format a StatsD line, eg: `format_statsd_line('hoft.calls', 1, 'c') == 'hoft.calls:1|c'`.
+
+    Characters StatsD does not allow in names are replaced with '_'.
+    """
+    return '{n}:{v}|{k}'.format(n=_STATSD_UNSAFE.sub('_', name), v=_format_value(value), k=kind)
+
+
+class StatsdExporter(Observer):
+    """
+    An observer which sends StatsD lines over UDP.
+
+    Lines are buffered and sent (many to a datagram) once the next line would not fit in
+    `max_packet_size` bytes, or on `flush`. Durations are sent in milliseconds.
+
+    Register with `hoft.add_observer`.
+    """
+
+    def __init__(self, host='127.0.0.1', port=8125, prefix='hoft', max_packet_size=1432):
+        self.address = (host, port)
+        self.prefix = prefix
+        self.max_packet_size = max_packet_size
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._lock = threading.Lock()
+        self._lines = []
+        self._size = 0
+
+    def _add(self, line):
+        with self._lock:
+            # Lines are separated by '\n':
+            if self._lines and self._size + 1 + len(line) > self.max_packet_size:
+                self._send()
+
+            self._size += len(line) + (1 if self._lines else 0)
+            self._lines.append(line)
+
+    def _send(self):
+        packet = '\n'.join(self._lines).encode('utf-8')
+        self._lines = []
+        self._size = 0
+        self._socket.sendto(packet, self.address)
+
+    def _name(self, *parts):
+        return '.'.join((self.prefix,) + parts)
+
+    def on_validator_done(self, name, arg_name, func_name, duration, error):
+        self._add(format_statsd_line(
+            self._name(name, arg_name, func_name or 'unknown'), duration * 1000, 'ms'))
+
+    def on_error(self, name, error):
+        self._add(format_statsd_line(self._name(name, 'errors', type(error).__name__), 1, 'c'))
+
+    def on_call_end(self, name, duration, errors):
+        self._add(format_statsd_line(self._name(name, 'calls'), 1, 'c'))
+        self._add(format_statsd_line(self._name(name, 'analysis'), duration * 1000, 'ms'))
+
+    def flush(self):
+        """
+        Send any buffered lines.
+        """
+        with self._lock:
+            if self._lines:
+                self._send()
+
+    def close(self):
+        self.flush()
+        self._socket.close()
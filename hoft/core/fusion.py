@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT parser fusion.
+# @module hoft.core.fusion
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import six
+
+from hoft.core.codegen import _Source
+from hoft.core.utils import IGNORE, NOVALUE, get_func_name
+
+try:
+    from inspect import isawaitable, iscoroutinefunction
+except ImportError:  # Python < 3.5
+    def isawaitable(value):
+        return False
+
+    def iscoroutinefunction(func):
+        return False
+
+__all__ = [
+    'fuse',
+    'fuse_parsers',
+    'merge_parsers',
+]
+
+_PREFIX = '_hoft_'
+
+
+def _resume(awaitable, rest, args, kwargs):
+    # A parser returned an awaitable: the rest are applied once it has been awaited.
+    from hoft.core.aio import resume_parsers
+
+    return resume_parsers(awaitable, rest, args, kwargs)
+
+
+class _Chain(object):
+    """
+    Parsers applied in turn (stopping at the first to fail), without being fused: for parsers
+    which are coroutine functions. Once a parser returns an awaitable, the result is a coroutine
+    which awaits it and applies the rest (see `hoft.core.aio.resume_parsers`).
+    """
+
+    def __init__(self, parts):
+        self.__hoft_fused__ = parts
+        self.__name__ = '+'.join(_name(part) for part in parts)
+
+    def __call__(self, *args, **kwargs):
+        parts = self.__hoft_fused__
+
+        for position, part in enumerate(parts):
+            result = part(*args, **kwargs)
+
+            if result is not None and isawaitable(result):
+                return _resume(result, parts[position + 1:], args, kwargs)
+
+    def __repr__(self):
+        return '<hoft chain {n}>'.format(n=self.__name__)
+
+
+def _flatten(parsers):
+    for custom_parser_func in parsers:
+        if custom_parser_func is IGNORE:
+            continue
+
+        # Fused parsers are fused again from their parts:
+        for part in getattr(custom_parser_func, '__hoft_fused__', (custom_parser_func,)):
+            yield part
+
+
+def _name(custom_parser_func):
+    name = get_func_name(custom_parser_func)
+    return str(name) if isinstance(name, six.string_types) else '<parser>'
+
+
+def _emit_parser(src, namespace, parts, index, custom_parser_func, keyword):
+    inline = getattr(custom_parser_func, '__hoft_inline__', None)
+
+    if inline is not None:
+        # The parser's check is generated in place (see `fuse`):
+        lines, names = inline('value', '{p}{i}_'.format(p=_PREFIX, i=index))
+        namespace.update(names)
+
+        for line in lines:
+            src.line('{l}', l=line)
+        return
+
+    func = '{p}f_{i}'.format(p=_PREFIX, i=index)
+    rest = '{p}rest_{i}'.format(p=_PREFIX, i=index)
+    namespace[func] = custom_parser_func
+    namespace[rest] = parts[index + 1:]
+
+    if keyword:
+        src.line('{p}r = {f}(name, index, value, default_value=default_value)', p=_PREFIX, f=func)
+        kwargs = "{'default_value': default_value}"
+    else:
+        src.line('{p}r = {f}(name, index, value)', p=_PREFIX, f=func)
+        kwargs = '{}'
+
+    # An awaitable (from a parser which is not a coroutine function) is not discarded:
+    src.line('if {p}r is not None and {p}isawaitable({p}r):', p=_PREFIX)
+    src.indent()
+    src.line('return {p}resume({p}r, {r}, (name, index, value), {k})', p=_PREFIX, r=rest, k=kwargs)
+    src.dedent()
+
+
+def fuse(parsers, keyword=False, merged=False):
+    """
+    Fuse parsers into one parser, which applies each in turn (stopping at the first to fail).
+
+    The fused parser is generated (and compiled) once, so applying it costs one call plus a call to
+    each part. A part implementing `__hoft_inline__(value, prefix)` is not called at all: it
+    returns `(lines, namespace)`, the source of its check (statements using `name`, `index` and
+    the given `value` variable, which raise on failure) and the globals that source uses (all
+    named with the given prefix), which are generated in place.
+
+    :param parsers:
+        The parsers (`IGNORE`d ones are skipped, fused ones are fused from their parts).
+    :param bool keyword:
+        True: The parsers are keyword parsers (which are passed the `default_value`).
+    :param bool merged:
+        True: The parsers are those of stacked decorators (see `merge_parsers`), the part which
+        raised is recorded on the exception, for its error record to report that part rather than
+        the fused parser (see `hoft.core.errors.failed_parser`).
+    Parsers which are coroutine functions are not fused: the parsers are applied in turn (see
+    `_Chain`). A part returning an awaitable stops the fused parser, which returns a coroutine
+    awaiting it and applying the rest.
+
+    :return:
+        The fused parser, the parser when there is only one to call, or `IGNORE` when there are
+        none. The parts of a fused parser are available as `__hoft_fused__`.
+    :rtype:
+        callable
+    """
+    parts = tuple(_flatten(parsers))
+
+    if not parts:
+        return IGNORE
+    if len(parts) == 1 and not hasattr(parts[0], '__hoft_inline__'):
+        return parts[0]
+
+    if any(iscoroutinefunction(part) for part in parts):
+        # Their coroutines must be awaited, so these are not fused:
+        return _Chain(parts)
+
+    namespace = {
+        _PREFIX + 'NOVALUE': NOVALUE,
+        _PREFIX + 'isawaitable': isawaitable,
+        _PREFIX + 'resume': _resume,
+        _PREFIX + 'parts': parts,
+    }
+    src = _Source()
+
+    if keyword:
+        src.line('def fused(name, index, value, default_value={p}NOVALUE):', p=_PREFIX)
+    else:
+        src.line('def fused(name, index, value):')
+    src.indent()
+
+    if merged:
+        src.line('{p}part = 0', p=_PREFIX)
+        src.line('try:')
+        src.indent()
+
+    for index, custom_parser_func in enumerate(parts):
+        if merged and index:
+            src.line('{p}part = {i}', p=_PREFIX, i=index)
+        _emit_parser(src, namespace, parts, index, custom_parser_func, keyword)
+
+    if merged:
+        src.dedent()
+        src.line('except Exception as {p}exc:', p=_PREFIX)
+        src.indent()
+        # Read by `hoft.core.errors.failed_parser`:
+        src.line('{p}exc._hoft_failed_ = (fused, {p}parts[{p}part])', p=_PREFIX)
+        src.line('raise')
+        src.dedent()
+
+    source = str(src)
+    six.exec_(compile(source, '<hoft fused parser>', 'exec'), namespace)
+
+    fused = namespace['fused']
+    fused.__name__ = '+'.join(_name(part) for part in parts)
+    fused.__hoft_fused__ = parts
+    fused.__hoft_source__ = source
+
+    return fused
+
+
+def fuse_parsers(parse_args, parse_kwargs):
+    """
+    Fuse each list (or tuple) of parsers supplied for an argument into one parser (see `fuse`), as
+    well as each parser whose check can be generated in place (eg: a `hoft.spec.Spec`).
+
+    :return:
+        The `(parse_args, parse_kwargs)`.
+    :rtype:
+        tuple
+    """
+    def fuse_list(custom_parser_func, keyword):
+        if isinstance(custom_parser_func, (list, tuple)):
+            return fuse(custom_parser_func, keyword=keyword)
+        if hasattr(custom_parser_func, '__hoft_inline__'):
+            return fuse([custom_parser_func], keyword=keyword)
+        return custom_parser_func
+
+    return (
+        tuple(fuse_list(custom_parser_func, False) for custom_parser_func in parse_args),
+        {
+            name: fuse_list(custom_parser_func, True)
+            for name, custom_parser_func in parse_kwargs.items()
+        },
+    )
+
+
+def merge_parsers(outer, inner):
+    """
+    Merge the (fused) parsers of two stacked `analyse_sig` decorators: the outer decorator's
+    parser for an argument is applied before the inner decorator's, and the error record of a
+    failure reports the parser which failed.
+
+    :param tuple outer:
+        The outer decorator's `(parse_args, parse_kwargs)`.
+    :param tuple inner:
+        The inner decorator's `(parse_args, parse_kwargs)`.
+    :return:
+        The `(parse_args, parse_kwargs)`.
+    :rtype:
+        tuple
+    """
+    outer_args, outer_kwargs = outer
+    inner_args, inner_kwargs = inner
+
+    parse_args = tuple(
+        fuse(pair, merged=True)
+        for pair in six.moves.zip_longest(outer_args, inner_args, fillvalue=IGNORE)
+    )
+
+    parse_kwargs = {}
+
+    for name in set(outer_kwargs) | set(inner_kwargs):
+        pair = (outer_kwargs.get(name, IGNORE), inner_kwargs.get(name, IGNORE))
+        # An argument either decorator names is not reported as unanalysed (eg: `x=IGNORE`):
+        parse_kwargs[name] = fuse(pair, keyword=True, merged=True)
+
+    return parse_args, parse_kwargs
@@ -0,0 +1,316 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT runtime metrics.
+# @module hoft.core.metrics
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import threading
+import weakref
+from bisect import bisect_left
+from collections import namedtuple
+from timeit import default_timer
+
+from hoft.core.binder import make_bind
+from hoft.core.config import state
+from hoft.core.observers import get_observers, notify_call_end, notify_call_start
+from hoft.core.parsers_sig import iter_sig_checks, parse_sig_unanalysed_inputs
+from hoft.core.utils import conditionally_raise_exc, get_func_name, raise_exc
+
+__all__ = [
+    'CallStats',
+    'DEFAULT_BUCKETS',
+    'Histogram',
+    'HistogramSnapshot',
+    'StatsSnapshot',
+    'ValidatorSnapshot',
+    'get_all_stats',
+    'make_measured_wrapper',
+    'reset_all_stats',
+]
+
+DEFAULT_BUCKETS = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3, 1e-2, 0.1, 1.0,
+)
+"""
+The default (upper, inclusive) histogram bucket bounds, in seconds.
+"""
+
+HistogramSnapshot = namedtuple('HistogramSnapshot', ('buckets', 'counts', 'count', 'sum'))
+"""
+A histogram's values.
+
+:param tuple buckets: The (upper, inclusive) bucket bounds.
+:param tuple counts: The number of values in each bucket, plus one for those above the last bound.
+:param int count: The number of values.
+:param float sum: The sum of the values.
+"""
+
+StatsSnapshot = namedtuple('StatsSnapshot', (
+    'name', 'calls', 'bind', 'analysis', 'validators', 'errors')
+)
+"""
+A decorated function's metrics.
+
+:param str name: The decorated function's (module qualified) name.
+:param int calls: The number of calls (analysed or not).
+:param HistogramSnapshot bind: The time spent binding arguments of analysed calls.
+:param HistogramSnapshot analysis: The time spent analysing calls (including binding).
+:param dict validators: The slot index and its `ValidatorSnapshot`.
+:param dict errors: The error type name (eg: 'PositionalError') and the number of them found.
+"""
+
+ValidatorSnapshot = namedtuple('ValidatorSnapshot', ('name', 'func_name', 'histogram'))
+"""
+A parser's metrics, for the slot it was applied for: the decorated function's call plan has a slot
+for each parser (positionals, then keywords, then those handled by `_default_`), so parsers of
+the same name (or applied to the same argument) are measured separately.
+
+:param str name: The argument name.
+:param Union[str|None] func_name: The parser name.
+:param HistogramSnapshot histogram: The time spent in the parser.
+"""
+
+
+class Histogram(object):
+    """
+    A fixed-bucket histogram.
+    """
+
+    __slots__ = ('buckets', 'counts', 'count', 'sum')
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.reset()
+
+    def record(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def reset(self):
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def snapshot(self):
+        """
+        :rtype:
+            HistogramSnapshot
+        """
+        return HistogramSnapshot(self.buckets, tuple(self.counts), self.count, self.sum)
+
+
+class CallStats(object):
+    """
+    The metrics of a decorated function (see `analyse_sig`'s `_metrics_` option).
+
+    The counters are not locked, so may be approximate when called from many threads at once.
+    """
+
+    def __init__(self, name, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.buckets = tuple(buckets)
+        self.calls = 0
+        self.bind = Histogram(self.buckets)
+        self.analysis = Histogram(self.buckets)
+        self.validators = {}
+        self.errors = {}
+
+        _register(self)
+
+    def validator(self, index, name, func):
+        """
+        Get the histogram for the parser `func` of argument `name`, applied for the slot `index`.
+        """
+        try:
+            return self.validators[index][2]
+        except KeyError:
+            histogram = Histogram(self.buckets)
+            self.validators[index] = (name, func, histogram)
+            return histogram
+
+    def count_error(self, error):
+        name = type(error).__name__
+        self.errors[name] = self.errors.get(name, 0) + 1
+
+    def reset(self):
+        self.calls = 0
+        self.bind.reset()
+        self.analysis.reset()
+        self.validators = {}
+        self.errors = {}
+
+    def snapshot(self):
+        """
+        :rtype:
+            StatsSnapshot
+        """
+        return StatsSnapshot(
+            self.name,
+            self.calls,
+            self.bind.snapshot(),
+            self.analysis.snapshot(),
+            {
+                index: ValidatorSnapshot(name, get_func_name(func), histogram.snapshot())
+                for index, (name, func, histogram) in list(self.validators.items())
+            },
+            dict(self.errors),
+        )
+
+
+_registry = weakref.WeakSet()
+_registry_lock = threading.Lock()
+
+
+def _register(stats):
+    with _registry_lock:
+        _registry.add(stats)
+
+
+def get_all_stats():
+    """
+    Get the metrics of every (live) decorated function with `_metrics_` enabled.
+
+    :return:
+        The metrics, ordered by function name.
+    :rtype:
+        List[StatsSnapshot]
+    """
+    with _registry_lock:
+        all_stats = list(_registry)
+
+    return sorted((stats.snapshot() for stats in all_stats), key=lambda snapshot: snapshot.name)
+
+
+def reset_all_stats():
+    """
+    Reset the metrics of every (live) decorated function with `_metrics_` enabled.
+    """
+    with _registry_lock:
+        all_stats = list(_registry)
+
+    for stats in all_stats:
+        stats.reset()
+
+
+def _slot_indexes(plan):
+    # The slots (which may not be hashable) are kept by the plan, so have fixed ids:
+    slots = plan.positionals + plan.keywords + plan.remaining
+    return {id(slot): index for index, slot in enumerate(slots)}
+
+
+def parse_all_sig_args_measured(plan, args, kwargs, callargs, errors, observers=(),
+                                slot_indexes=None):
+    """
+    Analyse a call, as `hoft.core.parsers_sig.parse_all_sig_args`, timing each parser and counting
+    the errors in `plan.stats` (and notifying the observers of each parser applied).
+    """
+    stats = plan.stats
+    name = stats.name
+
+    if slot_indexes is None:
+        slot_indexes = _slot_indexes(plan)
+
+    for invoke, make_error in iter_sig_checks(plan, args, kwargs, callargs):
+        # `invoke` is a partial of the parser and its arguments (the first being the name), and
+        # `make_error` of `hoft.core.errors.make_error` and its arguments (the second the slot):
+        histogram = stats.validator(
+            slot_indexes[id(make_error.args[1])], invoke.args[0], invoke.func)
+        error = None
+        start = default_timer()
+
+        try:
+            invoke()
+        except Exception as exc:
+            duration = default_timer() - start
+            error = make_error(exc)
+            errors.append(error)
+            stats.count_error(error)
+        else:
+            duration = default_timer() - start
+
+        histogram.record(duration)
+
+        for observer in observers:
+            observer.on_validator_done(
+                name, invoke.args[0], get_func_name(invoke.func), duration, error)
+
+        if error is not None:
+            conditionally_raise_exc(
+                exc=error.error,
+                on_error=plan.on_error,
+                errors=errors,
+                fail_fast=plan.fail_fast,
+            )
+
+    if plan.strict:
+        num_errors = len(errors)
+        parse_sig_unanalysed_inputs(plan, args, callargs, errors)
+
+        for error in errors[num_errors:]:
+            stats.count_error(error)
+
+    return errors
+
+
+def make_measured_wrapper(plan):
+    """
+    Make the (undecorated) wrapper which records the call's metrics in `plan.stats`, and notifies
+    any observers (see `hoft.core.observers.Observer`).
+
+    :param CallPlan plan:
+        The decorated function's call plan.
+    :return:
+        The wrapper.
+    :rtype:
+        callable
+    """
+    func = plan.func
+    stats = plan.stats
+    sampler = plan.sampler
+    bind = make_bind(plan)
+    slot_indexes = _slot_indexes(plan)
+
+    def wrapper(*args, **kwargs):
+        stats.calls += 1
+
+        if not state.checks or (sampler is not None and not sampler()):
+            return func(*args, **kwargs)
+
+        observers = get_observers()
+        errors = []
+
+        if observers:
+            notify_call_start(observers, stats.name, args, kwargs)
+
+        start = default_timer()
+
+        try:
+            callargs = bind(args, kwargs)
+            stats.bind.record(default_timer() - start)
+
+            parse_all_sig_args_measured(
+                plan, args, kwargs, callargs, errors, observers, slot_indexes)
+        finally:
+            duration = default_timer() - start
+            stats.analysis.record(duration)
+
+            if observers:
+                notify_call_end(observers, stats.name, duration, errors)
+
+        if errors and not plan.fail_fast:
+            # We have errors to raise which have not already been raised.
+            raise_exc(
+                exc=errors[0].error,
+                on_error=plan.on_error,
+                errors=errors,
+                fail_fast=plan.fail_fast,
+                force=True,
+            )
+
+        # Call the wrapped function:
+        return func(*args, **kwargs)
+
+    return wrapper
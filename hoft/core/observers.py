@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT observers.
+# @module hoft.core.observers
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import threading
+
+__all__ = [
+    'Observer',
+    'add_observer',
+    'get_observers',
+    'notify_call_end',
+    'notify_call_start',
+    'remove_observer',
+]
+
+
+class Observer(object):
+    """
+    Receives events from decorated functions: functions decorated with `analyse_sig` (but
+    coroutine functions), and functions decorated with `analyse_in`.
+
+    Every method does nothing, override those of interest. Observers are called synchronously
+    from the decorated function's wrapper, so should be cheap (eg: buffer, and export elsewhere).
+
+    `name` is always the decorated function's (module qualified) name.
+    """
+
+    def on_call_start(self, name, args, kwargs):
+        """
+        A call is about to be analysed.
+        """
+
+    def on_validator_done(self, name, arg_name, func_name, duration, error):
+        """
+        A parser has been applied to argument `arg_name` (only reported for `analyse_sig` with
+        the `_metrics_` option).
+
+        :param float duration: The time spent in the parser (in seconds).
+        :param error: The error record (eg: `PositionalError`), or None when the parser passed.
+        """
+
+    def on_error(self, name, error):
+        """
+        The analysis of a call found an error (reported just before `on_call_end`).
+
+        :param error: The error record (eg: `PositionalError`).
+        """
+
+    def on_call_end(self, name, duration, errors):
+        """
+        A call has been analysed.
+
+        :param float duration: The time spent analysing the call (in seconds).
+        :param list errors: The error records (empty when the call passed).
+        """
+
+
+_observers = ()
+_observers_lock = threading.Lock()
+
+
+def get_observers():
+    """
+    Get the registered observers.
+
+    :rtype:
+        tuple
+    """
+    return _observers
+
+
+def add_observer(observer):
+    """
+    Register an observer (see `Observer`) for every decorated function.
+    """
+    global _observers
+
+    # The (immutable) tuple is replaced, so wrappers can iterate it without locking:
+    with _observers_lock:
+        _observers = _observers + (observer,)
+
+
+def remove_observer(observer):
+    """
+    Unregister an observer.
+
+    :raises:
+        ValueError When the observer is not registered.
+    """
+    global _observers
+
+    with _observers_lock:
+        observers = list(_observers)
+        observers.remove(observer)
+        _observers = tuple(observers)
+
+
+def notify_call_start(observers, name, args, kwargs):
+    for observer in observers:
+        observer.on_call_start(name, args, kwargs)
+
+
+def notify_call_end(observers, name, duration, errors):
+    for error in errors:
+        for observer in observers:
+            observer.on_error(name, error)
+
+    for observer in observers:
+        observer.on_call_end(name, duration, errors)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT multi-process batch validation.
+# @module hoft.core.parallel
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import pickle
+from collections import namedtuple
+
+from hoft.core.batch import NO_ERRORS, get_call_plan, validate_rows
+from hoft.core.utils import (
+    ArgsNotAnalysedError, BindError, KeywordError, NotAnalysedError, PositionalError,
+    get_func_name,
+)
+
+__all__ = [
+    'DEFAULT_CHUNK_SIZE',
+    'ErrorRecord',
+    'RemoteError',
+    'validate_batch_parallel',
+]
+
+DEFAULT_CHUNK_SIZE = 1024
+"""
+The default number of rows sent to a worker at once.
+"""
+
+POSITIONAL = 'positional'
+KEYWORD = 'keyword'
+DEFAULT = 'default'
+UNANALYSED = 'unanalysed'
+BIND = 'bind'
+
+ErrorRecord = namedtuple('ErrorRecord', ('kind', 'name', 'index', 'value', 'exc'))
+"""
+A compact (picklable) error, as returned by a worker.
+
+The parsers and argspec are not sent back, the parent process already has them. The failing
+value is (as it cannot always be found in the row without binding it again).
+
+:param str kind: One of: 'positional', 'keyword', 'default', 'unanalysed', 'bind'.
+:param Union[str|list|None] name: The argument name (the argument names when 'unanalysed').
+:param Union[int|None] index: The argument index (None when not a positional).
+:param value: The argument value (the callargs when 'unanalysed', None when 'bind').
+:param Union[bytes|tuple] exc: The pickled exception, or its `(type name, message)` when it
+    cannot be pickled (and unpickled).
+"""
+
+
+class RemoteError(Exception):
+    """
+    A parser's exception which could not be sent back from a worker (eg: its constructor does not
+    accept its own `args`, so it cannot be unpickled).
+    """
+
+    def __init__(self, type_name, detail):
+        """
+        :param str type_name:
+            The name of the exception's type.
+        :param str detail:
+            The exception's message.
+        """
+        super(RemoteError, self).__init__('{t}: {d}'.format(t=type_name, d=detail))
+        self.type_name = type_name
+        self.detail = detail
+
+    def __reduce__(self):
+        return RemoteError, (self.type_name, self.detail)
+
+
+def _dump_exc(exc):
+    try:
+        dumped = pickle.dumps(exc, pickle.HIGHEST_PROTOCOL)
+        # The exception must also be rebuilt (by the parent process):
+        pickle.loads(dumped)
+    except Exception:  # NOQA
+        try:
+            detail = str(exc)
+        except Exception:  # NOQA
+            detail = repr(exc)
+        return type(exc).__name__, detail
+
+    return dumped
+
+
+def _load_exc(exc):
+    if isinstance(exc, tuple):
+        return RemoteError(*exc)
+
+    return pickle.loads(exc)
+
+
+class _Compactor(object):
+    """
+    Makes compact errors (see `ErrorRecord`) from the errors of a call.
+
+    An error is the `_default_` handler's unless its argument's parser was applied (the same
+    callable may be both), as `hoft.core.parsers_sig.parse_all_sig_args` does: a positional
+    parser when its argument is passed positionally (the handler otherwise), a keyword parser
+    always (its argument is never the handler's).
+    """
+
+    def __init__(self, plan):
+        self.positionals = frozenset(slot.index for slot in plan.positionals)
+        self.keywords = frozenset(slot.name for slot in plan.keywords)
+
+    def __call__(self, error, num_args):
+        exc = _dump_exc(error.error)
+
+        if isinstance(error, BindError):
+            return ErrorRecord(BIND, None, None, None, exc)
+        if isinstance(error, NotAnalysedError):
+            return ErrorRecord(UNANALYSED, error.name, None, error.callargs, exc)
+
+        if isinstance(error, PositionalError):
+            if error.index < num_args and error.index in self.positionals:
+                kind = POSITIONAL
+            else:
+                kind = DEFAULT
+            return ErrorRecord(kind, error.name, error.index, error.value, exc)
+
+        kind = KEYWORD if error.name in self.keywords else DEFAULT
+        return ErrorRecord(kind, error.name, None, error.value, exc)
+
+
+def _validate_chunk(func, rows):
+    """
+    Validate a chunk of rows (in a worker process), returning compact errors.
+    """
+    plan = get_call_plan(func)
+    compact = _Compactor(plan)
+
+    return [
+        [compact(error, len(args)) for error in errors] if errors else NO_ERRORS
+        for (args, _), errors in zip(rows, validate_rows(plan, rows))
+    ]
+
+
+class _Rehydrator(object):
+    """
+    Rebuilds the errors (as `validate_batch` returns them) from compact errors.
+    """
+
+    def __init__(self, plan):
+        self.plan = plan
+        self.positionals = {slot.index: slot for slot in plan.positionals}
+        self.keywords = {slot.name: slot for slot in plan.keywords}
+        self.default_name = get_func_name(plan.default)
+
+    def __call__(self, record, row):
+        exc = _load_exc(record.exc)
+        kind = record.kind
+
+        if kind == POSITIONAL:
+            slot = self.positionals[record.index]
+            return PositionalError(
+                exc, record.name, record.index, record.value, slot.func_name, slot.func)
+
+        if kind == KEYWORD:
+            slot = self.keywords[record.name]
+            return KeywordError(
+                exc, record.name, record.value, slot.default_value, slot.func_name, slot.func)
+
+        if kind == DEFAULT:
+            if record.index is None:
+                return KeywordError(
+                    exc, record.name, record.value, record.value, self.default_name,
+                    self.plan.default)
+            return PositionalError(
+                exc, record.name, record.index, record.value, self.default_name, self.plan.default)
+
+        if kind == UNANALYSED:
+            return NotAnalysedError(
+                ArgsNotAnalysedError(record.name), record.name, self.plan.argspec, record.value)
+
+        args, kwargs = row
+        return BindError(exc, args, kwargs)
+
+
+def _chunks(rows, chunk_size):
+    for start in range(0, len(rows), chunk_size):
+        yield rows[start:start + chunk_size]
+
+
+def validate_batch_parallel(func, rows, executor=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Validate many calls to a function decorated with `analyse_sig`, as `validate_batch`, across
+    many processes.
+
+    The rows are split into chunks, each chunk is validated by a worker which returns compact
+    `ErrorRecord`s, these are rebuilt into the usual errors by this process. So the decorated
+    function (which is pickled by reference, so must be importable) and its arguments must be
+    picklable. The parsers' exceptions are pickled (and have no traceback), those which cannot be
+    are rebuilt as a `RemoteError` (with the type name and message).
+
+    :param callable func:
+        The decorated function.
+    :param rows:
+        An iterable of `(args, kwargs)`, as would be passed to `func(*args, **kwargs)`.
+    :param concurrent.futures.Executor executor:
+        The executor to validate the chunks on, typically a `ProcessPoolExecutor`. When not
+        supplied, a `ProcessPoolExecutor` is created (with a worker per CPU) for the call.
+    :param int chunk_size:
+        The number of rows sent to a worker at once.
+    :return:
+        The errors for each row (in row order), as returned by `validate_batch`.
+    :rtype:
+        List[Union[List|tuple]]
+    :raises:
+        TypeError When the function is not decorated with `analyse_sig`.
+    """
+    plan = get_call_plan(func)
+    rows = [(args, kwargs or {}) for args, kwargs in rows]
+
+    if executor is None:
+        # Imported here as `concurrent.futures` is only a dependency when validating in parallel:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor() as executor:
+            return validate_batch_parallel(func, rows, executor=executor, chunk_size=chunk_size)
+
+    futures = [executor.submit(_validate_chunk, func, chunk) for chunk in _chunks(rows, chunk_size)]
+    rehydrate = _Rehydrator(plan)
+    results = []
+
+    for future in futures:
+        for records in future.result():
+            row = rows[len(results)]
+            results.append([rehydrate(record, row) for record in records] or NO_ERRORS)
+
+    return results
@@ -43,7 +43,9 @@ def parse_positional_inputs(parse_args, args, argspec, errors, on_error, fail_fa
                 )
 
 
-def parse_keyword_inputs(parse_kwargs, kwargs, argspec, errors, on_error, fail_fast):
+def parse_keyword_inputs(
+    parse_kwargs, kwargs, argspec, errors, on_error, fail_fast, sig_index=None,
+):
     # Parse the keyword inputs we name:
     for name, custom_parser_func in parse_kwargs.items():
         # Only (validate) if the func is provided:
@@ -57,7 +59,7 @@ def parse_keyword_inputs(parse_kwargs, kwargs, argspec, errors, on_error, fail_f
                 )
             except Exception as exc:
                 func_name = get_func_name(custom_parser_func)
-                default_value = get_default_value(name, argspec)
+                default_value = get_default_value(name, argspec, sig_index)
                 errors.append(
                     KeywordError(
                         exc,
@@ -77,7 +79,7 @@ def parse_keyword_inputs(parse_kwargs, kwargs, argspec, errors, on_error, fail_f
 
 
 def parse_all_in_args(
-    parse_args, parse_kwargs, args, kwargs, argspec, on_error, fail_fast,
+    parse_args, parse_kwargs, args, kwargs, argspec, on_error, fail_fast, sig_index=None,
 ):
     errors = []
 
@@ -97,6 +99,7 @@ def parse_all_in_args(
         errors,
         on_error,
         fail_fast,
+        sig_index,
     )
 
     return errors
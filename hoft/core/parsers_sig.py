@@ -6,198 +6,231 @@
 # @version 0.1
 # @copyright (c) 2017-present Francis Horsman.
 
-from hoft.core.sigs import get_default_value, get_signature
+import functools
+
+from hoft.core.errors import LazyErrors, make_error
 from hoft.core.utils import (
-    ArgsNotAnalysedError, IGNORE, KeywordError, NOVALUE, NotAnalysedError, PositionalError,
-    conditionally_raise_exc, get_func_name,
+    ArgsNotAnalysedError, NO_ERRORS, NOVALUE, NoDefaultError, NotAnalysedError,
+    conditionally_raise_exc,
 )
 
 
-def parse_sig_positional_inputs(
-    parse_args, args, argspec, errors, handled, on_error, fail_fast,
-):
+def _is_handled(slot, num_args):
+    # A positional parser has already been applied to this argument:
+    return slot.shadow is not None and slot.shadow < num_args
+
+
+def _report(plan, errors, exc, slot, value):
+    # The errors list is only created once there is an error to put in it:
+    if errors is None:
+        errors = LazyErrors(plan) if plan.lazy_errors else []
+
+    if isinstance(errors, LazyErrors):
+        # The record is made (from the plan) only when it is accessed:
+        errors.add(slot, value, exc)
+    else:
+        errors.append(make_error(plan, slot, value, exc))
+    conditionally_raise_exc(
+        exc=exc,
+        on_error=plan.on_error,
+        errors=errors,
+        fail_fast=plan.fail_fast,
+    )
+
+    return errors
+
+
+def parse_sig_positional_inputs(plan, args, errors=None):
+    num_args = len(args)
+
     # Parse the positional inputs:
-    for index, (custom_parser_func, value) in enumerate(zip(parse_args, args)):
-        # Only (validate) if the func is provided:
-        if custom_parser_func is not IGNORE:
-            name = argspec.args[index]
-
-            # Have we already handled this argument?
-            if name in handled:
-                continue
-
-            handled.update([name])
-
-            try:
-                custom_parser_func(
-                    name,
-                    index,
-                    value,
-                )
-            except Exception as exc:
-                func_name = get_func_name(custom_parser_func)
-                errors.append(
-                    PositionalError(
-                        exc,
-                        name,
-                        index,
-                        value,
-                        func_name,
-                        custom_parser_func,
-                    )
-                )
-                conditionally_raise_exc(
-                    exc=exc,
-                    on_error=on_error,
-                    errors=errors,
-                    fail_fast=fail_fast,
-                )
-
-
-def parse_sig_keyword_inputs(
-    parse_kwargs, kwargs, argspec, callargs, errors, handled, on_error, fail_fast,
-):
-    for name, custom_parser_func in sorted(parse_kwargs.items()):
-        if name in handled:
+    for slot in plan.positionals:
+        if slot.index >= num_args:
+            break
+
+        value = args[slot.index]
+
+        try:
+            slot.func(
+                slot.name,
+                slot.index,
+                value,
+            )
+        except Exception as exc:
+            errors = _report(plan, errors, exc, slot, value)
+
+    return errors
+
+
+def parse_sig_keyword_inputs(plan, args, kwargs, errors=None):
+    num_args = len(args)
+
+    for slot in plan.keywords:
+        if _is_handled(slot, num_args):
             continue
-        handled.update([name])
-
-        # Only (validate) if the func is provided:
-        if custom_parser_func is not IGNORE:
-            called_with_value = kwargs.get(name, NOVALUE)
-            default_value = get_default_value(name, argspec)
-            index = argspec.args.index(name)
-
-            try:
-                custom_parser_func(
-                    name,
-                    index,
-                    called_with_value,
-                    default_value=default_value,
-                )
-            except Exception as exc:
-                func_name = get_func_name(custom_parser_func)
-                errors.append(
-                    KeywordError(
-                        exc,
-                        name,
-                        called_with_value,
-                        default_value,
-                        func_name,
-                        custom_parser_func,
-                    )
-                )
-                conditionally_raise_exc(
-                    exc=exc,
-                    on_error=on_error,
-                    errors=errors,
-                    fail_fast=fail_fast,
-                )
-
-
-def parse_sig_remaining_inputs(
-    default, argspec, callargs, kwargs, errors, handled, on_error, fail_fast,
-):
-    sig = get_signature(argspec)
-
-    for name, value in sorted(callargs.items()):
-        if name in handled:
+
+        if slot.index is None:
+            raise NoDefaultError(slot.name, plan.argspec)
+
+        called_with_value = kwargs.get(slot.name, NOVALUE)
+
+        try:
+            slot.func(
+                slot.name,
+                slot.index,
+                called_with_value,
+                default_value=slot.default_value,
+            )
+        except Exception as exc:
+            errors = _report(plan, errors, exc, slot, called_with_value)
+
+    return errors
+
+
+def parse_sig_remaining_inputs(plan, args, callargs, errors=None):
+    num_args = len(args)
+    default = plan.default
+
+    for slot in plan.remaining:
+        if _is_handled(slot, num_args):
             continue
-        handled.update([name])
-
-        # Only (validate) if the func is provided:
-        if default is not IGNORE:
-            try:
-                default(name, value, argspec)
-            except Exception as exc:
-                func_name = get_func_name(default)
-                default_value = callargs[name]
-                try:
-                    index = sig.args.index(name)
-                except ValueError:
-                    errors.append(
-                        KeywordError(
-                            exc,
-                            name,
-                            value,
-                            default_value,
-                            func_name,
-                            default,
-                        )
-                    )
-                else:
-                    errors.append(
-                        PositionalError(
-                            exc,
-                            name,
-                            index,
-                            value,
-                            func_name,
-                            default,
-                        )
-                    )
-
-                conditionally_raise_exc(
-                    exc=exc,
-                    on_error=on_error,
-                    errors=errors,
-                    fail_fast=fail_fast,
-                )
-
-
-def parse_all_sig_args(
-    parse_args, parse_kwargs, args, kwargs, argspec, callargs, strict, default, on_error, fail_fast,
-):
-    errors = []
-    handled = set()
-
-    parse_sig_positional_inputs(
-        parse_args,
+
+        value = callargs[slot.name]
+
+        try:
+            default(slot.name, value, plan.argspec)
+        except Exception as exc:
+            errors = _report(plan, errors, exc, slot, value)
+
+    return errors
+
+
+def parse_sig_unanalysed_inputs(plan, args, callargs, errors=None):
+    num_args = len(args)
+    names = None
+
+    for slot in plan.unanalysed:
+        if not _is_handled(slot, num_args):
+            if names is None:
+                names = []
+            names.append(slot.name)
+
+    if names:
+        if errors is None:
+            errors = LazyErrors(plan) if plan.lazy_errors else []
+
+        try:
+            raise ArgsNotAnalysedError(names)
+        except ArgsNotAnalysedError as exc:
+            errors.append(NotAnalysedError(exc, names, None, callargs, plan.func))
+            conditionally_raise_exc(
+                exc=exc,
+                on_error=plan.on_error,
+                errors=errors,
+            )
+
+    return errors
+
+
+def parse_all_sig_args(plan, args, kwargs, callargs, errors=None):
+    """
+    Analyse a call.
+
+    Nothing is allocated for the errors unless there are any: when `errors` is not supplied and
+    the call passes, the (shared, empty) `NO_ERRORS` is returned.
+
+    :param CallPlan plan:
+        The decorated function's call plan.
+    :param list errors:
+        A list to append the errors to (optional).
+    :return:
+        The errors.
+    :rtype:
+        Union[list|tuple]
+    """
+    errors = parse_sig_positional_inputs(
+        plan,
         args,
-        argspec,
         errors,
-        handled,
-        on_error,
-        fail_fast,
     )
 
-    parse_sig_keyword_inputs(
-        parse_kwargs,
+    errors = parse_sig_keyword_inputs(
+        plan,
+        args,
         kwargs,
-        argspec,
-        callargs,
         errors,
-        handled,
-        on_error,
-        fail_fast,
     )
 
-    arg_names = set(callargs.keys())
+    if plan.remaining:
+        errors = parse_sig_remaining_inputs(
+            plan,
+            args,
+            callargs,
+            errors,
+        )
 
-    if default:
-        parse_sig_remaining_inputs(
-            default,
-            argspec,
+    if plan.strict:
+        errors = parse_sig_unanalysed_inputs(
+            plan,
+            args,
             callargs,
-            kwargs,
             errors,
-            handled,
-            on_error,
-            fail_fast,
         )
 
-    if strict:
-        names = sorted(list(arg_names - handled))
+    return NO_ERRORS if errors is None else errors
 
-        if names:
-            try:
-                raise ArgsNotAnalysedError(names)
-            except ArgsNotAnalysedError as exc:
-                errors.append(NotAnalysedError(exc, names, argspec, callargs))
-                conditionally_raise_exc(
-                    exc=exc,
-                    on_error=on_error,
-                    errors=errors,
-                )
 
-    return errors
+def iter_sig_checks(plan, args, kwargs, callargs):
+    """
+    Yield `(invoke, make_error)` for every parser to be applied to a call, in validation order
+    (for when the parsers are not simply called one after another).
+
+    `invoke()` applies the parser, `make_error(exc)` creates the error record for its exception.
+    """
+    num_args = len(args)
+
+    for slot in plan.positionals:
+        if slot.index >= num_args:
+            break
+
+        value = args[slot.index]
+
+        yield (
+            functools.partial(slot.func, slot.name, slot.index, value),
+            functools.partial(make_error, plan, slot, value),
+        )
+
+    for slot in plan.keywords:
+        if _is_handled(slot, num_args):
+            continue
+
+        if slot.index is None:
+            raise NoDefaultError(slot.name, plan.argspec)
+
+        value = kwargs.get(slot.name, NOVALUE)
+
+        yield (
+            functools.partial(
+                slot.func, slot.name, slot.index, value, default_value=slot.default_value),
+            functools.partial(make_error, plan, slot, value),
+        )
+
+    default = plan.default
+
+    for slot in plan.remaining:
+        if _is_handled(slot, num_args):
+            continue
+
+        value = callargs[slot.name]
+
+        yield (
+            functools.partial(default, slot.name, value, plan.argspec),
+            functools.partial(make_error, plan, slot, value),
+        )
+
+
+def order_errors(errors):
+    """
+    Order `(order, error)` pairs (as collected from `iter_sig_checks`) into a list of errors.
+    """
+    return [error for _, error in sorted(errors, key=lambda error: error[0])]
@@ -0,0 +1,262 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT call plans.
+# @module hoft.core.plan
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+from collections import namedtuple
+
+from hoft.core.binder import choose_binding, make_binder
+from hoft.core.sigs import get_argspec, get_signature_index
+from hoft.core.utils import IGNORE, NOVALUE, get_func_name
+
+__all__ = [
+    'CallPlan',
+    'ORDER_ALPHABETICAL',
+    'ORDER_DECLARATION',
+    'build_call_plan',
+]
+
+ORDER_ALPHABETICAL = 'alphabetical'
+"""
+Keyword parsers (and the `_default_` handler) are applied to arguments in alphabetical order.
+"""
+
+ORDER_DECLARATION = 'declaration'
+"""
+Keyword parsers (and the `_default_` handler) are applied to arguments in the order the decorated
+function declares them (`*args` then `**kwargs` last).
+"""
+
+ORDERS = (ORDER_ALPHABETICAL, ORDER_DECLARATION)
+
+PositionalSlot = namedtuple('PositionalSlot', ('index', 'name', 'func', 'func_name'))
+"""
+A positional parser bound to the decorated function's argument at `index`.
+"""
+
+KeywordSlot = namedtuple('KeywordSlot', (
+    'name', 'index', 'default_value', 'func', 'func_name', 'shadow')
+)
+"""
+A keyword parser bound to the decorated function's argument of `name`.
+
+`index` is None when the argument has no default value.
+`shadow` is the index of a positional parser for the same argument (or None). The keyword parser is
+skipped whenever the positional parser has already been applied.
+"""
+
+RemainingSlot = namedtuple('RemainingSlot', ('name', 'index', 'shadow'))
+"""
+An argument not named by any keyword parser, handled by `_default_` (or reported by `_strict_`).
+
+`index` is None when the argument is not a positional (ie: it is reported as a `KeywordError`).
+"""
+
+CallPlan = namedtuple('CallPlan', (
+    'func', 'argspec', 'sig_index', 'positionals', 'keywords', 'remaining', 'unanalysed',
+    'strict', 'default', 'on_error', 'fail_fast', 'sampler', 'stats', 'order', 'lazy_errors',
+    'binder', 'binding')
+)
+"""
+An immutable plan describing how to analyse every call to a decorated function.
+
+The plan is built once (when the function is decorated) so that each call only has to walk it.
+
+:param callable func: The decorated function.
+:param ArgSpec argspec: The decorated function's argspec.
+:param SignatureIndex sig_index: The decorated function's signature index.
+:param tuple positionals: `PositionalSlot`s in argument order.
+:param tuple keywords: `KeywordSlot`s in validation order.
+:param tuple remaining: `RemainingSlot`s passed to the `_default_` handler, in validation order.
+:param tuple unanalysed: `RemainingSlot`s reported when `_strict_` and not otherwise analysed.
+:param bool strict: The `_strict_` option.
+:param callable default: The `_default_` option.
+:param callable on_error: The `_on_error_` option.
+:param bool fail_fast: The `_fail_fast_` option.
+:param Sampler sampler: Decides which calls are analysed (None when every call is analysed).
+:param CallStats stats: The decorated function's metrics (None when not recorded).
+:param str order: The validation order, `ORDER_ALPHABETICAL` or `ORDER_DECLARATION`.
+:param bool lazy_errors: The `_lazy_errors_` option.
+:param Binder binder: Binds calls to the decorated function (see `hoft.core.binder`).
+:param str binding: How calls are bound, the cheapest for the parsers and options (see
+    `hoft.get_binding`).
+"""
+
+
+def _build_positional_slots(parse_args, sig_index):
+    slots = []
+
+    for index, custom_parser_func in enumerate(parse_args):
+        if custom_parser_func is IGNORE:
+            continue
+
+        try:
+            name = sig_index.args[index]
+        except IndexError:
+            raise IndexError(
+                'positional parser at index {i} has no matching named argument'.format(i=index))
+
+        slots.append(
+            PositionalSlot(index, name, custom_parser_func, get_func_name(custom_parser_func))
+        )
+
+    return tuple(slots)
+
+
+def _declared_names(argspec):
+    names = list(argspec.args)
+
+    if argspec.varargs:
+        names.append(argspec.varargs)
+
+    names.extend(getattr(argspec, 'kwonlyargs', None) or ())
+
+    if argspec.keywords:
+        names.append(argspec.keywords)
+
+    return names
+
+
+def _is_keyword_only(name, sig_index):
+    return sig_index.positions.get(name, -1) >= len(sig_index.args)
+
+
+def _order_key(order, argspec):
+    """
+    The sort key which puts argument names in validation order.
+    """
+    if order == ORDER_ALPHABETICAL:
+        return None
+
+    positions = {name: index for index, name in enumerate(_declared_names(argspec))}
+    # Names the function does not declare go last:
+    last = len(positions)
+
+    return lambda name: (positions.get(name, last), name)
+
+
+def _build_keyword_slots(parse_kwargs, sig_index, shadows, key):
+    slots = []
+
+    for name in sorted(parse_kwargs, key=key):
+        custom_parser_func = parse_kwargs[name]
+
+        if custom_parser_func is IGNORE:
+            continue
+
+        if name in sig_index.defaults:
+            default_value = sig_index.defaults[name]
+            index = sig_index.positions[name]
+        elif _is_keyword_only(name, sig_index):
+            # A required keyword-only argument (only ever passed by keyword):
+            default_value = NOVALUE
+            index = sig_index.positions[name]
+        else:
+            # Reported when (and only if) the parser is called upon:
+            default_value = NOVALUE
+            index = None
+
+        slots.append(
+            KeywordSlot(
+                name,
+                index,
+                default_value,
+                custom_parser_func,
+                get_func_name(custom_parser_func),
+                shadows.get(name),
+            )
+        )
+
+    return tuple(slots)
+
+
+def _build_remaining_slots(parse_kwargs, argspec, sig_index, shadows, key):
+    slots = []
+
+    for name in sorted(_declared_names(argspec), key=key):
+        # Keyword parsers (even when ignored) always handle their argument:
+        if name in parse_kwargs:
+            continue
+
+        index = sig_index.positions.get(name)
+
+        if index is not None and (
+            sig_index.has_defaults & (1 << index) or _is_keyword_only(name, sig_index)
+        ):
+            index = None
+
+        slots.append(RemainingSlot(name, index, shadows.get(name)))
+
+    return tuple(slots)
+
+
+def build_call_plan(
+    func, parse_args, parse_kwargs, strict=None, default=None, on_error=None, fail_fast=False,
+    sampler=None, stats=None, order=ORDER_ALPHABETICAL, lazy_errors=False, argspec=None,
+):
+    """
+    Build the plan used to analyse every call to `func`.
+
+    :param callable func:
+        The function being decorated.
+    :param tuple parse_args:
+        Positional parsers (as supplied to `analyse_sig`).
+    :param dict parse_kwargs:
+        Keyword parsers (as supplied to `analyse_sig`, without any options).
+    :param str order:
+        The order to apply keyword parsers (and the `_default_` handler) in: `ORDER_ALPHABETICAL`
+        or `ORDER_DECLARATION`.
+    :param ArgSpec argspec:
+        The argspec calls are analysed by, when not `func`'s own (eg: `func` is a wrapper of the
+        function with this argspec).
+    :return:
+        The call plan.
+    :rtype:
+        CallPlan
+    :raises:
+        IndexError When a positional parser has no matching named argument.
+        ValueError When the order is unknown.
+    """
+    if order not in ORDERS:
+        raise ValueError('unknown order: {o!r}, expected one of: {e}'.format(
+            o=order, e=', '.join(ORDERS)))
+
+    if argspec is None:
+        argspec = get_argspec(func)
+    sig_index = get_signature_index(argspec)
+
+    positionals = _build_positional_slots(parse_args, sig_index)
+    shadows = {slot.name: slot.index for slot in positionals}
+    key = _order_key(order, argspec)
+    keywords = _build_keyword_slots(parse_kwargs, sig_index, shadows, key)
+    remaining = _build_remaining_slots(parse_kwargs, argspec, sig_index, shadows, key)
+
+    # When a default handler is supplied every argument is analysed:
+    if default:
+        unanalysed = ()
+    else:
+        unanalysed = remaining
+        remaining = ()
+
+    return CallPlan(
+        func,
+        argspec,
+        sig_index,
+        positionals,
+        keywords,
+        remaining,
+        unanalysed,
+        strict,
+        default,
+        on_error,
+        fail_fast,
+        sampler,
+        stats,
+        order,
+        lazy_errors,
+        make_binder(func, argspec, sig_index),
+        choose_binding(keywords, remaining, unanalysed, strict),
+    )
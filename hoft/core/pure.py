@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT result cache for pure parsers.
+# @module hoft.core.pure
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import copy
+import threading
+from collections import OrderedDict
+
+from hoft.core.sigs import CacheInfo
+from hoft.core.utils import IGNORE, get_func_name
+
+try:
+    from inspect import isawaitable, iscoroutinefunction
+except ImportError:  # Python < 3.5
+    def isawaitable(value):
+        return False
+
+    def iscoroutinefunction(func):
+        return False
+
+__all__ = [
+    'DEFAULT_RESULT_CACHE_SIZE',
+    'PureParser',
+    'make_pure_parsers',
+    'pure',
+]
+
+DEFAULT_RESULT_CACHE_SIZE = 1024
+"""
+The default maximum number of results held for each pure parser.
+"""
+
+_PASSED = object()
+
+
+def _copy_exc(exc):
+    try:
+        return copy.copy(exc)
+    except Exception:  # NOQA
+        # eg: The exception's constructor does not accept its own args.
+        return None
+
+
+class PureParser(object):
+    """
+    A parser whose result depends only on its arguments (see `pure`): whether it passed, or the
+    exception it raised, is remembered for the most recently used arguments.
+
+    A remembered exception is raised as a copy (so each call's exception is its own). Calls with
+    unhashable arguments, or whose exception cannot be copied, are not remembered. Nor are calls
+    returning an awaitable: it is returned (to be awaited) as is.
+    """
+
+    def __init__(self, func, maxsize=DEFAULT_RESULT_CACHE_SIZE):
+        self.func = func
+        self.func_name = get_func_name(func)
+        self.__name__ = getattr(func, '__name__', self.func_name)
+        self.__doc__ = getattr(func, '__doc__', None)
+
+        if hasattr(func, 'validate_column'):
+            # Whole columns are validated as before (see `hoft.validate_columns`):
+            self.validate_column = func.validate_column
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(args, kwargs):
+        # Equal values of different types (eg: 1, 1.0 and True) are not interchangeable:
+        key = (args, tuple(type(arg) for arg in args))
+
+        if kwargs:
+            key += tuple(sorted(kwargs.items()))
+
+        return key
+
+    def __call__(self, *args, **kwargs):
+        key = self._key(args, kwargs)
+
+        try:
+            with self._lock:
+                result = self._results.pop(key)
+                # Most recently used results are last:
+                self._results[key] = result
+                self.hits += 1
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable, so cannot be remembered:
+            return self.func(*args, **kwargs)
+        else:
+            if result is _PASSED:
+                return None
+            raise _copy_exc(result)
+
+        self.misses += 1
+
+        try:
+            result = self.func(*args, **kwargs)
+        except Exception as exc:
+            template = _copy_exc(exc)
+
+            if template is not None:
+                self._put(key, template)
+            raise
+
+        if result is not None and isawaitable(result):
+            # Not known to have passed until awaited:
+            return result
+
+        self._put(key, _PASSED)
+
+    def _put(self, key, result):
+        with self._lock:
+            if self.maxsize == 0:
+                return
+
+            self._results[key] = result
+
+            while self.maxsize is not None and len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+                self.evictions += 1
+
+    def cache_info(self):
+        """
+        :rtype:
+            hoft.CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.evictions, self.maxsize, len(self._results))
+
+    def cache_clear(self):
+        with self._lock:
+            self._results.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __repr__(self):
+        return 'pure({f!r})'.format(f=self.func)
+
+
+def pure(func=None, maxsize=DEFAULT_RESULT_CACHE_SIZE):
+    """
+    Mark a parser as pure: its result (passing, or the exception raised) is remembered for each
+    of the `maxsize` most recently used values (and name, index...), and the parser is not called
+    again for them. The cache is shared by every function the parser is used for.
+
+    Only for parsers without side effects, which are called with hashable values (eg: enum
+    strings, small ints). Values of different types are never treated as the same. Async parsers
+    cannot be pure.
+
+    :param callable func:
+        The parser.
+    :param Union[int|None] maxsize:
+        The maximum number of results to remember (None=unbounded).
+    :return:
+        The pure parser (or a decorator making one, when `func` is not given).
+    :rtype:
+        PureParser
+    :raises:
+        TypeError When `func` is a coroutine function.
+
+    Example:
+
+    >>> @hoft.analyse_sig(hoft.pure(certify_int(min_value=0)), b=hoft.pure(_validate_tenant))
+    def foo(a, b=None):
+        ...
+
+    >>> @hoft.pure(maxsize=64)
+    def _validate_tenant(name, index, value, default_value=hoft.NOVALUE):
+        ...
+    """
+    if func is None:
+        return lambda func: pure(func, maxsize=maxsize)
+
+    if isinstance(func, PureParser):
+        return func
+
+    if iscoroutinefunction(func):
+        raise TypeError('an async parser cannot be pure: {f!r}'.format(f=func))
+
+    return PureParser(func, maxsize=maxsize)
+
+
+def make_pure_parsers(parse_args, parse_kwargs, maxsize=DEFAULT_RESULT_CACHE_SIZE):
+    """
+    Make every parser pure (see `analyse_sig`'s `_cache_` option), but for async parsers.
+
+    :return:
+        The `(parse_args, parse_kwargs)`.
+    :rtype:
+        tuple
+    """
+    def make_pure(custom_parser_func):
+        if custom_parser_func is IGNORE or iscoroutinefunction(custom_parser_func):
+            return custom_parser_func
+        return pure(custom_parser_func, maxsize=maxsize)
+
+    return (
+        tuple(make_pure(custom_parser_func) for custom_parser_func in parse_args),
+        {name: make_pure(custom_parser_func) for name, custom_parser_func in parse_kwargs.items()},
+    )
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT sampled analysis.
+# @module hoft.core.sampling
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import random
+from collections import namedtuple
+
+from hoft.core.batch import get_call_plan
+
+__all__ = [
+    'SampleStats',
+    'Sampler',
+    'get_sample_stats',
+    'make_sampler',
+]
+
+SampleStats = namedtuple('SampleStats', ('calls', 'sampled', 'skipped'))
+"""
+The number of calls made to a sampled function, and how many of them were (or were not) analysed.
+"""
+
+
+class Sampler(object):
+    """
+    Decides which calls to a decorated function are analysed.
+
+    Either a (random) fraction of calls are analysed (`rate`), or every `every`th call
+    (deterministically, starting with the first).
+
+    The counters are not locked, so may be approximate when called from many threads at once.
+    """
+
+    __slots__ = ('rate', 'every', 'calls', 'sampled', '_random')
+
+    def __init__(self, rate=None, every=None):
+        if (rate is None) == (every is None):
+            raise ValueError('exactly one of rate or every must be supplied')
+        if rate is not None and not 0 < rate <= 1:
+            raise ValueError('rate must be in (0, 1]: {r!r}'.format(r=rate))
+        if every is not None and (int(every) != every or every < 1):
+            raise ValueError('every must be a positive integer: {e!r}'.format(e=every))
+
+        self.rate = rate
+        self.every = every
+        self.calls = 0
+        self.sampled = 0
+        self._random = random.random
+
+    def __call__(self):
+        """
+        Count a call, returning True if it is to be analysed.
+        """
+        calls = self.calls
+        self.calls = calls + 1
+
+        if self.every is not None:
+            sampled = calls % self.every == 0
+        else:
+            sampled = self._random() < self.rate
+
+        if sampled:
+            self.sampled += 1
+
+        return sampled
+
+    def stats(self):
+        """
+        :rtype:
+            SampleStats
+        """
+        calls = self.calls
+        sampled = self.sampled
+
+        return SampleStats(calls, sampled, calls - sampled)
+
+    def reset(self):
+        self.calls = 0
+        self.sampled = 0
+
+
+def make_sampler(rate=None, every=None):
+    """
+    Make the sampler for the `_sample_rate_` and `_sample_every_` options of `analyse_sig`.
+
+    :return:
+        The sampler, or None when every call is to be analysed.
+    :rtype:
+        Union[Sampler|None]
+    :raises:
+        ValueError When the options are invalid.
+    """
+    if rate is None and every is None:
+        return None
+
+    return Sampler(rate=rate, every=every)
+
+
+def get_sample_stats(func):
+    """
+    Get the sampling counters of a function decorated with `analyse_sig`.
+
+    :param callable func:
+        The decorated function.
+    :return:
+        The counters, or None when the function's calls are not sampled.
+    :rtype:
+        Union[SampleStats|None]
+    :raises:
+        TypeError When the function is not decorated with `analyse_sig`.
+    """
+    sampler = get_call_plan(func).sampler
+
+    return sampler.stats() if sampler is not None else None
@@ -6,17 +6,39 @@
 # @version 0.1
 # @copyright (c) 2017-present Francis Horsman.
 
-from inspect import getargspec
+import threading
+import weakref
+from collections import OrderedDict, namedtuple
 
-from hoft.core.utils import NoDefaultError, Signature
+import six
+
+from hoft.core.utils import (
+    ArgSpec, KEYWORD_ONLY, NOVALUE, NoDefaultError, ParamTable, POSITIONAL_ONLY,
+    POSITIONAL_OR_KEYWORD, Signature, SignatureIndex, VAR_KEYWORD, VAR_POSITIONAL,
+)
+
+try:
+    from inspect import signature as _inspect_signature
+except ImportError:
+    # Python 2:
+    from inspect import getargspec
+    _inspect_signature = None
 
 __all__ = [
+    'CacheInfo',
+    'DEFAULT_CACHE_SIZE',
+    'clear_signature_cache',
+    'get_argspec',
+    'get_signature_cache_info',
+    'set_signature_cache_size',
     'num_keywords',
     'num_positionals',
     'get_keywords',
     'get_positionals',
     'get_default_value',
+    'get_params',
     'get_signature',
+    'get_signature_index',
     'signature',
 ]
 
@@ -46,8 +68,10 @@ def num_positionals(argspec, num_keyword_args=None):
         Number of positional arguments.
     :rtype: int
     """
-    return len(argspec.args) - num_keyword_args if num_keyword_args is not None else num_keywords(
-        argspec)
+    if num_keyword_args is None:
+        num_keyword_args = num_keywords(argspec)
+
+    return len(argspec.args) - num_keyword_args
 
 
 def get_positionals(argspec, num_positional_args=None):
@@ -78,20 +102,28 @@ def get_keywords(argspec, num_positional_args=None):
     :param int num_positional_args:
         Number of positional arguments already known (if any, if not then they will be calculated).
     :return:
-        A dictionary containing the keyword names and their associated default values.
+        A dictionary containing the keyword names and their associated default values (`NOVALUE`
+        for a keyword-only argument without one).
     :rtype:
         Dict[str, int]
     """
     num_positional_args = num_positional_args if num_positional_args is not None else \
         num_positionals(argspec)
 
-    return {
+    keywords = {
         name: default_value
         for name, default_value in zip(argspec.args[num_positional_args:], argspec.defaults or [])
     }
 
+    kwonlydefaults = _kwonlydefaults(argspec)
+
+    for name in _kwonlyargs(argspec):
+        keywords[name] = kwonlydefaults.get(name, NOVALUE)
+
+    return keywords
 
-def get_default_value(name, argspec):
+
+def get_default_value(name, argspec, sig_index=None):
     """
     Get the default value for the keyword argument of name.
 
@@ -99,14 +131,27 @@ def get_default_value(name, argspec):
         The name to get the default keyword argument value for.
     :param inspect.ArgSpec argspec:
         A previously obtained argspec.
+    :param SignatureIndex sig_index:
+        The argspec's index (see `get_signature_index`), when already held: a constant time
+        lookup. Otherwise the argspec is scanned (once), rather than looking up its index.
     :return:
         The default_value present in the method's signature.
     :raises:
         NoDefaultError When no default value can or does exist fo the name.
     """
+    if sig_index is not None:
+        try:
+            return sig_index.defaults[name]
+        except (KeyError, TypeError):
+            raise NoDefaultError(name, argspec)
+
     try:
         default_index = argspec.args.index(name) - len(argspec.args)
     except ValueError:
+        kwonlydefaults = _kwonlydefaults(argspec)
+
+        if name in kwonlydefaults:
+            return kwonlydefaults[name]
         raise NoDefaultError(name, argspec)
 
     try:
@@ -115,34 +160,391 @@ def get_default_value(name, argspec):
         raise NoDefaultError(name, argspec)
 
 
+def _kwonlyargs(argspec):
+    # An `inspect.ArgSpec` has no keyword-only arguments:
+    return getattr(argspec, 'kwonlyargs', None) or ()
+
+
+def _kwonlydefaults(argspec):
+    return getattr(argspec, 'kwonlydefaults', None) or {}
+
+
+def _make_index(argspec):
+    args = tuple(argspec.args)
+    defaults = argspec.defaults or ()
+    first_default = len(args) - len(defaults)
+    kwonlyargs = tuple(_kwonlyargs(argspec))
+    kwonlydefaults = _kwonlydefaults(argspec)
+
+    # Nested (unpacked) arguments have no name:
+    named = [
+        (position, name) for position, name in enumerate(args)
+        if isinstance(name, six.string_types)
+    ]
+    positions = {name: position for position, name in named}
+    positions.update((name, len(args) + offset) for offset, name in enumerate(kwonlyargs))
+
+    index_defaults = {
+        name: defaults[position - first_default] for position, name in named
+        if position >= first_default
+    }
+    index_defaults.update(kwonlydefaults)
+    has_defaults = sum(1 << position for position in range(first_default, len(args)))
+    has_defaults |= sum(1 << positions[name] for name in kwonlydefaults)
+
+    return SignatureIndex(args, positions, index_defaults, has_defaults)
+
+
+def _make_signature(argspec):
+    num_keyword_args = num_keywords(argspec)
+    num_positional_args = num_positionals(argspec, num_keyword_args=num_keyword_args)
+    positionals = get_positionals(argspec, num_positional_args=num_positional_args)
+    keywords = get_keywords(argspec, num_positional_args=num_positional_args)
+
+    return Signature(positionals, argspec.varargs, keywords, argspec.keywords or None)
+
+
+def _params_from_signature(func):
+    try:
+        sig = _inspect_signature(func, follow_wrapped=False)
+    except ValueError as exc:
+        # eg: A builtin without a signature (`inspect.getargspec` raised a TypeError):
+        raise TypeError(str(exc))
+
+    params = sig.parameters.values()
+    empty = sig.empty
+
+    return ParamTable(
+        tuple(param.name for param in params),
+        tuple(int(param.kind) for param in params),
+        tuple(NOVALUE if param.default is empty else param.default for param in params),
+        tuple(NOVALUE if param.annotation is empty else param.annotation for param in params),
+    )
+
+
+def _params_from_argspec(func):
+    argspec = getargspec(func)
+    defaults = argspec.defaults or ()
+    names = list(argspec.args)
+    kinds = [POSITIONAL_OR_KEYWORD] * len(names)
+    param_defaults = [NOVALUE] * (len(names) - len(defaults)) + list(defaults)
+
+    for name, kind in ((argspec.varargs, VAR_POSITIONAL), (argspec.keywords, VAR_KEYWORD)):
+        if name:
+            names.append(name)
+            kinds.append(kind)
+            param_defaults.append(NOVALUE)
+
+    return ParamTable(tuple(names), tuple(kinds), tuple(param_defaults), (NOVALUE,) * len(names))
+
+
+def _make_params(func):
+    """
+    Build a function's parameter table, with `inspect.signature` (or `inspect.getargspec` on
+    Python 2). Only called once per function: the table is cached.
+    """
+    if _inspect_signature is None:
+        return _params_from_argspec(func)
+
+    return _params_from_signature(func)
+
+
+def _make_argspec(params):
+    args = []
+    posonlyargs = []
+    kwonlyargs = []
+    defaults = []
+    kwonlydefaults = {}
+    annotations = {}
+    varargs = keywords = None
+
+    for name, kind, default_value, annotation in zip(*params):
+        if kind == VAR_POSITIONAL:
+            varargs = name
+        elif kind == VAR_KEYWORD:
+            keywords = name
+        elif kind == KEYWORD_ONLY:
+            kwonlyargs.append(name)
+
+            if default_value is not NOVALUE:
+                kwonlydefaults[name] = default_value
+        else:
+            args.append(name)
+
+            if kind == POSITIONAL_ONLY:
+                posonlyargs.append(name)
+            if default_value is not NOVALUE:
+                defaults.append(default_value)
+
+        if annotation is not NOVALUE:
+            annotations[name] = annotation
+
+    return ArgSpec(
+        args,
+        varargs,
+        keywords,
+        tuple(defaults) or None,
+        kwonlyargs,
+        kwonlydefaults or None,
+        annotations,
+        posonlyargs,
+    )
+
+
+DEFAULT_CACHE_SIZE = 2048
+"""
+The default maximum number of entries held by the signature cache.
+"""
+
+CacheInfo = namedtuple('CacheInfo', ('hits', 'misses', 'evictions', 'maxsize', 'currsize'))
+"""
+Signature cache statistics (see `get_signature_cache_info`).
+
+:param int hits: Number of lookups satisfied by the cache.
+:param int misses: Number of lookups that had to be computed.
+:param int evictions: Number of entries evicted to keep within `maxsize`.
+:param Union[int|None] maxsize: Maximum number of entries (None=unbounded).
+:param int currsize: Current number of entries.
+"""
+
+_FunctionEntry = namedtuple(
+    '_FunctionEntry', ('ref', 'defaults', 'kwdefaults', 'params', 'argspec', 'signature', 'index'))
+_ArgSpecEntry = namedtuple('_ArgSpecEntry', ('argspec', 'signature', 'index'))
+
+
+class _SignatureCache(object):
+    """
+    A bounded (least recently used) cache of parameter tables, argspecs and signatures.
+
+    Functions are keyed on their code object, which is only weakly referenced, so entries do not
+    outlive reloaded modules or discarded lambdas. Argspecs are keyed on their contents (defaults
+    by identity).
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+
+            if entry is not None:
+                # Most recently used entries are last:
+                self._entries[key] = entry
+
+            return entry
+
+    def _put(self, key, entry):
+        with self._lock:
+            if self.maxsize == 0:
+                return
+
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+
+            while self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _discard(self, key, ref):
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry.ref is ref:
+                del self._entries[key]
+
+    def function_entry(self, func):
+        func = getattr(func, '__func__', func)
+        code = getattr(func, '__code__', None)
+
+        if code is None:
+            # Not a python function, let inspect complain as required:
+            return self._make_function_entry(None, None, None, func)
+
+        key = ('code', id(code))
+        defaults = func.__defaults__
+        kwdefaults = getattr(func, '__kwdefaults__', None)
+
+        with self._lock:
+            entry = self._get(key)
+
+            # A code object can be shared by functions with different defaults (eg: closures):
+            if entry is not None and entry.ref() is code and entry.defaults is defaults and \
+                    entry.kwdefaults is kwdefaults:
+                self.hits += 1
+                return entry
+
+            self.misses += 1
+            ref = weakref.ref(code, lambda r, key=key: self._discard(key, r))
+            entry = self._make_function_entry(ref, defaults, kwdefaults, func)
+            self._put(key, entry)
+
+        return entry
+
+    @staticmethod
+    def _make_function_entry(ref, defaults, kwdefaults, func):
+        params = _make_params(func)
+        argspec = _make_argspec(params)
+
+        return _FunctionEntry(
+            ref, defaults, kwdefaults, params, argspec, _make_signature(argspec),
+            _make_index(argspec))
+
+    def argspec_entry(self, argspec):
+        try:
+            key = (
+                'argspec',
+                tuple(argspec.args),
+                argspec.varargs,
+                argspec.keywords,
+                # The entry holds the argspec (and so its defaults) which keeps these ids unique:
+                tuple(id(value) for value in argspec.defaults or ()),
+                tuple(_kwonlyargs(argspec)),
+                tuple((name, id(value)) for name, value in sorted(
+                    _kwonlydefaults(argspec).items())),
+            )
+            hash(key)
+        except TypeError:
+            # Unhashable (eg: nested arguments), cannot be cached:
+            return _ArgSpecEntry(argspec, _make_signature(argspec), _make_index(argspec))
+
+        with self._lock:
+            entry = self._get(key)
+
+            if entry is not None:
+                self.hits += 1
+                return entry
+
+            self.misses += 1
+            entry = _ArgSpecEntry(argspec, _make_signature(argspec), _make_index(argspec))
+            self._put(key, entry)
+
+        return entry
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.evictions, self.maxsize, len(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def resize(self, maxsize):
+        with self._lock:
+            self.maxsize = maxsize
+
+            while maxsize is not None and len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+
+_cache = _SignatureCache()
+
+
+def get_params(func):
+    """
+    Obtain a method's parameter table (cached), built once with `inspect.signature`.
+
+    :param callable func:
+        Method to obtain the parameters of.
+    :return:
+        The method's parameters, this is shared and must not be modified.
+    :rtype:
+        ParamTable
+    :raises:
+        TypeError When the parameters cannot be determined.
+    """
+    return _cache.function_entry(func).params
+
+
+def get_argspec(func):
+    """
+    Obtain a method's argspec (cached), from its parameter table (see `get_params`).
+
+    :param callable func:
+        Method to obtain the argspec for.
+    :return:
+        The method's argspec, this is shared and must not be modified.
+    :rtype:
+        ArgSpec
+    """
+    return _cache.function_entry(func).argspec
+
+
 def get_signature(argspec):
     """
-    Obtain a Signature from an argspec
+    Obtain a Signature from an argspec (cached).
 
     :param inspect.ArgSpec argspec:
         A previously obtained argspec.
     :return:
-        The signature.
+        The signature, this is shared and must not be modified.
     :rtype:
         Signature
     """
-    num_keyword_args = num_keywords(argspec)
-    num_positional_args = num_positionals(argspec, num_keyword_args=num_keyword_args)
-    positionals = get_positionals(argspec, num_positional_args=num_positional_args)
-    keywords = get_keywords(argspec, num_positional_args=num_positional_args)
+    return _cache.argspec_entry(argspec).signature
 
-    return Signature(positionals, argspec.varargs, keywords, argspec.keywords or None)
+
+def get_signature_index(argspec):
+    """
+    Obtain a SignatureIndex (constant time name to position and default value lookups) from an
+    argspec (cached).
+
+    :param inspect.ArgSpec argspec:
+        A previously obtained argspec.
+    :return:
+        The signature index, this is shared and must not be modified.
+    :rtype:
+        SignatureIndex
+    """
+    return _cache.argspec_entry(argspec).index
 
 
 def signature(func):
     """
-    Obtain a method's Signature.
+    Obtain a method's Signature (cached).
 
     :param callable func:
         Method to obtain the signature for.
     :return:
-        The method's signature.
+        The method's signature, this is shared and must not be modified.
     :rtype:
         Signature
     """
-    return get_signature(getargspec(func))
+    return _cache.function_entry(func).signature
+
+
+def get_signature_cache_info():
+    """
+    Obtain the process-wide signature cache statistics.
+
+    :return:
+        The cache statistics.
+    :rtype:
+        CacheInfo
+    """
+    return _cache.info()
+
+
+def clear_signature_cache():
+    """
+    Empty the process-wide signature cache and reset its statistics.
+    """
+    _cache.clear()
+
+
+def set_signature_cache_size(maxsize):
+    """
+    Set the maximum number of entries held by the process-wide signature cache.
+
+    :param Union[int|None] maxsize:
+        Maximum number of entries, None=unbounded, 0=disabled.
+    """
+    _cache.resize(maxsize)
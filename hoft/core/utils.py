@@ -6,24 +6,151 @@
 # @version 0.1
 # @copyright (c) 2017-present Francis Horsman.
 
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 
-PositionalError = namedtuple('PositionalError', (
-    'error', 'name', 'index', 'value', 'func_name', 'func')
-)
 
-KeywordError = namedtuple('KeywordError', (
-    'error', 'name', 'value', 'default_value', 'func_name', 'func')
-)
+class _Record(object):
+    """
+    A compact error record: a `__slots__` object which can be used as (and compares equal to)
+    the tuple of its `_fields`, as the namedtuples it replaces.
+    """
 
-NotAnalysedError = namedtuple('NotAnalysedError', (
-    'error', 'name', 'argspec', 'callargs')
-)
+    __slots__ = ()
+    _fields = ()
+
+    def __iter__(self):
+        return (getattr(self, field) for field in self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __getitem__(self, index):
+        return tuple(self)[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (tuple, _Record)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return '{t}({f})'.format(t=type(self).__name__, f=', '.join(
+            '{k}={v!r}'.format(k=field, v=value) for field, value in zip(self._fields, self)))
+
+    def __reduce__(self):
+        return type(self), self._state()
+
+    def _state(self):
+        # The constructor's arguments:
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+    def _asdict(self):
+        return OrderedDict(zip(self._fields, self))
+
+    def _replace(self, **kwargs):
+        return type(self)(*(kwargs.pop(field, value) for field, value in zip(self._fields, self)))
+
+
+class PositionalError(_Record):
+    """
+    A parser failed for an argument passed positionally.
+
+    `func_name` is only worked out (from `func`) when used, unless given.
+    """
+
+    __slots__ = ('error', 'name', 'index', 'value', '_func_name', 'func')
+    _fields = ('error', 'name', 'index', 'value', 'func_name', 'func')
+
+    def __init__(self, error, name, index, value, func_name=None, func=None):
+        self.error = error
+        self.name = name
+        self.index = index
+        self.value = value
+        self._func_name = func_name
+        self.func = func
+
+    @property
+    def func_name(self):
+        if self._func_name is None:
+            return get_func_name(self.func)
+        return self._func_name
+
+
+class KeywordError(_Record):
+    """
+    A parser failed for an argument passed by keyword (or not passed).
+
+    `func_name` is only worked out (from `func`) when used, unless given.
+    """
+
+    __slots__ = ('error', 'name', 'value', 'default_value', '_func_name', 'func')
+    _fields = ('error', 'name', 'value', 'default_value', 'func_name', 'func')
+
+    def __init__(self, error, name, value, default_value, func_name=None, func=None):
+        self.error = error
+        self.name = name
+        self.value = value
+        self.default_value = default_value
+        self._func_name = func_name
+        self.func = func
+
+    func_name = PositionalError.func_name
+
+
+class NotAnalysedError(_Record):
+    """
+    Arguments were not analysed (when `strict=True`).
+
+    Given the decorated function (`func`), the `argspec` is only looked up when used.
+    """
+
+    __slots__ = ('error', 'name', '_argspec', 'callargs', 'func')
+    _fields = ('error', 'name', 'argspec', 'callargs')
+
+    def __init__(self, error, name, argspec=None, callargs=None, func=None):
+        self.error = error
+        self.name = name
+        self._argspec = argspec
+        self.callargs = callargs
+        self.func = func
+
+    @property
+    def argspec(self):
+        if self._argspec is None and self.func is not None:
+            from hoft.core.sigs import get_argspec
+            return get_argspec(self.func)
+        return self._argspec
+
+
+class BindError(_Record):
+    """
+    The arguments do not match the function's signature.
+    """
+
+    __slots__ = ('error', 'args', 'kwargs')
+    _fields = __slots__
+
+    def __init__(self, error, args, kwargs):
+        self.error = error
+        self.args = args
+        self.kwargs = kwargs
+
+
+NO_ERRORS = ()
+"""
+The (shared) result when no errors were found.
+"""
 
 Signature = namedtuple(
     'Signature', ('args', 'vaargs', 'kwargs', 'keywords')
 )
-"""
+r"""
 A Signature representing a parsed argspec for a function:
 
 :param list args: The positional argument names.
@@ -36,6 +163,95 @@ A Signature representing a parsed argspec for a function:
 
 """
 
+SignatureIndex = namedtuple(
+    'SignatureIndex', ('args', 'positions', 'defaults', 'has_defaults')
+)
+r"""
+A compact lookup table for a parsed argspec (see `hoft.core.sigs.get_signature_index`):
+
+:param tuple args: The argument names (in declaration order).
+:param dict positions: The argument names and their associated positions.
+:param dict defaults: The keyword argument names and associated default values.
+:param int has_defaults: A bitmap, bit `n` is set when the argument at position `n` has a default.
+
+**Example**:
+    def func(a, b, c=1, \**d) === SignatureIndex(('a', 'b', 'c'), {'a': 0, 'b': 1, 'c': 2},
+                                                 {'c': 1}, 0b100)
+
+Keyword-only arguments follow the positional arguments: they have positions (and defaults) but
+are not in `args`.
+
+"""
+
+POSITIONAL_ONLY = 0
+POSITIONAL_OR_KEYWORD = 1
+VAR_POSITIONAL = 2
+KEYWORD_ONLY = 3
+VAR_KEYWORD = 4
+"""
+The kinds of parameter (as `inspect.Parameter.kind`).
+"""
+
+ParamTable = namedtuple(
+    'ParamTable', ('names', 'kinds', 'defaults', 'annotations')
+)
+r"""
+A function's parameters, as columns (see `hoft.core.sigs.get_params`):
+
+:param tuple names: The parameter names (in declaration order).
+:param tuple kinds: The kind of each parameter, eg: `KEYWORD_ONLY`.
+:param tuple defaults: The default value of each parameter (`NOVALUE` when it has none).
+:param tuple annotations: The annotation of each parameter (`NOVALUE` when it has none).
+
+**Example**:
+    def func(a, b: int, *c, d=1, \**e) === ParamTable(
+        ('a', 'b', 'c', 'd', 'e'),
+        (POSITIONAL_OR_KEYWORD, POSITIONAL_OR_KEYWORD, VAR_POSITIONAL, KEYWORD_ONLY, VAR_KEYWORD),
+        (NOVALUE, NOVALUE, NOVALUE, 1, NOVALUE),
+        (NOVALUE, int, NOVALUE, NOVALUE, NOVALUE),
+    )
+
+"""
+
+
+class ArgSpec(namedtuple('ArgSpec', ('args', 'varargs', 'keywords', 'defaults'))):
+    """
+    A function's argspec (see `hoft.core.sigs.get_argspec`). As `inspect.getargspec`, it is a
+    tuple of four fields, the others `inspect.getfullargspec` adds are attributes:
+
+    :param list args: The positional argument names (including `posonlyargs`).
+    :param Union[string|None] varargs: The positional varargs name (eg after a `*`).
+    :param Union[string|None] keywords: The keyword varkwargs name (eg: after a `**`).
+    :param Union[tuple|None] defaults: The default values of the last positional arguments.
+    :param list kwonlyargs: The keyword-only argument names.
+    :param Union[dict|None] kwonlydefaults: The keyword-only argument names and default values.
+    :param dict annotations: The argument names and their annotations.
+    :param list posonlyargs: The positional-only argument names (the first of `args`).
+    """
+
+    _extra_fields = ('kwonlyargs', 'kwonlydefaults', 'annotations', 'posonlyargs')
+
+    def __new__(cls, args, varargs, keywords, defaults, kwonlyargs=(), kwonlydefaults=None,
+                annotations=None, posonlyargs=()):
+        self = super(ArgSpec, cls).__new__(cls, args, varargs, keywords, defaults)
+        self.kwonlyargs = list(kwonlyargs)
+        self.kwonlydefaults = kwonlydefaults
+        self.annotations = annotations or {}
+        self.posonlyargs = list(posonlyargs)
+        return self
+
+    def __reduce__(self):
+        return type(self), tuple(self) + self._extra()
+
+    def _extra(self):
+        return tuple(getattr(self, field) for field in self._extra_fields)
+
+    def _replace(self, **kwargs):
+        values = tuple(self) + self._extra()
+        return type(self)(*(kwargs.pop(field, value) for field, value in zip(
+            self._fields + self._extra_fields, values)))
+
+
 IGNORE = None
 """
 Use this to tell hoft to ignore a function argument when analysing it.
@@ -90,6 +306,12 @@ class NoDefaultError(Exception):
 
 
 def get_func_name(func):
+    try:
+        # Python 3 functions have no `func_name`:
+        return func.__name__
+    except AttributeError:
+        pass
+
     try:
         return func.func_name
     except Exception:  # NOQA
@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# HOFT declarative constraints.
+# @module hoft.spec
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+"""
+Declarative constraints, which may be used anywhere `analyse_sig` accepts a parser, eg:
+
+    @hoft.analyse_sig(Int(min=0), name=Str(max_len=64, pattern=r'[a-z]+'),
+                      mode=OneOf('r', 'w'), limit=Optional(Int(min=1)))
+    def foo(count, name='x', mode='r', limit=None):
+        ...
+
+Rather than calling a parser, the checks are generated (and compiled) when decorating, so each
+argument costs one call however many constraints it has (see `hoft.core.fusion.fuse`).
+
+A failing constraint raises a `SpecError`, reported (as for any parser) as a `PositionalError` or
+`KeywordError`. A keyword argument which is not passed is not checked (its default is used).
+"""
+
+import abc
+import re
+
+import six
+
+from hoft.core.fusion import fuse
+from hoft.core.utils import NOVALUE
+
+__all__ = [
+    'Int',
+    'OneOf',
+    'Optional',
+    'Spec',
+    'SpecError',
+    'Str',
+]
+
+
+class SpecError(ValueError):
+    """
+    An argument does not meet its constraint.
+    """
+
+    def __init__(self, name, value, reason):
+        """
+        :param str name:
+            The argument name.
+        :param value:
+            The argument value.
+        :param str reason:
+            What the value should have been, eg: 'must be <= 3'.
+        """
+        super(SpecError, self).__init__(
+            '{n}: {r}, got: {v!r}'.format(n=name, r=reason, v=value))
+        self.name = name
+        self.value = value
+        self.reason = reason
+
+
+def _indent(lines):
+    return ['    ' + line for line in lines]
+
+
+@six.add_metaclass(abc.ABCMeta)
+class Spec(object):
+    """
+    A declarative constraint: a parser (ie: `spec(name, index, value, default_value=NOVALUE)`)
+    whose check can be generated in place (see `__hoft_inline__`). Subclasses implement `lines`.
+    """
+
+    _check = None
+
+    @abc.abstractmethod
+    def lines(self, value, prefix, namespace):
+        """
+        The source of the check: statements which raise `SpecError` (as `{prefix}error`) when the
+        variable `value` does not meet the constraint. Any other globals used are added to
+        `namespace` (named with the `prefix`).
+
+        :rtype:
+            List[str]
+        """
+
+    def __hoft_inline__(self, value, prefix):
+        namespace = {prefix + 'error': SpecError, prefix + 'NOVALUE': NOVALUE}
+        lines = ['if {v} is not {p}NOVALUE:'.format(v=value, p=prefix)]
+        lines.extend(_indent(self.lines(value, prefix, namespace)))
+
+        return lines, namespace
+
+    def __call__(self, name, index, value, default_value=NOVALUE):
+        if self._check is None:
+            self._check = fuse([self])
+
+        self._check(name, index, value)
+
+    @property
+    def func_name(self):
+        return repr(self)
+
+    def _raise(self, value, prefix, reason):
+        return '    raise {p}error(name, {v}, {r!r})'.format(p=prefix, v=value, r=reason)
+
+    def _bound(self, lines, operand, prefix, namespace, field, operator, reason, value=None):
+        # eg: `if value < _hoft_0_min: raise ...`, when `self.min` is given.
+        bound = getattr(self, field)
+
+        if bound is not None:
+            namespace[prefix + field] = bound
+            lines.append('if {o} {op} {p}{f}:'.format(o=operand, op=operator, p=prefix, f=field))
+            lines.append(self._raise(value or operand, prefix, reason.format(b=bound)))
+
+    def __repr__(self):
+        return '{t}({a})'.format(t=type(self).__name__, a=', '.join(
+            '{k}={v!r}'.format(k=key, v=value)
+            for key, value in sorted(vars(self).items())
+            if not key.startswith('_') and value is not None
+        ))
+
+
+class Int(Spec):
+    """
+    An int (not a bool), optionally between `min` and `max` (inclusive).
+    """
+
+    def __init__(self, min=None, max=None):
+        self.min = min
+        self.max = max
+
+    def lines(self, value, prefix, namespace):
+        namespace[prefix + 'types'] = six.integer_types
+        lines = [
+            'if not isinstance({v}, {p}types) or {v} is True or {v} is False:'.format(
+                v=value, p=prefix),
+            self._raise(value, prefix, 'must be an int'),
+        ]
+
+        for field, operator, reason in (
+            ('min', '<', 'must be >= {b!r}'),
+            ('max', '>', 'must be <= {b!r}'),
+        ):
+            self._bound(lines, value, prefix, namespace, field, operator, reason)
+
+        return lines
+
+
+class Str(Spec):
+    """
+    A string, optionally of between `min_len` and `max_len` characters (inclusive), and matching
+    the regular expression `pattern` (in full).
+    """
+
+    def __init__(self, min_len=None, max_len=None, pattern=None):
+        self.min_len = min_len
+        self.max_len = max_len
+        self.pattern = pattern
+        self._regex = re.compile('(?:{p})\\Z'.format(p=pattern)) if pattern is not None else None
+
+    def lines(self, value, prefix, namespace):
+        namespace[prefix + 'types'] = six.string_types
+        lines = [
+            'if not isinstance({v}, {p}types):'.format(v=value, p=prefix),
+            self._raise(value, prefix, 'must be a string'),
+        ]
+
+        for field, operator, reason in (
+            ('min_len', '<', 'must be at least {b!r} long'),
+            ('max_len', '>', 'must be at most {b!r} long'),
+        ):
+            self._bound(lines, 'len({v})'.format(v=value), prefix, namespace, field, operator,
+                        reason, value)
+
+        if self._regex is not None:
+            namespace[prefix + 'match'] = self._regex.match
+            lines.append('if {p}match({v}) is None:'.format(v=value, p=prefix))
+            lines.append(self._raise(value, prefix, 'must match {r!r}'.format(r=self.pattern)))
+
+        return lines
+
+
+class OneOf(Spec):
+    """
+    One of the given values.
+    """
+
+    def __init__(self, *values):
+        self.values = values
+
+    def lines(self, value, prefix, namespace):
+        namespace[prefix + 'items'] = self.values
+        lines = []
+
+        try:
+            namespace[prefix + 'values'] = frozenset(self.values)
+        except TypeError:
+            # Unhashable values:
+            lines.append('{p}ok = {v} in {p}items'.format(v=value, p=prefix))
+        else:
+            # An unhashable value is compared with each item:
+            lines.extend([
+                'try:',
+                '    {p}ok = {v} in {p}values'.format(v=value, p=prefix),
+                'except TypeError:',
+                '    {p}ok = {v} in {p}items'.format(v=value, p=prefix),
+            ])
+
+        lines.extend([
+            'if not {p}ok:'.format(p=prefix),
+            self._raise(value, prefix, 'must be one of: {a}'.format(
+                a=', '.join(repr(item) for item in self.values))),
+        ])
+
+        return lines
+
+    def __repr__(self):
+        return 'OneOf({a})'.format(a=', '.join(repr(item) for item in self.values))
+
+
+class Optional(Spec):
+    """
+    None, or meets the given constraint.
+    """
+
+    def __init__(self, spec):
+        self.spec = spec
+
+    def lines(self, value, prefix, namespace):
+        lines = ['if {v} is not None:'.format(v=value)]
+        # The constraint's names must not clash with ours:
+        lines.extend(_indent(self.spec.lines(value, prefix + 'o_', namespace)))
+        namespace[prefix + 'o_error'] = SpecError
+
+        return lines
+
+    def __repr__(self):
+        return 'Optional({s!r})'.format(s=self.spec)
@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# asyncio test cases (Python 3.5+ only), see: tests.test_aio
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import asyncio
+import unittest
+
+from mock import Mock
+
+from hoft import (
+    IGNORE, KeywordError, NOVALUE, PositionalError, PureParser, analyse_sig, configure, pure,
+)
+
+
+class _Success(Exception):
+    pass
+
+
+class _Error(Exception):
+    pass
+
+
+def _run(coro):
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class AnalyseSigAsyncTestCase(unittest.TestCase):
+    def test_coroutine_function(self):
+        f_a = Mock()
+
+        @analyse_sig(f_a, IGNORE)
+        async def voo(a, b):
+            return a + b
+
+        self.assertTrue(asyncio.iscoroutinefunction(voo))
+        coro = voo(1, 2)
+        # Nothing is analysed until awaited:
+        f_a.assert_not_called()
+        self.assertEqual(_run(coro), 3)
+        f_a.assert_called_once_with('a', 0, 1)
+
+    def test_async_validators_run_concurrently(self):
+        running = []
+        overlapped = []
+
+        async def slow(name, index, value, default_value=None):
+            running.append(name)
+            await asyncio.sleep(0.01)
+            overlapped.append(len(running))
+            running.remove(name)
+
+        @analyse_sig(slow, slow, c=slow)
+        async def voo(a, b, c=3):
+            return a, b, c
+
+        self.assertEqual(_run(voo(1, 2, c=4)), (1, 2, 4))
+        self.assertEqual(max(overlapped), 3)
+
+    def test_fail_slow_errors_in_order(self):
+        async def slow_error(name, index, value, default_value=None):
+            await asyncio.sleep(0.02 if name == 'a' else 0)
+            raise _Error(name)
+
+        def sync_error(name, index, value):
+            raise _Error(name)
+
+        @analyse_sig(slow_error, sync_error, c=slow_error)
+        async def voo(a, b, c=3):
+            raise _Success()
+
+        try:
+            _run(voo(1, 2))
+        except _Error as e:
+            self.assertEqual([error.name for error in e._errors_], ['a', 'b', 'c'])
+            self.assertIsInstance(e._errors_[0], PositionalError)
+            self.assertIsInstance(e._errors_[2], KeywordError)
+            self.assertEqual(e._errors_[2].value, NOVALUE)
+            self.assertEqual(str(e), 'a')
+        else:
+            assert False
+
+    def test_fail_fast_cancels(self):
+        cancelled = []
+
+        async def fail(name, index, value):
+            raise _Error(name)
+
+        async def slow(name, index, value):
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+
+        @analyse_sig(slow, fail, _fail_fast_=True)
+        async def voo(a, b):
+            raise _Success()
+
+        try:
+            _run(voo(1, 2))
+        except _Error as e:
+            self.assertEqual([error.name for error in e._errors_], ['b'])
+        else:
+            assert False
+
+        self.assertEqual(cancelled, ['a'])
+
+    def test_fail_fast_error_handler_not_raising(self):
+        async def fail(name, index, value):
+            await asyncio.sleep(0.01 if name == 'a' else 0)
+            raise _Error(name)
+
+        on_error = Mock()
+        func = Mock()
+
+        @analyse_sig(fail, fail, _fail_fast_=True, _on_error_=on_error)
+        async def voo(a, b):
+            func()
+
+        # Every check is awaited, each failure handled as it is known:
+        _run(voo(1, 2))
+        func.assert_called_once_with()
+        self.assertEqual(
+            [[error.name for error in call[0][1]] for call in on_error.call_args_list],
+            [['b'], ['a', 'b']],
+        )
+
+    def test_fail_fast_sync_error_closes_pending(self):
+        started = []
+
+        async def slow(name, index, value):
+            started.append(name)
+
+        def fail(name, index, value):
+            raise _Error(name)
+
+        @analyse_sig(slow, fail, _fail_fast_=True)
+        async def voo(a, b):
+            raise _Success()
+
+        self.assertRaises(_Error, _run, voo(1, 2))
+        self.assertEqual(started, [])
+
+    def test_checks_toggled_at_runtime(self):
+        f_a = Mock(side_effect=_Error('a'))
+
+        @analyse_sig(f_a)
+        async def voo(a):
+            return a
+
+        previous = configure(checks=False)
+
+        try:
+            self.assertEqual(_run(voo(1)), 1)
+        finally:
+            configure(**previous._asdict())
+
+        f_a.assert_not_called()
+        self.assertRaises(_Error, _run, voo(1))
+
+    def test_fused_async_parsers_awaited(self):
+        calls = []
+
+        def ok(name, index, value, default_value=None):
+            calls.append(('ok', name))
+
+        async def check(name, index, value, default_value=None):
+            calls.append(('check', name))
+            raise _Error(name)
+
+        def later(name, index, value, default_value=None):
+            calls.append(('later', name))
+            return asyncio.sleep(0)
+
+        func = Mock()
+
+        @analyse_sig([ok, check], b=[later, ok])
+        async def voo(a, b=2):
+            func()
+
+        self.assertRaises(_Error, _run, voo(1, b=3))
+        func.assert_not_called()
+        # The parsers of different arguments are awaited concurrently:
+        self.assertEqual(sorted(calls), [('check', 'a'), ('later', 'b'), ('ok', 'a'), ('ok', 'b')])
+        self.assertLess(calls.index(('ok', 'a')), calls.index(('check', 'a')))
+        self.assertLess(calls.index(('later', 'b')), calls.index(('ok', 'b')))
+
+    def test_stacked_coroutine_function_not_merged(self):
+        f_a = Mock()
+
+        async def voo(a):
+            return a
+
+        inner = analyse_sig(f_a)(voo)
+        outer = analyse_sig()(inner)
+
+        self.assertIs(outer.__hoft__.func, inner)
+        self.assertEqual(_run(outer(1)), 1)
+        f_a.assert_called_once_with('a', 0, 1)
+
+    def test_async_parsers_of_function(self):
+        async def check(name, index, value, default_value=None):
+            pass
+
+        def voo(a, b=2):
+            pass
+
+        for args, kwargs in [((check,), {}), ((), {'b': check}), ((), {'_default_': check}),
+                             (([Mock(), check],), {})]:
+            # Its coroutines would never be awaited:
+            self.assertRaises(TypeError, analyse_sig(*args, **kwargs), voo)
+
+    def test_async_parsers_not_pure(self):
+        calls = []
+
+        async def check(name, index, value, default_value=None):
+            calls.append(name)
+
+        self.assertRaises(TypeError, pure, check)
+
+        @analyse_sig(check, _cache_=True)
+        async def voo(a):
+            return a
+
+        self.assertEqual(_run(voo(1)), 1)
+        self.assertEqual(_run(voo(1)), 1)
+        self.assertEqual(calls, ['a', 'a'])
+
+    def test_awaitable_result_not_remembered(self):
+        calls = []
+
+        async def check(name, value):
+            calls.append(name)
+            raise _Error(name)
+
+        def later(name, index, value, default_value=None):
+            return check(name, value)
+
+        parser = pure(later)
+        self.assertIsInstance(parser, PureParser)
+
+        @analyse_sig(parser)
+        async def voo(a):
+            return a
+
+        self.assertRaises(_Error, _run, voo(1))
+        self.assertRaises(_Error, _run, voo(1))
+        self.assertEqual(calls, ['a', 'a'])
+        self.assertEqual(parser.cache_info().currsize, 0)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# Keyword-only and positional-only parameter test cases (Python 3.8+ only), see: tests.test_params
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import unittest
+from inspect import getcallargs
+
+from mock import Mock
+
+from hoft import (
+    ArgsNotAnalysedError, IGNORE, KeywordError, NOVALUE, NoDefaultError, ParamTable,
+    PositionalError, Signature, analyse_sig, get_argspec, get_default_value, get_keywords,
+    get_params, get_positionals, get_signature_index, signature,
+)
+from hoft.core.binder import make_binder
+from hoft.core.utils import (
+    KEYWORD_ONLY, POSITIONAL_ONLY, POSITIONAL_OR_KEYWORD, VAR_KEYWORD, VAR_POSITIONAL,
+)
+
+
+class _Error(Exception):
+    pass
+
+
+def _voo(a, b: int, /, c=1, *d, e, f: str = 'x', **g) -> bool:
+    pass
+
+
+def _kwonly(a, *, b, c=3):
+    pass
+
+
+class ParamsTestCase(unittest.TestCase):
+    def test_params(self):
+        self.assertEqual(get_params(_voo), ParamTable(
+            ('a', 'b', 'c', 'd', 'e', 'f', 'g'),
+            (POSITIONAL_ONLY, POSITIONAL_ONLY, POSITIONAL_OR_KEYWORD, VAR_POSITIONAL,
+             KEYWORD_ONLY, KEYWORD_ONLY, VAR_KEYWORD),
+            (NOVALUE, NOVALUE, 1, NOVALUE, NOVALUE, 'x', NOVALUE),
+            (NOVALUE, int, NOVALUE, NOVALUE, NOVALUE, str, NOVALUE),
+        ))
+        # Built once:
+        self.assertIs(get_params(_voo), get_params(_voo))
+
+    def test_argspec(self):
+        argspec = get_argspec(_voo)
+
+        self.assertEqual(argspec[:4], (['a', 'b', 'c'], 'd', 'g', (1,)))
+        self.assertEqual(argspec.kwonlyargs, ['e', 'f'])
+        self.assertEqual(argspec.kwonlydefaults, {'f': 'x'})
+        self.assertEqual(argspec.annotations, {'b': int, 'f': str})
+        self.assertEqual(argspec.posonlyargs, ['a', 'b'])
+
+    def test_signature(self):
+        argspec = get_argspec(_voo)
+
+        self.assertEqual(signature(_voo), Signature(['a', 'b'], 'd', {
+            'c': 1, 'e': NOVALUE, 'f': 'x'}, 'g'))
+        self.assertEqual(get_positionals(argspec), ['a', 'b'])
+        self.assertEqual(get_keywords(argspec), {'c': 1, 'e': NOVALUE, 'f': 'x'})
+
+        index = get_signature_index(argspec)
+        self.assertEqual(index.args, ('a', 'b', 'c'))
+        self.assertEqual(index.positions, {'a': 0, 'b': 1, 'c': 2, 'e': 3, 'f': 4})
+        self.assertEqual(index.defaults, {'c': 1, 'f': 'x'})
+        self.assertEqual(index.has_defaults, 0b10100)
+
+        for sig_index in (None, index):
+            self.assertEqual(get_default_value('f', argspec, sig_index), 'x')
+            self.assertRaises(NoDefaultError, get_default_value, 'e', argspec, sig_index)
+
+    def test_binder(self):
+        argspec = get_argspec(_kwonly)
+        binder = make_binder(_kwonly, argspec, get_signature_index(argspec))
+
+        for args, kwargs in [((1,), {'b': 2}), ((), {'a': 1, 'b': 2, 'c': 4})]:
+            self.assertEqual(binder.callargs(args, kwargs), getcallargs(_kwonly, *args, **kwargs))
+
+        # Only the exception type is the same as Python's:
+        for args, kwargs in [((1,), {}), ((1, 2), {}), ((1, 2), {'c': 3})]:
+            self.assertRaises(TypeError, getcallargs, _kwonly, *args, **kwargs)
+            self.assertRaises(TypeError, binder.callargs, args, kwargs)
+            self.assertRaises(TypeError, binder.check, args, kwargs)
+
+        argspec = get_argspec(_voo)
+        binder = make_binder(_voo, argspec, get_signature_index(argspec))
+
+        self.assertEqual(binder.callargs((1, 2), {'e': 5, 'b': 6}), {
+            'a': 1, 'b': 2, 'c': 1, 'd': (), 'e': 5, 'f': 'x', 'g': {'b': 6}})
+
+    def _check_keyword_only(self, **options):
+        f_a = Mock()
+        f_b = Mock(side_effect=_Error('b'), func_name='f_b')
+        f_c = Mock()
+
+        @analyse_sig(f_a, b=f_b, c=f_c, **options)
+        def voo(a, *, b, c=3):
+            return a, b, c
+
+        try:
+            voo(1, b=2)
+        except _Error as e:
+            self.assertEqual(e._errors_, [KeywordError(e, 'b', 2, NOVALUE, 'f_b', f_b)])
+        else:
+            assert False
+
+        f_a.assert_called_once_with('a', 0, 1)
+        f_b.assert_called_once_with('b', 1, 2, default_value=NOVALUE)
+        f_c.assert_called_once_with('c', 2, NOVALUE, default_value=3)
+
+        f_b.side_effect = None
+        self.assertEqual(voo(1, b=2, c=4), (1, 2, 4))
+        self.assertRaises(TypeError, voo, 1, 2)
+
+    def test_keyword_only(self):
+        for options in [{}, {'_compile_': True}]:
+            self._check_keyword_only(**options)
+
+    def test_strict(self):
+        for options in [{}, {'_compile_': True}]:
+            @analyse_sig(IGNORE, _strict_=True, **options)
+            def voo(a, /, b=2, *, c):
+                return a, b, c
+
+            try:
+                voo(1, c=3)
+            except ArgsNotAnalysedError as e:
+                self.assertEqual(e.names, ['a', 'b', 'c'])
+            else:
+                assert False
+
+            f_a = Mock(side_effect=_Error('a'), func_name='f_a')
+
+            @analyse_sig(f_a, b=IGNORE, c=IGNORE, _strict_=True, **options)
+            def woo(a, /, b=2, *, c):
+                return a, b, c
+
+            try:
+                woo(1, c=3)
+            except _Error as e:
+                self.assertEqual(e._errors_, [PositionalError(e, 'a', 0, 1, 'f_a', f_a)])
+            else:
+                assert False
+
+            f_a.side_effect = None
+            self.assertEqual(woo(1, c=3), (1, 2, 3))
@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import subprocess
+import sys
+import unittest
+
+from mock import Mock, patch
+
+from hoft import (
+    BindError, ErrorBatch, IGNORE, KeywordError, NO_ERRORS, NOVALUE, NotAnalysedError,
+    PositionalError, analyse_sig, validate_batch, validate_columns,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class _Error(Exception):
+    pass
+
+
+def _positive(name, index, value, default_value=None):
+    if value is not NOVALUE and value < 0:
+        raise _Error(name)
+
+
+class ValidateBatchTestCase(unittest.TestCase):
+    def test_rows(self):
+        func = Mock()
+        on_error = Mock()
+
+        @analyse_sig(_positive, IGNORE, c=_positive, _fail_fast_=True, _on_error_=on_error)
+        def voo(a, b, c=1):
+            func(a, b, c)
+
+        results = validate_batch(voo, [
+            ((1, 2), {'c': 3}),
+            ((-1, 2), {'c': -3}),
+            ((1,), {}),
+            ((1, 2), None),
+        ])
+
+        self.assertEqual(len(results), 4)
+        self.assertIs(results[0], NO_ERRORS)
+        self.assertIs(results[3], NO_ERRORS)
+
+        errors = results[1]
+        self.assertEqual(len(errors), 2)
+        self.assertIsInstance(errors[0], PositionalError)
+        self.assertEqual((errors[0].name, errors[0].index, errors[0].value), ('a', 0, -1))
+        self.assertIsInstance(errors[1], KeywordError)
+        self.assertEqual((errors[1].name, errors[1].value, errors[1].default_value), ('c', -3, 1))
+
+        errors = results[2]
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], BindError)
+        self.assertIsInstance(errors[0].error, TypeError)
+        self.assertEqual(errors[0].args, (1,))
+
+        func.assert_not_called()
+        on_error.assert_not_called()
+
+    def test_strict(self):
+        @analyse_sig(_positive, _strict_=True)
+        def voo(a, b):
+            pass
+
+        results = validate_batch(voo, [((1, 2), {}), ((-1,), {'b': 2})])
+
+        self.assertEqual([len(errors) for errors in results], [1, 2])
+        self.assertIsInstance(results[0][0], NotAnalysedError)
+        self.assertEqual(results[0][0].name, ['b'])
+        self.assertIsInstance(results[1][0], PositionalError)
+
+    def test_not_decorated(self):
+        def voo(a):
+            pass
+
+        self.assertRaises(TypeError, validate_batch, voo, [((1,), {})])
+
+    def test_columnar(self):
+        @analyse_sig(_positive, c=_positive, _strict_=True)
+        def voo(a, b, c=1):
+            pass
+
+        rows = [
+            ((1, 2), {}),
+            ((-1, 2), {'c': -3}),
+            ((1,), {}),
+            ((1, 2), {}),
+        ]
+        batch = validate_batch(voo, rows, columnar=True)
+
+        self.assertIsInstance(batch, ErrorBatch)
+        self.assertEqual(list(batch.rows), [0, 1, 1, 1, 2, 3])
+        self.assertEqual(batch.failing_rows(), [0, 1, 2, 3])
+        self.assertEqual(batch.count_by_type(), {
+            'PositionalError': 1, 'KeywordError': 1, 'NotAnalysedError': 3, 'BindError': 1,
+        })
+
+        # The records are made as needed, and match those of `validate_batch`:
+        results = validate_batch(voo, rows)
+
+        def without_exc(errors):
+            return [(type(error), type(error.error)) + tuple(error)[1:] for error in errors]
+
+        self.assertEqual(
+            [without_exc(errors) for errors in batch.to_results(len(rows))],
+            [without_exc(errors) for errors in results],
+        )
+        self.assertEqual(without_exc(batch.for_row(1)), without_exc(results[1]))
+        self.assertEqual(batch[1].func_name, '_positive')
+        self.assertEqual(batch[3].argspec, results[1][2].argspec)
+
+        self.assertEqual(list(ErrorBatch.from_results(results)), sum(results, []))
+
+
+class _Positive(object):
+    """
+    A parser that can also validate a column at once.
+    """
+
+    def __init__(self):
+        self.columns = []
+        self.calls = []
+
+    def __call__(self, name, index, value, default_value=None):
+        self.calls.append((name, value))
+        _positive(name, index, value)
+
+    def validate_column(self, name, index, column):
+        self.columns.append((name, index))
+        return column < 0
+
+
+class ValidateColumnsTestCase(unittest.TestCase):
+    def test_scalar_fallback(self):
+        @analyse_sig(_positive, IGNORE, c=_positive)
+        def voo(a, b, c=1):
+            pass
+
+        results = validate_columns(voo, {'a': [1, -2, 3], 'b': [0, 0, 0], 'c': [-1, 2, -3]})
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual([e.name for e in results[0]], ['c'])
+        self.assertEqual([(e.name, e.value) for e in results[1]], [('a', -2)])
+        self.assertEqual([(e.name, e.value) for e in results[2]], [('c', -3)])
+        self.assertIsInstance(results[0][0], KeywordError)
+        self.assertIsInstance(results[1][0], PositionalError)
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_vectorised(self):
+        a = _Positive()
+        c = _Positive()
+
+        @analyse_sig(a, IGNORE, c=c, d=_positive)
+        def voo(a, b, c=1, d=2):
+            pass
+
+        results = validate_columns(voo, {
+            'a': numpy.array([1, -2, 3, 4]),
+            'b': [0, 0, 0, 0],
+            'c': numpy.array([-1, 2, 3, 4]),
+        })
+
+        self.assertEqual(a.columns, [('a', 0)])
+        self.assertEqual(c.columns, [('c', 2)])
+        # Only the failing rows were validated individually:
+        self.assertEqual(a.calls, [('a', -2)])
+        self.assertEqual(c.calls, [('c', -1)])
+
+        self.assertEqual([(e.name, e.value) for e in results[0]], [('c', -1)])
+        self.assertEqual([(e.name, e.index, e.value) for e in results[1]], [('a', 0, -2)])
+        self.assertIs(results[2], NO_ERRORS)
+        self.assertIs(results[3], NO_ERRORS)
+
+    def test_vectorised_without_numpy(self):
+        a = _Positive()
+        a.validate_column = lambda name, index, column: [value < 0 for value in column]
+        c = _Positive()
+        c.validate_column = lambda name, index, column: [
+            row for row, value in enumerate(column) if value < 0]
+
+        @analyse_sig(a, c=c)
+        def voo(a, c=1):
+            pass
+
+        columns = {'a': [1, 1, -2, 3, -4], 'c': [-1, 2, 3, 4, 5]}
+
+        with patch('hoft.core.batch._numpy', False):
+            results = validate_columns(voo, columns)
+
+        self.assertEqual(a.calls, [('a', -2), ('a', -4)])
+        self.assertEqual(c.calls, [('c', -1)])
+
+        def summary(results):
+            return [[(type(e), e.name, e.value) for e in errors] for errors in results]
+
+        self.assertEqual(
+            [[e.name for e in errors] for errors in results], [['c'], [], ['a'], [], ['a']])
+        self.assertEqual(summary(results), summary(validate_batch(voo, [
+            ((a_value,), {'c': c_value}) for a_value, c_value in zip(columns['a'], columns['c'])
+        ])))
+
+    def test_numpy_imported_lazily(self):
+        code = 'import sys, hoft; sys.exit("numpy" in sys.modules)'
+        self.assertEqual(subprocess.call([sys.executable, '-c', code]), 0)
+
+    def test_keyword_without_column(self):
+        d = Mock()
+
+        @analyse_sig(d=d, _strict_=True)
+        def voo(a, d=2):
+            pass
+
+        results = validate_columns(voo, {'a': [1, 2]})
+
+        self.assertEqual(d.call_count, 2)
+        d.assert_called_with('d', 1, NOVALUE, default_value=2)
+        self.assertEqual([[e.name for e in errors] for errors in results], [[['a']], [['a']]])
+
+    def test_bind_error(self):
+        @analyse_sig(_positive)
+        def voo(a, b):
+            pass
+
+        results = validate_columns(voo, {'a': [1, 2]})
+
+        self.assertEqual(len(results), 2)
+        self.assertIsInstance(results[1][0], BindError)
+        self.assertEqual(results[1][0].args, (2,))
+
+    def test_columns_of_different_lengths(self):
+        @analyse_sig(_positive)
+        def voo(a, b):
+            pass
+
+        self.assertRaises(ValueError, validate_columns, voo, {'a': [1, 2], 'b': [1]})
+        self.assertEqual(validate_columns(voo, {}), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
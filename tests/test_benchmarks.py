@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# Smoke tests, so the benchmarks do not rot (they are not timed here).
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import os
+import unittest
+
+from six import StringIO
+
+import hoft
+from benchmarks import allocations, binding, harness, overhead
+
+_HOFT_CORE_FILES = os.path.join(os.path.dirname(os.path.abspath(hoft.__file__)), 'core', '*')
+_THIS_FILE = os.path.splitext(os.path.abspath(__file__))[0] + '.py'
+
+
+def _forward(func):
+    # A wrapper which only forwards its arguments:
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+class OverheadBenchmarksTestCase(unittest.TestCase):
+    def test_benchmarks_run(self):
+        benchmarks = overhead.benchmarks()
+        names = [benchmark.name for benchmark in benchmarks]
+
+        self.assertEqual(len(names), len(set(names)))
+        self.assertIn('overhead/params-50/analyse_sig[strict]/failing', names)
+        self.assertNotIn('overhead/params-0/analyse_sig/failing', names)
+
+        for benchmark in benchmarks:
+            benchmark.func()
+
+
+class BindingBenchmarksTestCase(unittest.TestCase):
+    def test_benchmarks_run(self):
+        benchmarks = binding.benchmarks()
+        names = [benchmark.name for benchmark in benchmarks]
+
+        self.assertEqual(len(names), len(set(names)))
+        self.assertIn('binding/varargs-varkw/getcallargs', names)
+        self.assertIn('binding/params-50/binder.check', names)
+
+        for benchmark in benchmarks:
+            benchmark.func()
+
+
+class HarnessTestCase(unittest.TestCase):
+    def test_save_load_compare(self):
+        benchmarks = [
+            harness.Benchmark('a', lambda: None, {}),
+            harness.Benchmark('b', lambda: None, {'x': 1}),
+        ]
+        results = harness.run(benchmarks, pattern='^a$', number=10, repeat=2, output=None)
+
+        self.assertEqual([result.name for result in results], ['a'])
+        self.assertEqual((results[0].number, results[0].repeat), (10, 2))
+
+        f = StringIO()
+        harness.save(results, f)
+        f.seek(0)
+        baseline = harness.load(f)
+
+        self.assertEqual(list(baseline), ['a'])
+
+        slower = results[0]._replace(best=baseline['a'].best * 2)
+        self.assertEqual(harness.compare(baseline, [slower], output=None), ['a'])
+        self.assertEqual(harness.compare(baseline, results, output=None), [])
+
+
+class AllocationsTestCase(unittest.TestCase):
+    def test_check_budget(self):
+        results = [
+            allocations.AllocationResult('a', 0, 0, 0, 0.0, []),
+            allocations.AllocationResult('b', 100, 2, 500, 0.0, [('x.py:1', 100, 2)]),
+            allocations.AllocationResult('c', None, None, 500, 0.0, []),
+        ]
+
+        self.assertEqual(allocations.check_budget(results), [])
+        self.assertEqual(
+            allocations.check_budget(results, max_blocks=0, max_peak_bytes=1000),
+            ['b: live_blocks 2 > 0 (x.py:1 100 B)'],
+        )
+
+    @unittest.skipIf(allocations.tracemalloc is None, 'tracemalloc is not available')
+    def test_measure(self):
+        cases = dict((case.name, case) for case in overhead.iter_cases())
+
+        result = allocations.measure(cases['params-5/analyse_sig[compile]/passing'], number=10)
+        self.assertEqual((result.live_bytes, result.live_blocks), (0, 0))
+
+        for shape in overhead.SHAPES:
+            for variant in ('analyse_sig', 'analyse_sig[fail_fast]'):
+                case = cases['{s}/{v}/passing'.format(s=shape.name, v=variant)]
+                result = allocations.measure(case, number=10, files=_HOFT_CORE_FILES)
+                forwarded = allocations.measure(
+                    case._replace(decorate=_forward), number=10, files=_THIS_FILE)
+
+                # Nothing but what calling the decorated function with `*args` and `**kwargs` does:
+                self.assertEqual(
+                    (result.live_bytes, result.live_blocks),
+                    (forwarded.live_bytes, forwarded.live_blocks),
+                    case.name,
+                )
+
+        result = allocations.measure(cases['params-5/analyse_sig/failing'], number=10)
+        self.assertIsNone(result.live_blocks)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import unittest
+from inspect import getcallargs
+
+import mock
+
+import hoft
+from hoft.core.binder import (
+    BIND_ARGS, BIND_CALLARGS, BIND_KWARGS, Binder, get_binding, make_bind, make_binder,
+)
+from hoft.core.sigs import get_argspec, get_signature_index
+
+
+def _binder(func):
+    argspec = get_argspec(func)
+    return make_binder(func, argspec, get_signature_index(argspec))
+
+
+def _plain(a, b, c=3, d=4):
+    pass
+
+
+def _varargs(a, b=2, *args, **kwargs):
+    pass
+
+
+def _empty():
+    pass
+
+
+CALLS = [
+    ((1, 2), {}),
+    ((1, 2, 5), {'d': 6}),
+    ((1,), {'b': 2, 'c': 3, 'd': 4}),
+    ((), {'a': 1, 'b': 2}),
+    ((1, 2, 3, 4, 5, 6), {}),
+    ((1,), {'x': 1, 'y': 2}),
+    ((), {}),
+]
+
+BAD_CALLS = [
+    ((1, 2, 3, 4, 5), {}),
+    ((1,), {}),
+    ((1, 2), {'a': 1}),
+    ((1, 2), {'e': 1}),
+    ((), {'c': 1}),
+]
+
+
+class BinderTestCase(unittest.TestCase):
+    def test_as_getcallargs(self):
+        for func in (_plain, _varargs, _empty):
+            binder = _binder(func)
+            self.assertIsInstance(binder, Binder)
+
+            for args, kwargs in CALLS + BAD_CALLS:
+                try:
+                    expected = getcallargs(func, *args, **kwargs)
+                except TypeError:
+                    self.assertRaises(TypeError, binder.callargs, args, kwargs)
+                    self.assertRaises(TypeError, binder.check, args, kwargs)
+                else:
+                    self.assertEqual(binder.callargs(args, kwargs), expected)
+                    binder.check(args, kwargs)
+
+    def test_messages(self):
+        # The binder's own messages (which read as, but need not match, CPython's):
+        binder = _binder(_plain)
+
+        for (args, kwargs), message in zip(BAD_CALLS, [
+            '_plain() takes from 2 to 4 positional arguments but 5 were given',
+            "_plain() missing 1 required positional argument: 'b'",
+            "_plain() got multiple values for argument 'a'",
+            "_plain() got an unexpected keyword argument 'e'",
+            "_plain() missing 2 required positional arguments: 'a' and 'b'",
+        ]):
+            try:
+                binder.check(args, kwargs)
+            except TypeError as e:
+                self.assertEqual(str(e), message)
+            else:
+                assert False, (args, kwargs)
+
+    def test_values(self):
+        values, extra_args, extra_kwargs = _binder(_varargs).values((1, 2, 3), {'x': 4})
+
+        self.assertEqual(values, [1, 2])
+        self.assertEqual(extra_args, (3,))
+        self.assertEqual(extra_kwargs, {'x': 4})
+        self.assertEqual(_binder(_plain).values((1, 2), {})[2], None)
+
+
+class BindingTestCase(unittest.TestCase):
+    def test_get_binding(self):
+        check = mock.Mock()
+
+        for expected, kwargs in [
+            (BIND_ARGS, {}),
+            (BIND_ARGS, {'_strict_': True, 'a': hoft.IGNORE, 'b': hoft.IGNORE,
+                         'c': hoft.IGNORE, 'd': hoft.IGNORE}),
+            (BIND_KWARGS, {'c': check}),
+            (BIND_CALLARGS, {'_strict_': True}),
+            (BIND_CALLARGS, {'_default_': lambda name, value, argspec: None}),
+        ]:
+            func = hoft.analyse_sig(check, **kwargs)(_plain)
+            self.assertEqual(get_binding(func), expected, kwargs)
+
+        self.assertRaises(TypeError, get_binding, _plain)
+
+    def test_unbound(self):
+        parser = mock.Mock()
+        func = hoft.analyse_sig(parser)(_plain)
+        plan = func.__hoft__
+
+        with mock.patch.object(Binder, 'values') as values:
+            func(1, 2)
+            self.assertEqual(values.call_count, 0)
+
+        self.assertIsNone(make_bind(plan)((1, 2), {}))
+        self.assertRaises(TypeError, make_bind(plan, check=True), (1,), {})
+        # A bad call still raises, once analysed:
+        self.assertRaises(TypeError, func, 1)
+        self.assertEqual(parser.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
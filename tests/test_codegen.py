@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import unittest
+
+from mock import Mock
+
+from hoft import (
+    ArgsNotAnalysedError, IGNORE, KeywordError, NOVALUE, NotAnalysedError, PositionalError,
+    analyse_sig,
+)
+
+
+class _Success(Exception):
+    pass
+
+
+class _Error(Exception):
+    pass
+
+
+class CompiledWrapperTestCase(unittest.TestCase):
+    def setUp(self):
+        self._f_all = Mock()
+        self._f_a = Mock()
+        self._f_f = Mock()
+
+    def _decorate(self, with_default=False, **options):
+        def f_all(name, value, arg_spec):
+            self._f_all(name, value)
+
+        def f_a(name, index, value):
+            self._f_a(name, index, value)
+
+        def f_f(name, index, called_with_value, default_value):
+            self._f_f(name, index, called_with_value, default_value)
+
+        if with_default:
+            options['_default_'] = f_all
+
+        @analyse_sig(f_a, IGNORE, c=IGNORE, d=IGNORE, f=f_f, _compile_=True, **options)
+        def voo(a, b, c, d, e=1, f='2', g={3: 4}, **kwargs):
+            return a, b, c, d, e, f, g, kwargs
+
+        return voo
+
+    def test_source_is_inspectable(self):
+        voo = self._decorate()
+
+        self.assertTrue(voo.__hoft_source__.startswith(
+            'def voo(a, b, c, d, e=_hoft_NOVALUE, f=_hoft_NOVALUE, g=_hoft_NOVALUE, **kwargs):'))
+        self.assertEqual(voo.__name__, 'voo')
+        self.assertEqual(voo.__hoft__.func(1, 2, 3, 4), (1, 2, 3, 4, 1, '2', {3: 4}, {}))
+
+    def test_arguments_bind_natively(self):
+        voo = self._decorate()
+
+        self.assertEqual(
+            voo(11, 22, 33, 44, e=99, x=5),
+            (11, 22, 33, 44, 99, '2', {3: 4}, {'x': 5}),
+        )
+        self._f_a.assert_called_once_with('a', 0, 11)
+        self._f_f.assert_called_once_with('f', 5, NOVALUE, '2')
+        self.assertRaises(TypeError, voo, 11)
+        self.assertRaises(TypeError, voo, 11, 22, 33, 44, a=1)
+
+    def test_default_handler(self):
+        voo = self._decorate(with_default=True)
+
+        voo(11, 22, 33, 44, e=99)
+        self.assertEqual(
+            sorted(call[0] for call in self._f_all.call_args_list),
+            [('b', 22), ('e', 99), ('g', {3: 4}), ('kwargs', {})],
+        )
+
+    def test_strict_fail_slow(self):
+        self._f_a.side_effect = _Error('a')
+        self._f_f.side_effect = _Error('f')
+        voo = self._decorate(_strict_=True)
+
+        try:
+            voo(11, 22, 33, 44, e=99)
+        except _Error as e:
+            self.assertEqual(len(e._errors_), 3)
+            error = e._errors_[0]
+            self.assertIsInstance(error, PositionalError)
+            self.assertEqual((error.name, error.index, error.value, error.func_name),
+                             ('a', 0, 11, 'f_a'))
+            error = e._errors_[1]
+            self.assertIsInstance(error, KeywordError)
+            self.assertEqual((error.name, error.value, error.default_value, error.func_name),
+                             ('f', NOVALUE, '2', 'f_f'))
+            error = e._errors_[2]
+            self.assertIsInstance(error, NotAnalysedError)
+            self.assertIsInstance(error.error, ArgsNotAnalysedError)
+            self.assertEqual(error.name, ['b', 'e', 'g', 'kwargs'])
+            self.assertEqual(error.callargs, {
+                'a': 11, 'b': 22, 'c': 33, 'd': 44, 'e': 99, 'f': '2', 'g': {3: 4}, 'kwargs': {},
+            })
+        else:
+            assert False
+
+    def test_fail_fast(self):
+        self._f_a.side_effect = _Error('a')
+        voo = self._decorate(_fail_fast_=True)
+
+        try:
+            voo(11, 22, 33, 44)
+        except _Error as e:
+            self.assertEqual(len(e._errors_), 1)
+            self._f_f.assert_not_called()
+        else:
+            assert False
+
+    def test_optional_positional(self):
+        f_e = Mock()
+        f_e_kw = Mock()
+
+        @analyse_sig(IGNORE, f_e, e=f_e_kw, _compile_=True)
+        def voo(a, e=1):
+            raise _Success()
+
+        self.assertRaises(_Success, voo, 1, 2)
+        f_e.assert_called_once_with('e', 1, 2)
+        f_e_kw.assert_not_called()
+
+        self.assertRaises(_Success, voo, 1)
+        f_e.assert_called_once_with('e', 1, 2)
+        f_e_kw.assert_called_once_with('e', 1, NOVALUE, default_value=1)
+
+    def test_lambda(self):
+        f_a = Mock()
+        voo = analyse_sig(f_a, _compile_=True)(lambda a: a)
+
+        self.assertEqual(voo(1), 1)
+        f_a.assert_called_once_with('a', 0, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
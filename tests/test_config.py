@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import unittest
+
+from mock import Mock
+
+from hoft import Config, analyse_in, analyse_sig, configure, get_config
+from hoft.core.config import _disabled_by_env
+
+
+class _Error(Exception):
+    pass
+
+
+class ConfigureTestCase(unittest.TestCase):
+    def setUp(self):
+        self._previous = configure(enabled=True, checks=True)
+
+    def tearDown(self):
+        configure(**self._previous._asdict())
+
+    def test_configure_returns_previous(self):
+        self.assertEqual(configure(checks=False), Config(True, True))
+        self.assertEqual(configure(enabled=False), Config(True, False))
+        self.assertEqual(get_config(), Config(False, False))
+
+    def test_disabled_by_env(self):
+        self.assertFalse(_disabled_by_env({}))
+
+        for value in ('', '0', 'false', 'No', ' off '):
+            self.assertFalse(_disabled_by_env({'HOFT_DISABLE': value}))
+        for value in ('1', 'true', 'yes'):
+            self.assertTrue(_disabled_by_env({'HOFT_DISABLE': value}))
+
+    def test_disabled_returns_function_undecorated(self):
+        configure(enabled=False)
+
+        def voo(a, b=1):
+            return a, b
+
+        self.assertIs(analyse_sig(Mock())(voo), voo)
+        self.assertIs(analyse_sig(Mock(), _compile_=True)(voo), voo)
+        self.assertIs(analyse_in(Mock())(voo), voo)
+
+    def test_checks_toggled_at_runtime(self):
+        f_a = Mock(side_effect=_Error())
+        f_b = Mock(side_effect=_Error())
+
+        @analyse_sig(f_a, b=f_b)
+        def voo(a, b=1):
+            return a, b
+
+        @analyse_sig(f_a, b=f_b, _compile_=True)
+        def compiled_voo(a, b=1):
+            return a, b
+
+        @analyse_in(f_a)
+        def in_voo(a, b=1):
+            return a, b
+
+        configure(checks=False)
+
+        for func in (voo, compiled_voo, in_voo):
+            self.assertEqual(func(1), (1, 1))
+            self.assertEqual(func(1, b=2), (1, 2))
+        f_a.assert_not_called()
+        f_b.assert_not_called()
+
+        configure(checks=True)
+
+        for func in (voo, compiled_voo, in_voo):
+            self.assertRaises(_Error, func, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
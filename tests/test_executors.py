@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import threading
+import unittest
+
+from mock import Mock
+
+from hoft import IGNORE, KeywordError, NOVALUE, PositionalError, analyse_sig
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:  # pragma: no cover
+    ThreadPoolExecutor = None
+
+
+class _Success(Exception):
+    pass
+
+
+class _Error(Exception):
+    pass
+
+
+class _Failed(Exception):
+    pass
+
+
+@unittest.skipIf(ThreadPoolExecutor is None, 'concurrent.futures is not available')
+class AnalyseSigExecutorTestCase(unittest.TestCase):
+    def setUp(self):
+        self._executor = ThreadPoolExecutor(max_workers=4)
+
+    def tearDown(self):
+        self._executor.shutdown(wait=True)
+
+    def test_parsers_run_concurrently(self):
+        # Each parser waits for the other, so this only completes when they run concurrently:
+        barrier = [threading.Event(), threading.Event()]
+
+        def f_a(name, index, value):
+            barrier[0].set()
+            assert barrier[1].wait(5)
+
+        def f_c(name, index, called_with_value, default_value):
+            barrier[1].set()
+            assert barrier[0].wait(5)
+
+        @analyse_sig(f_a, c=f_c, _executor_=self._executor)
+        def voo(a, b, c=1):
+            return a, b, c
+
+        self.assertEqual(voo(1, 2), (1, 2, 1))
+
+    def test_errors_in_validation_order(self):
+        f_a = Mock(side_effect=_Error('a'))
+        f_b = Mock(side_effect=_Error('b'))
+        f_c = Mock(side_effect=_Error('c'))
+
+        @analyse_sig(f_a, IGNORE, b=IGNORE, c=f_c, d=f_b, _executor_=self._executor)
+        def voo(a, b, c=3, d=4):
+            raise _Success()
+
+        try:
+            voo(1, 2, d=5)
+        except _Error as e:
+            self.assertEqual(str(e), 'a')
+            self.assertEqual(len(e._errors_), 3)
+            error = e._errors_[0]
+            self.assertIsInstance(error, PositionalError)
+            self.assertEqual((error.name, error.index, error.value), ('a', 0, 1))
+            error = e._errors_[1]
+            self.assertIsInstance(error, KeywordError)
+            self.assertEqual((error.name, error.value, error.default_value), ('c', NOVALUE, 3))
+            error = e._errors_[2]
+            self.assertIsInstance(error, KeywordError)
+            self.assertEqual((error.name, error.value, error.default_value), ('d', 5, 4))
+        else:
+            assert False
+
+    def test_fail_fast_does_not_wait_for_outstanding(self):
+        release = threading.Event()
+        finished = []
+
+        def f_a(name, index, value):
+            release.wait(5)
+            finished.append(name)
+
+        on_error = Mock(side_effect=_Failed)
+
+        @analyse_sig(
+            f_a, Mock(side_effect=_Error('b')),
+            _fail_fast_=True, _on_error_=on_error, _executor_=self._executor,
+        )
+        def voo(a, b):
+            raise _Success()
+
+        try:
+            self.assertRaises(_Failed, voo, 1, 2)
+            self.assertEqual(finished, [])
+        finally:
+            release.set()
+
+        self.assertEqual(on_error.call_count, 1)
+        exc, errors = on_error.call_args[0]
+        self.assertEqual(str(exc), 'b')
+        self.assertEqual([error.name for error in errors], ['b'])
+
+    def test_fail_fast_error_handler_not_raising(self):
+        release = threading.Event()
+
+        def f_a(name, index, value):
+            release.wait(5)
+            raise _Error(name)
+
+        def f_b(name, index, value):
+            raise _Error(name)
+
+        # `f_a` fails once the failure of `f_b` is handled:
+        on_error = Mock(side_effect=lambda exc, errors: release.set())
+
+        @analyse_sig(f_a, f_b, _fail_fast_=True, _on_error_=on_error, _executor_=self._executor)
+        def voo(a, b):
+            raise _Success()
+
+        # Every parser is waited for, each failure handled as it is known:
+        self.assertRaises(_Success, voo, 1, 2)
+        self.assertEqual(
+            [[error.name for error in call[0][1]] for call in on_error.call_args_list],
+            [['b'], ['a', 'b']],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import os
+import shutil
+import socket
+import tempfile
+import unittest
+
+from mock import Mock
+from six import StringIO
+
+from hoft import (
+    HistogramSnapshot, Observer, PositionalError, StatsSnapshot, StatsdExporter,
+    ValidatorSnapshot, add_observer, analyse_in, analyse_sig, remove_observer, render_prometheus,
+    write_prometheus,
+)
+from hoft.core.exporters import format_statsd_line
+
+
+class _Error(Exception):
+    pass
+
+
+def _positive(name, index, value, default_value=None):
+    if value < 0:
+        raise _Error(name)
+
+
+def _snapshot():
+    histogram = HistogramSnapshot((0.001, 0.01), (1, 0, 2), 3, 0.5)
+
+    return StatsSnapshot(
+        'mod.voo', 3, histogram, histogram, {0: ValidatorSnapshot('a', '_positive', histogram)},
+        {'PositionalError': 2},
+    )
+
+
+class ObserverTestCase(unittest.TestCase):
+    def setUp(self):
+        self.observer = Mock(spec=Observer)
+        add_observer(self.observer)
+
+    def tearDown(self):
+        remove_observer(self.observer)
+
+    def test_analyse_sig(self):
+        @analyse_sig(_positive, _positive, _metrics_=True)
+        def voo(a, b):
+            pass
+
+        name = voo.__hoft__.stats.name
+
+        self.assertRaises(_Error, voo, 1, -2)
+
+        self.observer.on_call_start.assert_called_once_with(name, (1, -2), {})
+        self.assertEqual(
+            [c[0][:3] for c in self.observer.on_validator_done.call_args_list],
+            [(name, 'a', '_positive'), (name, 'b', '_positive')],
+        )
+        self.assertIsNone(self.observer.on_validator_done.call_args_list[0][0][4])
+        error = self.observer.on_validator_done.call_args_list[1][0][4]
+        self.assertEqual(error.name, 'b')
+        self.observer.on_error.assert_called_once_with(name, error)
+        self.assertEqual(self.observer.on_call_end.call_args[0][2], [error])
+
+    def test_analyse_sig_not_measured(self):
+        for compiled in (False, True):
+            self.observer.reset_mock()
+
+            @analyse_sig(_positive, _positive, _compile_=compiled)
+            def voo(a, b, c=1, *d, **e):
+                pass
+
+            name = '{m}.voo'.format(m=__name__)
+
+            voo(1, 2, 3, 4, f=5)
+            self.observer.on_call_start.assert_called_once_with(name, (1, 2, 3, 4), {'f': 5})
+            self.assertEqual(self.observer.on_call_end.call_args[0][::2], (name, ()))
+
+            self.assertRaises(_Error, voo, -1, -2)
+            self.observer.on_call_start.assert_called_with(name, (-1, -2), {})
+            errors = self.observer.on_call_end.call_args[0][2]
+            self.assertEqual([error.name for error in errors], ['a', 'b'])
+            self.assertEqual(
+                [c[0] for c in self.observer.on_error.call_args_list],
+                [(name, error) for error in errors],
+            )
+            self.observer.on_validator_done.assert_not_called()
+
+    def test_analyse_sig_fail_fast(self):
+        for compiled in (False, True):
+            self.observer.reset_mock()
+
+            @analyse_sig(_positive, _fail_fast_=True, _compile_=compiled)
+            def voo(a):
+                pass
+
+            self.assertRaises(_Error, voo, -1)
+            self.assertEqual(
+                [error.name for error in self.observer.on_call_end.call_args[0][2]], ['a'])
+
+    def test_analyse_in(self):
+        @analyse_in(Mock())
+        def voo(a):
+            pass
+
+        voo(1)
+
+        name = '{m}.voo'.format(m=__name__)
+        self.observer.on_call_start.assert_called_once_with(name, (1,), {})
+        self.assertEqual(self.observer.on_call_end.call_args[0][::2], (name, []))
+        self.observer.on_validator_done.assert_not_called()
+
+    def test_remove_unknown(self):
+        self.assertRaises(ValueError, remove_observer, Mock())
+
+
+class PrometheusTestCase(unittest.TestCase):
+    def test_render(self):
+        text = render_prometheus([_snapshot()])
+
+        self.assertIn(
+            '# TYPE hoft_calls_total counter\nhoft_calls_total{function="mod.voo"} 3\n', text)
+        self.assertIn(
+            'hoft_bind_seconds_bucket{function="mod.voo",le="0.001"} 1\n'
+            'hoft_bind_seconds_bucket{function="mod.voo",le="0.01"} 1\n'
+            'hoft_bind_seconds_bucket{function="mod.voo",le="+Inf"} 3\n'
+            'hoft_bind_seconds_sum{function="mod.voo"} 0.5\n'
+            'hoft_bind_seconds_count{function="mod.voo"} 3\n',
+            text,
+        )
+        self.assertIn(
+            'hoft_validator_seconds_count{argument="a",function="mod.voo",parser="_positive",'
+            'slot="0"} 3\n',
+            text,
+        )
+        self.assertIn('hoft_errors_total{function="mod.voo",type="PositionalError"} 2\n', text)
+
+    def test_escaping(self):
+        text = render_prometheus([_snapshot()._replace(name='a"b\\c\nd')])
+        self.assertIn('hoft_calls_total{function="a\\"b\\\\c\\nd"} 3\n', text)
+
+    def test_write(self):
+        buf = StringIO()
+        write_prometheus(buf, [_snapshot()])
+        self.assertEqual(buf.getvalue(), render_prometheus([_snapshot()]))
+
+        path = tempfile.mkdtemp()
+
+        try:
+            filename = os.path.join(path, 'hoft.prom')
+            write_prometheus(filename, [_snapshot()])
+
+            with open(filename) as f:
+                self.assertEqual(f.read(), buf.getvalue())
+            self.assertEqual(os.listdir(path), ['hoft.prom'])
+        finally:
+            shutil.rmtree(path)
+
+
+class StatsdTestCase(unittest.TestCase):
+    def setUp(self):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.server.bind(('127.0.0.1', 0))
+        self.server.settimeout(5)
+
+    def tearDown(self):
+        self.server.close()
+
+    def _exporter(self, **kwargs):
+        host, port = self.server.getsockname()
+        return StatsdExporter(host=host, port=port, **kwargs)
+
+    def test_format(self):
+        self.assertEqual(format_statsd_line('hoft.a b:c', 1, 'c'), 'hoft.a_b_c:1|c')
+        self.assertEqual(format_statsd_line('hoft.t', 1.5, 'ms'), 'hoft.t:1.5|ms')
+
+    def test_buffered(self):
+        exporter = self._exporter()
+
+        exporter.on_call_end('mod.voo', 0.002, [])
+        exporter.on_error('mod.voo', PositionalError(_Error(), 'a', 0, -1, '_positive', _positive))
+        exporter.on_validator_done('mod.voo', 'a', '_positive', 0.001, None)
+        exporter.close()
+
+        self.assertEqual(self.server.recv(2048).decode('utf-8').split('\n'), [
+            'hoft.mod.voo.calls:1|c',
+            'hoft.mod.voo.analysis:2.0|ms',
+            'hoft.mod.voo.errors.PositionalError:1|c',
+            'hoft.mod.voo.a._positive:1.0|ms',
+        ])
+
+    def test_packet_size(self):
+        exporter = self._exporter(max_packet_size=60)
+
+        exporter.on_call_end('mod.voo', 0.002, [])
+        exporter.on_call_end('mod.voo', 0.002, [])
+
+        # The third line did not fit, so the first two were sent:
+        self.assertEqual(self.server.recv(2048).decode('utf-8'),
+                         'hoft.mod.voo.calls:1|c\nhoft.mod.voo.analysis:2.0|ms')
+        exporter.close()
+        self.assertEqual(self.server.recv(2048).decode('utf-8'),
+                         'hoft.mod.voo.calls:1|c\nhoft.mod.voo.analysis:2.0|ms')
+
+
+if __name__ == '__main__':
+    unittest.main()
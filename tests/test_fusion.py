@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import functools
+import unittest
+
+from mock import Mock, call
+
+from hoft import IGNORE, NOVALUE, analyse_sig
+from hoft.core.fusion import fuse
+
+
+class _Error(Exception):
+    pass
+
+
+class _Inline(object):
+    """
+    A parser whose check is generated in place.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+
+    def __call__(self, name, index, value, default_value=NOVALUE):
+        raise AssertionError('not called')
+
+    def __hoft_inline__(self, value, prefix):
+        return (
+            ['if {v} > {p}limit:'.format(v=value, p=prefix),
+             '    raise {p}error(name, {v})'.format(v=value, p=prefix)],
+            {prefix + 'limit': self.limit, prefix + 'error': _Error},
+        )
+
+
+class FuseTestCase(unittest.TestCase):
+    def test_fused_in_turn(self):
+        f_a = Mock()
+        f_b = Mock(side_effect=_Error('b'))
+        f_c = Mock()
+
+        fused = fuse([f_a, IGNORE, f_b, f_c])
+
+        self.assertEqual(fused.__hoft_fused__, (f_a, f_b, f_c))
+        self.assertRaises(_Error, fused, 'a', 0, 1)
+        f_a.assert_called_once_with('a', 0, 1)
+        f_b.assert_called_once_with('a', 0, 1)
+        f_c.assert_not_called()
+
+    def test_keyword(self):
+        f_a = Mock()
+        f_b = Mock()
+
+        fuse([f_a, fuse([f_b, f_a], keyword=True)], keyword=True)('a', 0, 1, default_value=2)
+
+        self.assertEqual(f_a.call_args_list, [call('a', 0, 1, default_value=2)] * 2)
+        f_b.assert_called_once_with('a', 0, 1, default_value=2)
+
+    def test_trivial(self):
+        f_a = Mock()
+
+        self.assertIs(fuse([IGNORE]), IGNORE)
+        self.assertIs(fuse([f_a, IGNORE]), f_a)
+
+    def test_inline(self):
+        f_a = Mock()
+        fused = fuse([_Inline(3), f_a, _Inline(5)])
+
+        fused('a', 0, 2)
+        self.assertRaises(_Error, fused, 'a', 0, 4)
+        self.assertEqual(f_a.call_count, 1)
+        self.assertIn('if value > _hoft_0_limit:', fused.__hoft_source__)
+
+
+class AnalyseSigFusionTestCase(unittest.TestCase):
+    def test_list_of_parsers(self):
+        f_a = Mock()
+        f_b = Mock(side_effect=_Error('b'))
+
+        @analyse_sig([f_a, f_b], b=(f_a, f_a))
+        def voo(a, b=2):
+            pass
+
+        try:
+            voo(1, b=3)
+        except _Error as e:
+            self.assertEqual(len(e._errors_), 1)
+            self.assertEqual(e._errors_[0].func.__hoft_fused__, (f_a, f_b))
+        else:
+            assert False
+
+        self.assertEqual(f_a.call_args_list, [
+            call('a', 0, 1),
+            call('b', 1, 3, default_value=2),
+            call('b', 1, 3, default_value=2),
+        ])
+
+    def test_stacked_merged(self):
+        calls = []
+
+        def check(tag):
+            return lambda name, *args, **kwargs: calls.append((tag, name))
+
+        func = Mock()
+
+        @analyse_sig(check('outer'), IGNORE, c=check('outer'))
+        @analyse_sig(IGNORE, check('inner'), c=check('inner'), d=IGNORE)
+        def voo(a, b, c=3, d=4):
+            func(a, b, c, d)
+
+        voo(1, 2)
+
+        self.assertEqual(calls, [('outer', 'a'), ('inner', 'b'), ('outer', 'c'), ('inner', 'c')])
+        func.assert_called_once_with(1, 2, 3, 4)
+
+        # One wrapper, of the original function:
+        plan = voo.__hoft__
+        self.assertFalse(hasattr(plan.func, '__hoft__'))
+
+    def test_stacked_with_options(self):
+        f_a = Mock()
+
+        def inner(a, b=2):
+            pass
+
+        for options in [{'_on_error_': Mock()}, {'_order_': 'declaration'}, {'_sample_every_': 10},
+                        {'_default_': Mock()}, {'_fail_fast_': True}]:
+            f_a.reset_mock()
+            decorated = analyse_sig(f_a)(inner)
+            outer = analyse_sig(**options)(decorated)
+
+            # Not merged, each decorator's options apply to its own parsers only:
+            self.assertIs(outer.__hoft__.func, decorated, options)
+            outer(1)
+            f_a.assert_called_once_with('a', 0, 1)
+
+    def test_stacked_with_wrapper_between(self):
+        f_a = Mock()
+        logged = Mock()
+
+        def log(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                logged()
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        @analyse_sig()
+        @log
+        @analyse_sig(f_a)
+        def voo(a, b=2):
+            pass
+
+        voo(1)
+
+        # Not merged, so the wrapper between them is called:
+        logged.assert_called_once_with()
+        f_a.assert_called_once_with('a', 0, 1)
+
+    def test_stacked_positional_and_keyword(self):
+        for outer, inner in [(((Mock(),), {}), ((), {'a': Mock()})),
+                             (((), {'a': Mock()}), ((Mock(),), {}))]:
+            decorated = analyse_sig(*inner[0], **inner[1])(lambda a=1: None)
+            voo = analyse_sig(*outer[0], **outer[1])(decorated)
+
+            # Not merged, the keyword parser is applied although `a` is passed positionally:
+            self.assertIs(voo.__hoft__.func, decorated)
+            voo(5)
+
+            for parsers in (outer, inner):
+                for custom_parser_func in parsers[0] + tuple(parsers[1].values()):
+                    self.assertEqual(custom_parser_func.call_count, 1)
+
+    def test_stacked_errors(self):
+        def f_outer(name, index, value, default_value=NOVALUE):
+            pass
+
+        def f_inner(name, index, value, default_value=NOVALUE):
+            raise _Error(name)
+
+        @analyse_sig(f_outer, b=f_inner)
+        @analyse_sig(f_inner, b=f_outer)
+        def voo(a, b=2):
+            pass
+
+        try:
+            voo(1, b=3)
+        except _Error as e:
+            # The parser which failed, rather than the merged one:
+            self.assertEqual([(error.func, error.func_name) for error in e._errors_], [
+                (f_inner, 'f_inner'),
+                (f_inner, 'f_inner'),
+            ])
+        else:
+            assert False
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import unittest
+
+from mock import Mock
+
+from hoft import (
+    DEFAULT_BUCKETS, IGNORE, analyse_sig, get_all_stats, reset_all_stats,
+)
+from hoft.core.metrics import Histogram
+
+
+class _Error(Exception):
+    pass
+
+
+def _positive(name, index, value, default_value=None):
+    if value < 0:
+        raise _Error(name)
+
+
+class HistogramTestCase(unittest.TestCase):
+    def test_record(self):
+        histogram = Histogram((1, 2, 5))
+
+        for value in (0.5, 1, 1.5, 5, 6, 100):
+            histogram.record(value)
+
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot.buckets, (1, 2, 5))
+        self.assertEqual(snapshot.counts, (2, 1, 1, 2))
+        self.assertEqual(snapshot.count, 6)
+        self.assertEqual(snapshot.sum, 114)
+
+        histogram.reset()
+        self.assertEqual(histogram.snapshot().counts, (0, 0, 0, 0))
+
+
+class MetricsTestCase(unittest.TestCase):
+    def test_stats(self):
+        on_error = Mock()
+
+        @analyse_sig(_positive, IGNORE, c=_positive, _strict_=True, _metrics_=True,
+                     _on_error_=on_error)
+        def voo(a, b, c=1):
+            return a, b, c
+
+        stats = voo.__hoft__.stats
+        self.assertEqual(stats.name, '{m}.voo'.format(m=__name__))
+
+        self.assertEqual(voo(1, 2, c=3), (1, 2, 3))
+        voo(-1, 2, c=-3)
+
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot.calls, 2)
+        self.assertEqual(snapshot.bind.count, 2)
+        self.assertEqual(snapshot.analysis.count, 2)
+        self.assertEqual(snapshot.bind.buckets, DEFAULT_BUCKETS)
+        self.assertGreaterEqual(snapshot.analysis.sum, snapshot.bind.sum)
+        self.assertEqual(
+            sorted(
+                (index, validator.name, validator.func_name, validator.histogram.count)
+                for index, validator in snapshot.validators.items()
+            ),
+            [(0, 'a', '_positive', 2), (1, 'c', '_positive', 2)],
+        )
+        self.assertEqual(
+            snapshot.errors, {'PositionalError': 1, 'KeywordError': 1, 'NotAnalysedError': 2})
+        self.assertEqual(on_error.call_count, 2)
+
+        stats.reset()
+        self.assertEqual(stats.snapshot().calls, 0)
+
+    def test_fail_fast_counts_error(self):
+        @analyse_sig(_positive, _positive, _fail_fast_=True, _metrics_=True)
+        def voo(a, b):
+            pass
+
+        self.assertRaises(_Error, voo, -1, -2)
+
+        snapshot = voo.__hoft__.stats.snapshot()
+        self.assertEqual(snapshot.errors, {'PositionalError': 1})
+        self.assertEqual(list(snapshot.validators), [0])
+        self.assertEqual(snapshot.validators[0][:2], ('a', '_positive'))
+        self.assertEqual(snapshot.analysis.count, 1)
+
+    def test_validators_by_slot(self):
+        @analyse_sig(lambda *a: None, a=lambda *a, **k: None, _metrics_=True)
+        def voo(a=1):
+            pass
+
+        voo(1)
+        voo(a=2)
+
+        snapshot = voo.__hoft__.stats.snapshot()
+        self.assertEqual(
+            sorted((index, validator.name, validator.func_name, validator.histogram.count)
+                   for index, validator in snapshot.validators.items()),
+            [(0, 'a', '<lambda>', 1), (1, 'a', '<lambda>', 1)],
+        )
+
+    def test_disabled(self):
+        @analyse_sig(_positive)
+        def voo(a):
+            pass
+
+        self.assertIsNone(voo.__hoft__.stats)
+
+    def test_registry(self):
+        @analyse_sig(_positive, _metrics_=True)
+        def registered_voo(a):
+            pass
+
+        registered_voo(1)
+
+        snapshots = [s for s in get_all_stats() if s.name.endswith('.registered_voo')]
+        self.assertEqual(len(snapshots), 1)
+        self.assertEqual(snapshots[0].calls, 1)
+
+        reset_all_stats()
+        self.assertEqual(registered_voo.__hoft__.stats.calls, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import unittest
+
+from hoft import (
+    BindError, IGNORE, KeywordError, NO_ERRORS, NOVALUE, NotAnalysedError, PositionalError,
+    RemoteError, analyse_sig, validate_batch, validate_batch_parallel,
+)
+
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:  # pragma: no cover
+    ProcessPoolExecutor = None
+
+
+class _Error(Exception):
+    pass
+
+
+class _Mismatched(Exception):
+    def __init__(self, name, value, reason):
+        # Its args do not match its constructor (so it cannot be unpickled):
+        super(_Mismatched, self).__init__('{n}: {r}'.format(n=name, r=reason))
+
+
+def _positive(name, index, value, default_value=None):
+    if value is not NOVALUE and value < 0:
+        raise _Error(name, value)
+
+
+def _not_none(name, value, argspec):
+    if value is None:
+        raise _Error(name)
+
+
+def _not_none_either(name, *args, **kwargs):
+    # A keyword parser (name, index, value, default_value) or `_default_` (name, value, argspec):
+    value = args[1] if 'default_value' in kwargs else args[0]
+
+    if value is None:
+        raise _Error(name)
+
+
+# The decorated functions are pickled by reference, so must be importable:
+@analyse_sig(_positive, IGNORE, c=_positive, _default_=_not_none)
+def _voo(a, b, c=1, d=2):
+    pass
+
+
+@analyse_sig(IGNORE, c=_not_none_either, _default_=_not_none_either)
+def _either_voo(a, c=1):
+    pass
+
+
+@analyse_sig(_positive, _strict_=True)
+def _strict_voo(a, b):
+    pass
+
+
+def _mismatched(name, index, value):
+    raise _Mismatched(name, value, 'bad')
+
+
+@analyse_sig(_mismatched)
+def _mismatched_voo(a):
+    pass
+
+
+@unittest.skipIf(ProcessPoolExecutor is None, 'concurrent.futures is not available')
+class ValidateBatchParallelTestCase(unittest.TestCase):
+    def test_matches_validate_batch(self):
+        rows = [
+            ((1, 2), {'c': 3}),
+            ((-1, 2), {'c': -3, 'd': None}),
+            ((1,), {}),
+            ((1, None), None),
+        ] * 3
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = validate_batch_parallel(_voo, rows, executor=executor, chunk_size=5)
+
+        self.assertEqual(len(results), len(rows))
+        self.assertIs(results[0], NO_ERRORS)
+
+        for result, expected in zip(results, validate_batch(_voo, rows)):
+            self.assertEqual(
+                [(type(error), type(error.error), error.error.args) for error in result],
+                [(type(error), type(error.error), error.error.args) for error in expected],
+            )
+            # The rebuilt errors reference the parent's parsers:
+            self.assertEqual(
+                [error[1:] for error in result if not isinstance(error, BindError)],
+                [error[1:] for error in expected if not isinstance(error, BindError)],
+            )
+
+        errors = results[1]
+        self.assertIsInstance(errors[0], PositionalError)
+        self.assertEqual((errors[0].name, errors[0].index, errors[0].value), ('a', 0, -1))
+        self.assertIs(errors[0].func, _positive)
+        self.assertIsInstance(errors[0].error, _Error)
+        self.assertEqual(errors[0].error.args, ('a', -1))
+        self.assertIsInstance(errors[1], KeywordError)
+        self.assertEqual((errors[1].name, errors[1].value, errors[1].default_value), ('c', -3, 1))
+        self.assertIsInstance(errors[2], KeywordError)
+        self.assertEqual((errors[2].name, errors[2].value, errors[2].func),
+                         ('d', None, _not_none))
+
+        errors = results[2]
+        self.assertIsInstance(errors[0], BindError)
+        self.assertIsInstance(errors[0].error, TypeError)
+        self.assertEqual((errors[0].args, errors[0].kwargs), ((1,), {}))
+
+        errors = results[3]
+        self.assertIsInstance(errors[0], PositionalError)
+        self.assertEqual((errors[0].name, errors[0].index, errors[0].func), ('b', 1, _not_none))
+
+    def test_parser_also_default(self):
+        rows = [((None,), {'c': None}), ((None, None), {})]
+        results = validate_batch_parallel(_either_voo, rows)
+
+        for result, expected in zip(results, validate_batch(_either_voo, rows)):
+            self.assertEqual(
+                [(type(error), error[1:]) for error in result],
+                [(type(error), error[1:]) for error in expected],
+            )
+
+        errors = results[0]
+        self.assertIsInstance(errors[0], KeywordError)
+        # The keyword parser's (with the argument's default value), not the handler's:
+        self.assertEqual((errors[0].name, errors[0].value, errors[0].default_value),
+                         ('c', None, 1))
+        self.assertIsInstance(errors[1], PositionalError)
+        self.assertEqual((errors[1].name, errors[1].index, errors[1].value), ('a', 0, None))
+
+    def test_strict(self):
+        results = validate_batch_parallel(_strict_voo, [((1, 2), {}), ((-1,), {'b': 2})])
+
+        self.assertEqual([len(errors) for errors in results], [1, 2])
+        self.assertIsInstance(results[0][0], NotAnalysedError)
+        self.assertEqual(results[0][0].name, ['b'])
+        self.assertEqual(results[0][0].callargs, {'a': 1, 'b': 2})
+        self.assertIsInstance(results[1][0], PositionalError)
+
+    def test_exception_not_rebuilt(self):
+        results = validate_batch_parallel(_mismatched_voo, [((1,), {})])
+
+        error = results[0][0]
+        self.assertIsInstance(error, PositionalError)
+        self.assertIsInstance(error.error, RemoteError)
+        self.assertEqual((error.error.type_name, error.error.detail), ('_Mismatched', 'a: bad'))
+        self.assertEqual(str(error.error), '_Mismatched: a: bad')
+
+    def test_not_decorated(self):
+        self.assertRaises(TypeError, validate_batch_parallel, _positive, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import sys
+
+# The test cases use positional-only parameters, which older versions of Python cannot even parse:
+if sys.version_info >= (3, 8):
+    from tests.params_cases import ParamsTestCase  # NOQA
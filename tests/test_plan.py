@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import unittest
+
+from mock import Mock, patch
+
+from hoft import (
+    IGNORE, NO_ERRORS, NOVALUE, NoDefaultError, analyse_sig, clear_signature_cache,
+)
+from hoft.core.errors import LazyErrors, make_error
+from hoft.core.parsers_sig import parse_all_sig_args
+from hoft.core.plan import CallPlan, build_call_plan
+from hoft.core.sigs import _make_params
+
+
+class _Error(Exception):
+    pass
+
+
+class CallPlanTestCase(unittest.TestCase):
+    def test_plan_is_built_once(self):
+        f_a = Mock()
+
+        clear_signature_cache()
+
+        with patch('hoft.core.sigs._make_params', wraps=_make_params) as m_make_params:
+            @analyse_sig(f_a)
+            def voo(a, b=2):
+                pass
+
+            voo(1)
+            voo(2, b=3)
+
+        m_make_params.assert_called_once()
+        self.assertIsInstance(voo.__hoft__, CallPlan)
+        self.assertEqual(f_a.call_count, 2)
+
+    def test_options_apply_to_every_call(self):
+        f_a = Mock(side_effect=_Error('a'))
+        f_b = Mock(side_effect=_Error('b'))
+
+        @analyse_sig(f_a, b=f_b, _fail_fast_=True)
+        def voo(a, b=2):
+            pass
+
+        for _ in range(3):
+            try:
+                voo(1, b=3)
+            except _Error as e:
+                self.assertEqual(len(e._errors_), 1)
+            else:
+                assert False
+
+        self.assertEqual(f_a.call_count, 3)
+        f_b.assert_not_called()
+
+    def test_plan_slots(self):
+        def f_a(name, index, value):
+            pass
+
+        def f_d(name, index, value, default_value):
+            pass
+
+        def voo(a, b, c=3, d=4, *e, **f):
+            pass
+
+        plan = build_call_plan(voo, (f_a, IGNORE), dict(a=f_d, c=IGNORE, d=f_d), strict=True)
+
+        self.assertEqual([(s.index, s.name) for s in plan.positionals], [(0, 'a')])
+        self.assertEqual(
+            [(s.name, s.index, s.default_value, s.shadow) for s in plan.keywords],
+            [('a', None, NOVALUE, 0), ('d', 3, 4, None)],
+        )
+        self.assertEqual(plan.remaining, ())
+        self.assertEqual(
+            [(s.name, s.index, s.shadow) for s in plan.unanalysed],
+            [('b', 1, None), ('e', None, None), ('f', None, None)],
+        )
+
+    def test_positional_parser_without_argument(self):
+        def voo(a, *b):
+            pass
+
+        self.assertRaises(IndexError, build_call_plan, voo, (Mock(), Mock()), {})
+        build_call_plan(voo, (Mock(), IGNORE), {})
+
+    def test_keyword_parser_shadowed_by_positional_parser(self):
+        f_a = Mock()
+        f_a_kw = Mock()
+
+        @analyse_sig(f_a, a=f_a_kw)
+        def voo(a, b=2):
+            pass
+
+        voo(1)
+        f_a.assert_called_once_with('a', 0, 1)
+        f_a_kw.assert_not_called()
+
+        # Not passed positionally, so the keyword parser is called (and `a` has no default):
+        self.assertRaises(NoDefaultError, voo, a=1)
+
+    def test_errors_only_created_on_failure(self):
+        f_a = Mock()
+
+        def voo(a, b=2, *args):
+            pass
+
+        plan = build_call_plan(voo, (f_a,), dict(b=f_a), strict=True, default=Mock())
+
+        self.assertIs(parse_all_sig_args(plan, (1,), {}, {'a': 1, 'b': 2, 'args': ()}), NO_ERRORS)
+
+        f_a.side_effect = _Error('a')
+        errors = parse_all_sig_args(plan, (1,), {}, {'a': 1, 'b': 2, 'args': ()})
+
+        self.assertIsInstance(errors, list)
+        self.assertEqual([error.name for error in errors], ['a', 'b'])
+
+        existing = []
+        self.assertIs(
+            parse_all_sig_args(plan, (1,), {}, {'a': 1, 'b': 2, 'args': ()}, errors=existing),
+            existing,
+        )
+        self.assertEqual(len(existing), 2)
+
+    def test_order(self):
+        def voo(z, y=2, x=3, *w, **v):
+            pass
+
+        parse_kwargs = dict(x=Mock(), y=Mock(), u=Mock())
+        default = Mock()
+
+        plan = build_call_plan(voo, (), parse_kwargs, default=default)
+        self.assertEqual(plan.order, 'alphabetical')
+        self.assertEqual([s.name for s in plan.keywords], ['u', 'x', 'y'])
+        self.assertEqual([s.name for s in plan.remaining], ['v', 'w', 'z'])
+
+        plan = build_call_plan(voo, (), parse_kwargs, default=default, order='declaration')
+        # Names the function does not declare go last:
+        self.assertEqual([s.name for s in plan.keywords], ['y', 'x', 'u'])
+        self.assertEqual([s.name for s in plan.remaining], ['z', 'w', 'v'])
+
+        self.assertRaises(ValueError, build_call_plan, voo, (), {}, order='random')
+
+    def test_declaration_order_applied(self):
+        calls = []
+
+        def check(name, *args, **kwargs):
+            calls.append(name)
+
+        @analyse_sig(c=check, b=check, a=check, _order_='declaration')
+        def voo(c=1, b=2, a=3):
+            pass
+
+        voo()
+        self.assertEqual(calls, ['c', 'b', 'a'])
+
+    def test_lazy_errors(self):
+        def fail(name, *args, **kwargs):
+            raise _Error(name)
+
+        for compiled in (False, True):
+            @analyse_sig(fail, c=fail, _default_=fail, _lazy_errors_=True, _compile_=compiled)
+            def voo(a, b, c=3):
+                pass
+
+            with patch('hoft.core.errors.make_error', wraps=make_error) as m_make_error:
+                try:
+                    voo(1, 2, c=4)
+                except _Error as e:
+                    errors = e._errors_
+                else:
+                    assert False
+
+                # Only the first error (raised) has been made:
+                self.assertIsInstance(errors, LazyErrors)
+                self.assertEqual(m_make_error.call_count, 1)
+
+                self.assertEqual(len(errors), 3)
+                self.assertEqual(
+                    [(type(error).__name__, error.name, error.value) for error in errors],
+                    [('PositionalError', 'a', 1), ('KeywordError', 'c', 4),
+                     ('PositionalError', 'b', 2)],
+                )
+                self.assertEqual(errors[2].func, fail)
+                self.assertEqual(m_make_error.call_count, 3)
+
+                # Made once:
+                self.assertIs(errors[1], errors[1])
+                self.assertEqual(errors[:2], list(errors)[:2])
+                self.assertEqual(m_make_error.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import unittest
+
+from mock import Mock
+
+from hoft import IGNORE, NOVALUE, CacheInfo, PureParser, analyse_sig, pure
+
+
+class _Error(Exception):
+    pass
+
+
+def _positive(name, index, value, default_value=NOVALUE):
+    if value is not NOVALUE and value < 0:
+        raise _Error(name, value)
+
+
+class PureTestCase(unittest.TestCase):
+    def test_results_remembered(self):
+        f_a = Mock(wraps=_positive)
+        parser = pure(f_a, maxsize=3)
+
+        @analyse_sig(parser, b=parser)
+        def voo(a, b=1):
+            pass
+
+        voo(1)
+        voo(1, b=2)
+        voo(1)
+        self.assertEqual(f_a.call_count, 3)
+
+        for _ in range(2):
+            try:
+                voo(-1)
+            except _Error as e:
+                self.assertEqual(e.args, ('a', -1))
+                errors = e._errors_
+            else:
+                assert False
+
+        self.assertEqual(f_a.call_count, 4)
+        # Each call raises its own exception:
+        self.assertIsNot(errors[0].error, parser._results[parser._key(('a', 0, -1), {})])
+
+        # The least recently used result (for `b=2`) was evicted:
+        self.assertEqual(parser.cache_info(), CacheInfo(6, 4, 1, 3, 3))
+        voo(1, b=2)
+        self.assertEqual(f_a.call_count, 5)
+
+        parser.cache_clear()
+        self.assertEqual(parser.cache_info(), CacheInfo(0, 0, 0, 3, 0))
+
+    def test_types_not_interchangeable(self):
+        f_a = Mock()
+        parser = pure(f_a)
+
+        for value in (1, 1.0, True, 1):
+            parser('a', 0, value)
+
+        self.assertEqual(f_a.call_count, 3)
+
+    def test_unhashable_not_remembered(self):
+        f_a = Mock()
+        parser = pure(f_a)
+
+        parser('a', 0, [1])
+        parser('a', 0, [1])
+
+        self.assertEqual(f_a.call_count, 2)
+        self.assertEqual(parser.cache_info().currsize, 0)
+
+    def test_decorator(self):
+        @pure(maxsize=8)
+        def check(name, index, value):
+            pass
+
+        self.assertIsInstance(check, PureParser)
+        self.assertEqual(check.maxsize, 8)
+        self.assertEqual(check.__name__, 'check')
+        self.assertIs(pure(check), check)
+
+    def test_cache_option(self):
+        f_a = Mock()
+        f_b = Mock()
+
+        @analyse_sig(f_a, IGNORE, c=f_b, _cache_=True)
+        def voo(a, b, c=3):
+            pass
+
+        for _ in range(3):
+            voo(1, 2, c=3)
+
+        self.assertEqual(f_a.call_count, 1)
+        self.assertEqual(f_b.call_count, 1)
+
+        positional, = voo.__hoft__.positionals
+        self.assertIsInstance(positional.func, PureParser)
+        self.assertEqual(positional.func.maxsize, 1024)
+
+
+if __name__ == '__main__':
+    unittest.main()
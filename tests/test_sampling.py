@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import unittest
+
+from mock import Mock, patch
+
+from hoft import SampleStats, analyse_sig, get_sample_stats
+from hoft.core.sampling import Sampler
+
+
+class _Error(Exception):
+    pass
+
+
+class SamplerTestCase(unittest.TestCase):
+    def test_every(self):
+        sampler = Sampler(every=3)
+
+        self.assertEqual([sampler() for _ in range(7)], [True, False, False] * 2 + [True])
+        self.assertEqual(sampler.stats(), SampleStats(7, 3, 4))
+
+        sampler.reset()
+        self.assertEqual(sampler.stats(), SampleStats(0, 0, 0))
+
+    def test_rate(self):
+        sampler = Sampler(rate=0.5)
+
+        with patch.object(sampler, '_random', side_effect=[0.1, 0.5, 0.9, 0.49]):
+            self.assertEqual([sampler() for _ in range(4)], [True, False, False, True])
+
+        self.assertEqual(sampler.stats(), SampleStats(4, 2, 2))
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, Sampler)
+        self.assertRaises(ValueError, Sampler, rate=0.5, every=2)
+        self.assertRaises(ValueError, Sampler, rate=0)
+        self.assertRaises(ValueError, Sampler, rate=1.5)
+        self.assertRaises(ValueError, Sampler, every=0)
+        self.assertRaises(ValueError, Sampler, every=1.5)
+
+
+class SampledAnalyseSigTestCase(unittest.TestCase):
+    def _check(self, **options):
+        f_a = Mock(side_effect=_Error('a'))
+        on_error = Mock()
+
+        @analyse_sig(f_a, _sample_every_=2, _fail_fast_=True, _on_error_=on_error, **options)
+        def voo(a, b=1):
+            return a, b
+
+        self.assertEqual([voo(n) for n in range(4)], [(0, 1), (1, 1), (2, 1), (3, 1)])
+        self.assertEqual([c[0][2] for c in f_a.call_args_list], [0, 2])
+        # Sampled failures are still reported:
+        self.assertEqual(on_error.call_count, 2)
+        self.assertEqual(get_sample_stats(voo), SampleStats(4, 2, 2))
+
+    def test_every(self):
+        self._check()
+
+    def test_every_compiled(self):
+        self._check(_compile_=True)
+
+    def test_not_sampled(self):
+        @analyse_sig(Mock())
+        def voo(a):
+            pass
+
+        self.assertIsNone(get_sample_stats(voo))
+        self.assertRaises(TypeError, get_sample_stats, lambda: None)
+
+    def test_counted_per_function(self):
+        decorator = analyse_sig(Mock(), _sample_rate_=1)
+
+        voo = decorator(lambda a: a)
+        bar = decorator(lambda a: a)
+        voo(1)
+
+        self.assertEqual(get_sample_stats(voo), SampleStats(1, 1, 0))
+        self.assertEqual(get_sample_stats(bar), SampleStats(0, 0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import unittest
+
+from mock import Mock
+
+from hoft import KeywordError, PositionalError, analyse_sig
+from hoft.spec import Int, OneOf, Optional, Spec, SpecError, Str
+
+
+class SpecTestCase(unittest.TestCase):
+    def assertFails(self, spec, value, message):
+        try:
+            spec('a', 0, value)
+        except SpecError as e:
+            self.assertEqual(str(e), message)
+            self.assertEqual((e.name, e.value), ('a', value))
+        else:
+            assert False, value
+
+    def test_int(self):
+        spec = Int(min=0, max=5)
+
+        for value in (0, 3, 5):
+            spec('a', 0, value)
+
+        self.assertFails(spec, -1, 'a: must be >= 0, got: -1')
+        self.assertFails(spec, 6, 'a: must be <= 5, got: 6')
+        self.assertFails(spec, 1.0, 'a: must be an int, got: 1.0')
+        self.assertFails(spec, True, 'a: must be an int, got: True')
+
+    def test_str(self):
+        spec = Str(min_len=2, max_len=3, pattern='[a-z]+')
+
+        spec('a', 0, 'ab')
+        self.assertFails(spec, 'a', "a: must be at least 2 long, got: 'a'")
+        self.assertFails(spec, 'abcd', "a: must be at most 3 long, got: 'abcd'")
+        # Matched in full:
+        self.assertFails(spec, 'ab1', "a: must match '[a-z]+', got: 'ab1'")
+        self.assertFails(spec, 1, 'a: must be a string, got: 1')
+
+    def test_one_of(self):
+        spec = OneOf('r', 'w')
+
+        spec('a', 0, 'r')
+        self.assertFails(spec, 'x', "a: must be one of: 'r', 'w', got: 'x'")
+
+        # Unhashable values:
+        OneOf([1], [2])('a', 0, [2])
+        self.assertFails(OneOf([1], [2]), [3], 'a: must be one of: [1], [2], got: [3]')
+        self.assertFails(spec, ['r'], "a: must be one of: 'r', 'w', got: ['r']")
+        OneOf(frozenset([1]))('a', 0, set([1]))
+
+    def test_optional(self):
+        spec = Optional(Int(max=1))
+
+        spec('a', 0, None)
+        spec('a', 0, 1)
+        self.assertFails(spec, 2, 'a: must be <= 1, got: 2')
+
+    def test_repr(self):
+        self.assertEqual(repr(Optional(Int(min=1))), 'Optional(Int(min=1))')
+        self.assertEqual(repr(Str(max_len=2)), 'Str(max_len=2)')
+        self.assertEqual(repr(OneOf(1, 2)), 'OneOf(1, 2)')
+
+    def test_abstract(self):
+        class Any(Spec):
+            pass
+
+        self.assertRaises(TypeError, Spec)
+        self.assertRaises(TypeError, Any)
+
+
+class AnalyseSigSpecTestCase(unittest.TestCase):
+    def test_compiled_into_parsers(self):
+        f_b = Mock()
+
+        for compiled in (False, True):
+            @analyse_sig(
+                Int(min=0), b=[Str(max_len=3), f_b], c=Optional(OneOf('r', 'w')),
+                _compile_=compiled,
+            )
+            def voo(a, b='x', c=None):
+                pass
+
+            voo(1)
+            voo(1, b='abc', c='w')
+
+            try:
+                voo(-1, b='abcd', c='x')
+            except SpecError as e:
+                errors = e._errors_
+            else:
+                assert False
+
+            self.assertEqual(
+                [(type(error), error.name, str(error.error)) for error in errors],
+                [
+                    (PositionalError, 'a', 'a: must be >= 0, got: -1'),
+                    (KeywordError, 'b', "b: must be at most 3 long, got: 'abcd'"),
+                    (KeywordError, 'c', "c: must be one of: 'r', 'w', got: 'x'"),
+                ],
+            )
+
+            # The specs are not called, but generated in place:
+            source = voo.__hoft__.positionals[0].func.__hoft_source__
+            self.assertIn('if value < _hoft_0_min:', source)
+
+        # Not called once `b` fails its spec:
+        self.assertEqual(f_b.call_count, 4)
+
+    def test_not_passed_not_checked(self):
+        @analyse_sig(b=Int())
+        def voo(b='x'):
+            pass
+
+        voo()
+        self.assertRaises(SpecError, voo, b='y')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,7 +18,10 @@ class _Success(Exception):
 
 
 class _Error(Exception):
-    pass
+    @property
+    def message(self):
+        # Python 3 exceptions have no `message`:
+        return self.args[0]
 
 
 class AnalyseSigNoDefaultTestCase(unittest.TestCase):
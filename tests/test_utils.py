@@ -5,13 +5,21 @@
 # @copyright (c) 2017-present Francis Horsman.
 
 import functools
+import pickle
 import unittest
 from inspect import getargspec
 
+from mock import patch
+
 from hoft.core.utils import (
-    NoDefaultError, Signature, get_func_name,
+    ArgSpec, KeywordError, NoDefaultError, NotAnalysedError, PositionalError, Signature,
+    SignatureIndex, get_func_name,
+)
+from hoft.core.sigs import (
+    clear_signature_cache, get_argspec, get_default_value, get_signature,
+    get_signature_cache_info, get_signature_index, set_signature_cache_size, signature,
+    DEFAULT_CACHE_SIZE,
 )
-from hoft.core.sigs import get_signature, get_default_value
 
 
 class Test(unittest.TestCase):
@@ -58,6 +66,55 @@ class Test(unittest.TestCase):
         self.assertEqual(get_func_name(my_func), 'my_func')
 
 
+def _parser(name, index, value):
+    pass
+
+
+class ErrorRecordTestCase(unittest.TestCase):
+    def test_tuple_compatible(self):
+        exc = ValueError('a')
+        error = PositionalError(exc, 'a', 0, 1, 'f', None)
+
+        self.assertEqual(error, (exc, 'a', 0, 1, 'f', None))
+        self.assertEqual(error, PositionalError(exc, 'a', 0, 1, 'f', None))
+        self.assertNotEqual(error, PositionalError(exc, 'a', 0, 2, 'f', None))
+        self.assertEqual(len(error), 6)
+        self.assertEqual(error[1], 'a')
+        self.assertEqual(error[-2:], ('f', None))
+
+        _, name, index, value, func_name, func = error
+        self.assertEqual((name, index, value), ('a', 0, 1))
+        self.assertEqual(error._fields, ('error', 'name', 'index', 'value', 'func_name', 'func'))
+        self.assertEqual(error._replace(value=2).value, 2)
+        self.assertEqual(list(error._asdict()), list(error._fields))
+        self.assertEqual(hash(error), hash(tuple(error)))
+        self.assertTrue(repr(error).startswith("PositionalError(error=ValueError('a'"))
+
+    def test_compact(self):
+        error = KeywordError(ValueError('b'), 'b', 1, 2, None, _parser)
+
+        self.assertFalse(hasattr(error, '__dict__'))
+        # Worked out when used:
+        self.assertEqual(error.func_name, get_func_name(_parser))
+
+    def test_lazy_argspec(self):
+        def voo(a, b):
+            pass
+
+        error = NotAnalysedError(ValueError('c'), ['b'], None, {'a': 1, 'b': 2}, voo)
+
+        self.assertEqual(error.argspec, getargspec(voo))
+        self.assertEqual(len(error), 4)
+        self.assertEqual(NotAnalysedError(None, None).argspec, None)
+
+    def test_pickle(self):
+        error = PositionalError(ValueError('a'), 'a', 0, 1, None, _parser)
+        restored = pickle.loads(pickle.dumps(error, pickle.HIGHEST_PROTOCOL))
+
+        self.assertIsInstance(restored, PositionalError)
+        self.assertEqual(restored[1:], error[1:])
+
+
 class ArgSpecTestCase(unittest.TestCase):
     def test_args(self):
         def voo(a, b):
@@ -146,5 +203,154 @@ class ArgSpecTestCase(unittest.TestCase):
         self.assertRaises(NoDefaultError, get_default_value, 'c', argspec)
 
 
+class SignatureIndexTestCase(unittest.TestCase):
+    def test_index(self):
+        def voo(a, b, c=1, d=2, *e, **f):
+            pass
+
+        argspec = getargspec(voo)
+        e_index = SignatureIndex(
+            ('a', 'b', 'c', 'd'),
+            {'a': 0, 'b': 1, 'c': 2, 'd': 3},
+            {'c': 1, 'd': 2},
+            0b1100,
+        )
+
+        self.assertEqual(get_signature_index(argspec), e_index)
+        self.assertEqual(get_default_value('d', argspec), 2)
+        self.assertRaises(NoDefaultError, get_default_value, 'e', argspec)
+        self.assertRaises(NoDefaultError, get_default_value, 'x', argspec)
+
+        # Looked up in the index when it is held:
+        self.assertEqual(get_default_value('d', argspec, e_index), 2)
+        self.assertRaises(NoDefaultError, get_default_value, 'b', argspec, e_index)
+        self.assertRaises(NoDefaultError, get_default_value, 'x', argspec, e_index)
+
+    def test_default_value_without_index(self):
+        def voo(a, b=1):
+            pass
+
+        argspec = getargspec(voo)
+
+        # The argspec is scanned, rather than looking up its index:
+        with patch('hoft.core.sigs.get_signature_index') as get_index:
+            self.assertEqual(get_default_value('b', argspec), 1)
+            self.assertRaises(NoDefaultError, get_default_value, 'a', argspec)
+
+        get_index.assert_not_called()
+
+    def test_no_defaults(self):
+        def voo(a, b):
+            pass
+
+        e_index = SignatureIndex(('a', 'b'), {'a': 0, 'b': 1}, {}, 0)
+
+        self.assertEqual(get_signature_index(getargspec(voo)), e_index)
+
+    def test_wide(self):
+        names = ['a{i}'.format(i=i) for i in range(40)]
+        keywords = ['{n}={i}'.format(n=n, i=i) for i, n in enumerate(names[20:])]
+        voo = eval('lambda {p}: None'.format(p=', '.join(names[:20] + keywords)))
+        argspec = getargspec(voo)
+
+        for i, name in enumerate(names[20:]):
+            self.assertEqual(get_default_value(name, argspec), i)
+
+        index = get_signature_index(argspec)
+        self.assertEqual(index.positions['a39'], 39)
+        self.assertEqual(index.has_defaults, ((1 << 20) - 1) << 20)
+
+
+class SignatureCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        clear_signature_cache()
+
+    def tearDown(self):
+        set_signature_cache_size(DEFAULT_CACHE_SIZE)
+        clear_signature_cache()
+
+    def test_function_hits_and_misses(self):
+        def voo(a, b=2, *c, **d):
+            pass
+
+        e_sig = Signature(['a'], 'c', {'b': 2}, 'd')
+
+        self.assertEqual(signature(voo), e_sig)
+        self.assertEqual(signature(voo), e_sig)
+        self.assertEqual(get_argspec(voo), getargspec(voo))
+
+        info = get_signature_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 1, 1))
+
+    def test_argspec_unpacks(self):
+        def voo(a, b=2, *c, **d):
+            pass
+
+        argspec = get_argspec(voo)
+        args, varargs, keywords, defaults = argspec
+
+        self.assertEqual((args, varargs, keywords, defaults), (['a', 'b'], 'c', 'd', (2,)))
+        self.assertEqual(argspec.kwonlyargs, [])
+        self.assertEqual(argspec.kwonlydefaults, None)
+        self.assertEqual(argspec.annotations, {})
+        self.assertEqual(argspec.posonlyargs, [])
+
+    def test_argspec_copies(self):
+        argspec = ArgSpec(['a'], None, None, None, ['b'], {'b': 1}, {'a': int}, ['a'])
+        restored = pickle.loads(pickle.dumps(argspec, pickle.HIGHEST_PROTOCOL))
+        replaced = argspec._replace(varargs='c')
+
+        for copy in (restored, replaced):
+            self.assertEqual(copy[1:], (copy.varargs, None, None))
+            self.assertEqual(
+                (copy.kwonlyargs, copy.kwonlydefaults, copy.annotations, copy.posonlyargs),
+                (['b'], {'b': 1}, {'a': int}, ['a']))
+
+        self.assertEqual(replaced.varargs, 'c')
+
+    def test_argspec_hits_and_misses(self):
+        def voo(a, b={}):
+            pass
+
+        self.assertIs(get_signature(getargspec(voo)), get_signature(getargspec(voo)))
+
+        info = get_signature_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    def test_shared_code_with_different_defaults(self):
+        def make(value):
+            def voo(a=value):
+                pass
+
+            return voo
+
+        self.assertEqual(signature(make(1)).kwargs, {'a': 1})
+        self.assertEqual(signature(make(2)).kwargs, {'a': 2})
+
+    def test_code_is_weakly_referenced(self):
+        voo = eval('lambda a, b=1: None')
+        signature(voo)
+        self.assertEqual(get_signature_cache_info().currsize, 1)
+
+        del voo
+        self.assertEqual(get_signature_cache_info().currsize, 0)
+
+    def test_eviction(self):
+        set_signature_cache_size(2)
+        funcs = [eval('lambda a, b={i}: None'.format(i=i)) for i in range(3)]
+
+        for func in funcs:
+            signature(func)
+
+        info = get_signature_cache_info()
+        self.assertEqual((info.evictions, info.maxsize, info.currsize), (1, 2, 2))
+
+        # The least recently used entry was evicted:
+        signature(funcs[2])
+        signature(funcs[0])
+        info = get_signature_cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 4))
+
+
 if __name__ == '__main__':
     unittest.main()